@@ -1,443 +1,502 @@
-import json
+import contextlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import os
-from typing import Dict, List, Tuple, Optional
+import re
+import threading
+import time
+import uuid
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple, Optional
 
 # Load OpenAI API key from Streamlit secrets
 def get_openai_api_key():
     """Get OpenAI API key from Streamlit secrets"""
     return st.secrets.get("OPENAI_API_KEY", "")
 
+def get_ai_max_workers() -> int:
+    """Get the number of assessment areas analyzed in parallel from Streamlit secrets"""
+    try:
+        return max(1, int(st.secrets.get("OPENAI_MAX_CONCURRENCY", 5)))
+    except (TypeError, ValueError):
+        return 5
+
 
-import openai
-import numpy as np
-import pandas as pd
+# openai/httpx, pandas and plotly are imported where first needed (AI
+# analysis, respondent tables, Results charts) to keep cold starts fast;
+# bench_startup.py checks the startup budget.
 import streamlit as st
-import plotly.graph_objects as go
+
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from assessment_repository import AssessmentRepository
+from event_log import EventLog, apply_events
+from llm_cache import LLMCache
+from llm_json import StreamingJSONParser, analysis_response_format, load_analyses, load_analysis
+from llm_scheduler import RequestScheduler, estimate_tokens
+from report import REPORT_FORMATS, ReportCache, report_content
+from respondents import RespondentRegistry, new_respondent_id
+from response_matrix import ResponseMatrix
+from scoring import ScoreAggregator, people_area
+from shared_store import SharedAssessment, SharedAssessmentStore, VersionConflict
+from snapshot_store import SnapshotStore
+from question_bank import (
+    DATA_READINESS_QUESTIONS, INFRASTRUCTURE_QUESTIONS, AI_BUILD_QUESTIONS, LEADERSHIP_QUESTIONS,
+    PEOPLE_QUESTIONS, QUESTION_BANK_VERSION, basic_recommendations, maturity_band, survey_questions
+)
+
+if TYPE_CHECKING:
+    import openai
 
 st.set_page_config(page_title="IB Analytics AI Readiness Tool", page_icon="🧠", layout="wide")
 
-# Add custom CSS for professional styling
-st.markdown("""
-<style>
-    /* Import Google Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    /* Global Styles */
-    .main {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        font-family: 'Inter', sans-serif;
-        padding: 0;
-        margin: 0;
-    }
-    
-    /* Header Styling */
-    .main-header {
-        background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
-        padding: 1.5rem 0;
-        border-radius: 0 0 15px 15px;
-        box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-        margin-bottom: 1rem;
-    }
-    
-    .header-content {
-        text-align: center;
-        color: white;
-    }
-    
-    .header-title {
-        font-size: 2rem;
-        font-weight: 700;
-        margin-bottom: 0.25rem;
-        text-shadow: 0 2px 4px rgba(0,0,0,0.3);
-    }
-    
-    .header-subtitle {
-        font-size: 1rem;
-        font-weight: 300;
-        opacity: 0.9;
-    }
-    
-    /* Sidebar Styling */
-    .css-1d391kg {
-        background: linear-gradient(180deg, #ffffff 0%, #f8fafc 100%);
-        border-right: 3px solid #e2e8f0;
-        box-shadow: 4px 0 20px rgba(0,0,0,0.05);
-    }
-    
-    .sidebar-header {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 1rem;
-        margin: -1rem -1rem 0.5rem -1rem;
-        border-radius: 0 0 12px 12px;
-        text-align: center;
-    }
-    
-    .sidebar-title {
-        font-size: 1.2rem;
-        font-weight: 600;
-        margin: 0;
-    }
-    
-    /* Tab Styling */
-    .stTabs [data-baseweb="tab-list"] {
-        background: rgba(255,255,255,0.95);
-        border-radius: 15px;
-        padding: 0.5rem;
-        box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-        backdrop-filter: blur(10px);
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        background: transparent;
-        border-radius: 10px;
-        padding: 0.75rem 1.5rem;
-        font-weight: 500;
-        transition: all 0.3s ease;
-        margin: 0 0.25rem;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-        transform: translateY(-2px);
-    }
-    
-    .stTabs [data-baseweb="tab"]:hover {
-        background: rgba(102, 126, 234, 0.1);
-        transform: translateY(-1px);
-    }
-    
-    /* Button Styling */
-    .stButton > button {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border: none;
-        padding: 12px 24px;
-        border-radius: 12px;
-        font-weight: 600;
-        font-size: 0.95rem;
-        margin: 8px 4px;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-    
-    .stButton > button:hover {
-        background: linear-gradient(135deg, #5a6fd8 0%, #6a4190 100%);
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
-    }
-    
-    .stButton > button:active {
-        transform: translateY(0px);
-        box-shadow: 0 2px 10px rgba(102, 126, 234, 0.3);
-    }
-    
-    /* Reset Button */
-    .reset-button > button {
-        background: linear-gradient(135deg, #ff6b6b 0%, #ee5a52 100%);
-        color: white;
-        border: none;
-        padding: 12px 24px;
-        border-radius: 12px;
-        font-weight: 600;
-        font-size: 0.95rem;
-        margin: 8px 4px;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 15px rgba(255, 107, 107, 0.3);
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-    
-    .reset-button > button:hover {
-        background: linear-gradient(135deg, #ff5252 0%, #e53935 100%);
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(255, 107, 107, 0.4);
-    }
-    
-    /* Input Styling */
-    .stTextInput > div > div > input {
-        border-radius: 12px;
-        border: 2px solid #e2e8f0;
-        padding: 12px 16px;
-        font-size: 0.95rem;
-        transition: all 0.3s ease;
-        background: rgba(255,255,255,0.9);
-    }
-    
-    .stTextInput > div > div > input:focus {
-        border-color: #667eea;
-        box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-        background: white;
-    }
-    
-    .stSelectbox > div > div {
-        border-radius: 12px;
-        border: 2px solid #e2e8f0;
-        background: rgba(255,255,255,0.9);
-    }
-    
-    .stTextArea > div > div > textarea {
-        border-radius: 12px;
-        border: 2px solid #e2e8f0;
-        padding: 12px 16px;
-        font-size: 0.95rem;
-        transition: all 0.3s ease;
-        background: rgba(255,255,255,0.9);
-    }
-    
-    .stTextArea > div > div > textarea:focus {
-        border-color: #667eea;
-        box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-        background: white;
-    }
-    
-    /* Radio Button Styling */
-    .stRadio > div {
-        background: rgba(255,255,255,0.9);
-        padding: 1rem;
-        border-radius: 12px;
-        border: 2px solid #e2e8f0;
-        margin: 0.5rem 0;
-        transition: all 0.3s ease;
-    }
-    
-    .stRadio > div:hover {
-        border-color: #667eea;
-        box-shadow: 0 2px 10px rgba(102, 126, 234, 0.1);
-    }
-    
-    /* Expander Styling */
-    .streamlit-expanderHeader {
-        background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
-        border-radius: 12px;
-        border: 2px solid #e2e8f0;
-        font-weight: 600;
-        padding: 1rem;
-        transition: all 0.3s ease;
-    }
-    
-    .streamlit-expanderHeader:hover {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border-color: #667eea;
-        transform: translateY(-1px);
-        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.2);
-    }
-    
-                /* Metric Styling */
-                .metric-container {
-                    background: rgba(255,255,255,0.95);
-                    padding: 0.75rem;
-                    border-radius: 8px;
-                    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                    backdrop-filter: blur(10px);
-                    border: 1px solid rgba(255,255,255,0.2);
-                    margin: 0.25rem 0;
-                }
-    
-    /* Success/Error Messages */
-    .stSuccess {
-        background: linear-gradient(135deg, #10b981 0%, #059669 100%);
-        color: white;
-        border-radius: 12px;
-        padding: 1rem;
-        border: none;
-        box-shadow: 0 4px 15px rgba(16, 185, 129, 0.3);
-    }
-    
-    .stError {
-        background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%);
-        color: white;
-        border-radius: 12px;
-        padding: 1rem;
-        border: none;
-        box-shadow: 0 4px 15px rgba(239, 68, 68, 0.3);
-    }
-    
-    .stWarning {
-        background: linear-gradient(135deg, #f59e0b 0%, #d97706 100%);
-        color: white;
-        border-radius: 12px;
-        padding: 1rem;
-        border: none;
-        box-shadow: 0 4px 15px rgba(245, 158, 11, 0.3);
-    }
-    
-    .stInfo {
-        background: linear-gradient(135deg, #3b82f6 0%, #2563eb 100%);
-        color: white;
-        border-radius: 12px;
-        padding: 1rem;
-        border: none;
-        box-shadow: 0 4px 15px rgba(59, 130, 246, 0.3);
-    }
-    
-                /* Card Styling */
-                .assessment-card {
-                    background: rgba(255,255,255,0.95);
-                    border-radius: 12px;
-                    padding: 1rem;
-                    margin: 0.5rem 0;
-                    box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-                    border: 1px solid rgba(255,255,255,0.2);
-                    backdrop-filter: blur(10px);
-                    transition: all 0.3s ease;
-                }
-    
-    .assessment-card:hover {
-        transform: translateY(-1px);
-        box-shadow: 0 6px 25px rgba(0,0,0,0.15);
-    }
-    
-    /* Progress Indicators */
-    .progress-bar {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        height: 8px;
-        border-radius: 4px;
-        margin: 1rem 0;
-        box-shadow: 0 2px 10px rgba(102, 126, 234, 0.3);
-    }
-    
-    /* Custom Animations */
-    @keyframes fadeInUp {
-        from {
-            opacity: 0;
-            transform: translateY(20px);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-    
-    .fade-in-up {
-        animation: fadeInUp 0.6s ease-out;
-    }
-    
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    
-    /* Custom scrollbar */
-    ::-webkit-scrollbar {
-        width: 8px;
-    }
-    
-    ::-webkit-scrollbar-track {
-        background: #f1f1f1;
-        border-radius: 4px;
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        border-radius: 4px;
-    }
-    
-    ::-webkit-scrollbar-thumb:hover {
-        background: linear-gradient(135deg, #5a6fd8 0%, #6a4190 100%);
-    }
-</style>
-""", unsafe_allow_html=True)
+THEME_CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "theme.css")
+
+def minify_css(css: str) -> str:
+    """Strip comments and the whitespace CSS does not need (descendant combinators are kept)"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+@st.cache_resource
+def theme_stylesheet() -> str:
+    """The minified theme as a <style> tag, read from disk once per process"""
+    with open(THEME_CSS_PATH, encoding="utf-8") as f:
+        return f"<style>{minify_css(f.read())}</style>"
+
+# Professional styling: theme.css, minified once per process. The tag is
+# identical on every rerun, so Streamlit's message cache (see
+# minCachedMessageSize in .streamlit/config.toml) sends it to each browser
+# once and then only a reference to it.
+st.markdown(theme_stylesheet(), unsafe_allow_html=True)
 
 # ---------------------- Data Persistence ----------------------
-def save_to_json():
-    """Save all session state data to JSON file"""
+ASSESSMENTS_PER_PAGE = 10
+
+# Widget keys of the Data Readiness / Infrastructure sections that a snapshot restores
+SNAPSHOT_WIDGET_KEY = re.compile(r"^(?:data_readiness|infrastructure)_(?:(?:notes_)?\d+|form_mode)$")
+
+@st.cache_resource
+def get_snapshot_store() -> SnapshotStore:
+    """Process-wide store of assessment snapshots"""
+    return SnapshotStore(
+        st.secrets.get("SNAPSHOT_DIR", "snapshots"),
+        debounce_seconds=float(st.secrets.get("SNAPSHOT_DEBOUNCE_SECONDS", 30))
+    )
+
+@st.cache_resource
+def get_assessment_repository() -> AssessmentRepository:
+    """Process-wide SQLite index of the saved snapshots"""
+    store = get_snapshot_store()
+    repository = AssessmentRepository(os.path.join(store.directory, "index.sqlite3"))
+    repository.sync(store)
+    return repository
+
+@st.cache_resource
+def get_event_log() -> EventLog:
+    """Process-wide journal of answer edits made since each assessment's last snapshot"""
+    return EventLog(os.path.join(get_snapshot_store().directory, "events.sqlite3"))
+
+def current_snapshot_name() -> str:
+    """Name the current assessment is saved and journaled under"""
+    if "snapshot_name" not in st.session_state:
+        # The random suffix keeps sessions started in the same second apart
+        st.session_state.snapshot_name = f"ai_readiness_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+    return st.session_state.snapshot_name
+
+def has_snapshot() -> bool:
+    """Whether the current assessment has a snapshot on disk (written or loaded by this session)"""
+    return "snapshot_saved_at" in st.session_state
+
+def log_edit(kind: str, target: str, value, question_id: Optional[str] = None):
+    """Journal one rating / notes edit; it is folded into the next snapshot.
+
+    Edits rerun only their tab's fragment, so the end-of-script autosave may
+    not run for a while: the snapshot / compaction check happens here too.
+    Joined sessions journal nothing, but save shared respondent changes.
+    """
+    try:
+        if not is_shared_guest():
+            if not has_snapshot():
+                # Events can only be replayed (and are only compacted) once a snapshot exists
+                save_to_json(force=True)
+            get_event_log().append(current_snapshot_name(), kind, target, value, question_id)
+            st.session_state.pending_events = st.session_state.get("pending_events", 0) + 1
+        if snapshot_due():
+            save_to_json(force=True)
+    except OSError as e:
+        mark_snapshot_due()
+        st.toast(f"Autosave failed: {e}")
+
+def mark_snapshot_due():
+    """Request a snapshot at the end of this run, for changes the journal does not record"""
+    st.session_state.snapshot_due = True
+
+def respondents_changed():
+    """Record a respondent change; call under assessment_lock().
+
+    A shared assessment counts its changes, so they get saved by whichever
+    session runs next, not only by the session that shared it.
+    """
+    shared = shared_assessment()
+    if shared is not None:
+        shared.changed()
+    mark_snapshot_due()
+
+def snapshot_due() -> bool:
+    """Whether the end-of-run autosave should write a snapshot and compact the journal"""
+    shared = shared_assessment()
+    if is_shared_guest():
+        # A joined session only saves the shared respondents, on top of the sharing session's snapshot
+        return shared.unsaved and shared.owner_snapshot is not None
+    if shared is not None and shared.unsaved:
+        return True
+    if st.session_state.get("snapshot_due"):
+        return True
+    pending = st.session_state.get("pending_events", 0)
+    if pending >= int(st.secrets.get("SNAPSHOT_COMPACT_EVENTS", 200)):
+        return True
+    elapsed = time.monotonic() - st.session_state.get("snapshot_saved_at", 0.0)
+    return pending > 0 and elapsed >= get_snapshot_store().debounce_seconds
+
+def assessment_snapshot() -> Dict:
+    """Everything needed to save and later reopen the current assessment"""
+    onboarding = dict(st.session_state.get("onboarding", {}))
+    if "onboarding_notes" in st.session_state:
+        onboarding["onboarding_notes"] = st.session_state["onboarding_notes"]
     data = {
         "timestamp": datetime.now().isoformat(),
-        "onboarding": st.session_state.get("onboarding", {}),
+        "question_bank_version": QUESTION_BANK_VERSION,
+        "onboarding": onboarding,
         "data_readiness": st.session_state.get("data_readiness_saved", []),
         "infrastructure": st.session_state.get("infrastructure_saved", []),
-        "people": st.session_state.get("people_saved", []),
-        "leadership": st.session_state.get("leadership_saved", []),
         "comments": {}
     }
-    
-    # Calculate and store separate AI Users and AI Builders scores
-    people_surveys = st.session_state.get("people_saved", [])
-    ai_use_scores = []
-    ai_build_scores = []
-    
-    for survey in people_surveys:
-        if survey.get('scores'):
-            if survey['type'] == "AI Use (End Users)":
-                ai_use_scores.extend(survey['scores'])
-            else:  # AI Build
-                ai_build_scores.extend(survey['scores'])
-    
-    data["ai_users_score"] = np.mean(ai_use_scores) if ai_use_scores else 0.0
-    data["ai_builders_score"] = np.mean(ai_build_scores) if ai_build_scores else 0.0
-    data["ai_users_count"] = len(ai_use_scores)
-    data["ai_builders_count"] = len(ai_build_scores)
+    data.update(respondent_snapshot(
+        st.session_state.people_registry, st.session_state.leadership_registry, results_aggregator()
+    ))
     
     # Collect all comments
     for key, value in st.session_state.items():
         if isinstance(key, str) and key.endswith("_notes") and isinstance(value, str) and value.strip():
             data["comments"][key] = value.strip()
     
-    # Save to file
-    filename = f"ai_readiness_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Unsaved ratings and notes, so a reopened assessment renders exactly as it was left
+    data["widgets"] = {
+        key: value for key, value in st.session_state.items()
+        if isinstance(key, str) and SNAPSHOT_WIDGET_KEY.match(key)
+    }
+    for prefix in ("people", "leadership"):
+        data["widgets"][f"{prefix}_drafts"] = st.session_state.get(f"{prefix}_drafts", {})
     
-    return filename
+    return data
 
-def load_from_json(filename):
-    """Load data from JSON file"""
+def respondent_snapshot(people: RespondentRegistry, leadership: RespondentRegistry, aggregator: ScoreAggregator) -> Dict:
+    """Snapshot fields that depend on the (possibly shared) respondents; ``aggregator`` has every area"""
+    # Store separate AI Users and AI Builders scores from the running aggregates
+    ai_users = aggregator.stats("People - AI Users")
+    ai_builders = aggregator.stats("People - AI Builders")
+    return {
+        "people": people.to_list(),
+        "leadership": leadership.to_list(),
+        "ai_users_score": ai_users.mean,
+        "ai_builders_score": ai_builders.mean,
+        "ai_users_count": ai_users.count,
+        "ai_builders_count": ai_builders.count,
+        "overall_score": aggregator.overall()
+    }
+
+def shared_snapshot(shared: SharedAssessment) -> Dict:
+    """The sharing session's last snapshot with the shared respondents' current answers; call under shared.lock"""
+    data = dict(shared.owner_snapshot)
+    sections = ScoreAggregator.from_assessment(data["data_readiness"], data["infrastructure"], [], [])
+    data["timestamp"] = datetime.now().isoformat()
+    data.update(respondent_snapshot(
+        shared.people, shared.leadership, ScoreAggregator.combined(sections, shared.respondent_aggregator)
+    ))
+    return data
+
+def has_assessment_data() -> bool:
+    """Whether the session holds anything worth autosaving"""
+    return bool(
+        st.session_state.onboarding.get("Company Name")
+        or st.session_state.data_readiness_saved
+        or st.session_state.infrastructure_saved
+        or st.session_state.people_registry
+        or st.session_state.leadership_registry
+    )
+
+def save_to_json(force: bool = False) -> Optional[str]:
+    """Snapshot the session to disk and compact its edit journal.
+
+    Returns the path, or None when the write was skipped: unforced saves
+    are debounced, and a snapshot identical to the last one is not rewritten.
+    A session that joined a shared assessment saves the shared respondents
+    on top of the sharing session's last snapshot. Saves of a shared
+    assessment hold its lock, so they reach the disk in order.
+    """
+    shared = shared_assessment()
+    with assessment_lock():
+        if is_shared_guest():
+            # The sharing session's journal is left alone: its event_seq is kept as is
+            name, data = shared.snapshot_name, shared_snapshot(shared)
+        else:
+            name, data = current_snapshot_name(), assessment_snapshot()
+            data["event_seq"] = get_event_log().last_seq(name)
+        path = get_snapshot_store().save(name, data, force=force)
+        if path:
+            get_assessment_repository().upsert_snapshot(name, data)
+        if shared is not None and (path or force):
+            shared.saved_version = shared.version
+            if not is_shared_guest():
+                shared.snapshot_name, shared.owner_snapshot = name, data
+    if (path or force) and not is_shared_guest():
+        # The snapshot on disk now includes every journaled edit up to event_seq
+        get_event_log().compact(name, data["event_seq"])
+        st.session_state.pending_events = 0
+        st.session_state.snapshot_due = False
+        st.session_state.snapshot_saved_at = time.monotonic()
+    return path
+
+def rebuild_score_aggregator():
+    """Recompute the running score aggregates from the saved answers and surveys.
+
+    Section (Data Readiness / Infrastructure) and respondent (People /
+    Leadership) aggregates are kept apart, as only the latter are shared
+    with other sessions.
+    """
+    st.session_state.score_aggregator = ScoreAggregator.from_assessment(
+        st.session_state.get("data_readiness_saved", []),
+        st.session_state.get("infrastructure_saved", []),
+        [], []
+    )
+    st.session_state.respondent_aggregator = ScoreAggregator.from_assessment(
+        [], [],
+        st.session_state.people_registry.saved(),
+        st.session_state.leadership_registry.saved()
+    )
+
+def results_aggregator() -> ScoreAggregator:
+    """All of this assessment's aggregates: the session's sections plus the (possibly shared) respondents"""
+    with assessment_lock():
+        return ScoreAggregator.combined(st.session_state.score_aggregator, st.session_state.respondent_aggregator)
+
+def rebuild_response_matrices():
+    """Rebuild the columnar per-question rating stores from the saved surveys"""
+    groups = {survey_type: [] for survey_type in PEOPLE_QUESTIONS}
+    groups["Leadership & Strategy"] = st.session_state.leadership_registry.saved()
+    for survey in st.session_state.people_registry.saved():
+        groups.setdefault(survey["type"], []).append(survey)
+    # Updated in place: the dict may be shared with other sessions
+    matrices = st.session_state.setdefault("response_matrices", {})
+    matrices.clear()
+    for group, surveys in groups.items():
+        question_ids = [question.id for question in survey_questions(group)]
+        matrices[group] = ResponseMatrix.from_surveys(question_ids, surveys)
+
+def restore_widget_state(data: Dict):
+    """Set the Data Readiness / Infrastructure widget keys and survey drafts from a snapshot"""
+    for key in [key for key in st.session_state.keys() if isinstance(key, str) and SNAPSHOT_WIDGET_KEY.match(key)]:
+        del st.session_state[key]
+    st.session_state.pop("onboarding_notes", None)
+    # Saved answers first, so snapshots without widget state still render their ratings
+    for prefix in ("data_readiness", "infrastructure"):
+        for i, item in enumerate(data.get(prefix, [])):
+            st.session_state[f"{prefix}_{i}"] = item["score"]
+            st.session_state[f"{prefix}_notes_{i}"] = item.get("notes", "")
+    for key, value in data.get("widgets", {}).items():
+        if SNAPSHOT_WIDGET_KEY.match(key) or key in ("people_drafts", "leadership_drafts"):
+            st.session_state[key] = value
+
+def load_from_json(name: str):
+    """Reopen a saved assessment snapshot"""
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Restore session state
-        if "onboarding" in data:
-            st.session_state.onboarding = data["onboarding"]
-        if "data_readiness" in data:
-            st.session_state.data_readiness_saved = data["data_readiness"]
-        if "infrastructure" in data:
-            st.session_state.infrastructure_saved = data["infrastructure"]
-        if "people" in data:
-            st.session_state.people_saved = data["people"]
-        if "leadership" in data:
-            st.session_state.leadership_saved = data["leadership"]
-        
-        st.success(f"Data loaded successfully from {filename}")
-        st.rerun()
-        
-    except Exception as e:
-        st.error(f"Error loading file: {e}")
+        data = get_snapshot_store().load(name)
+    except (OSError, ValueError) as e:
+        st.error(f"Error loading {name}: {e}")
+        return
+    
+    # Fold in the edits journaled after the snapshot (e.g. by a session that crashed)
+    events = get_event_log().events(name, data.get("event_seq", 0))
+    apply_events(data, events)
+    
+    # Restore session state
+    leave_shared_assessment()
+    st.session_state.onboarding = data.get("onboarding", {})
+    st.session_state.data_readiness_saved = data.get("data_readiness", [])
+    st.session_state.infrastructure_saved = data.get("infrastructure", [])
+    for prefix in ("people", "leadership"):
+        prune_respondent_widgets(prefix, RespondentRegistry())
+        st.session_state[f"{prefix}_registry"] = RespondentRegistry.from_list(data.get(prefix, []))
+    restore_widget_state(data)
+    rebuild_score_aggregator()
+    rebuild_response_matrices()
+    st.session_state.snapshot_name = name
+    st.session_state.pending_events = len(events)
+    st.session_state.snapshot_due = bool(events)
+    st.session_state.snapshot_saved_at = time.monotonic()
+    
+    rerun_with_message(f"Loaded {name}")
+
+# ---------------------- Shared Assessments ----------------------
+@st.cache_resource
+def get_shared_store() -> SharedAssessmentStore:
+    """Process-wide registry of assessments shared between sessions"""
+    return SharedAssessmentStore()
+
+def shared_assessment() -> Optional[SharedAssessment]:
+    return st.session_state.get("shared_assessment")
+
+def is_shared_guest() -> bool:
+    """Whether this session joined an assessment another session shared (and persists)"""
+    return shared_assessment() is not None and not st.session_state.get("shared_owner", False)
+
+def assessment_lock():
+    """Lock guarding respondent and aggregate changes; a no-op unless the assessment is shared"""
+    shared = shared_assessment()
+    return shared.lock if shared is not None else contextlib.nullcontext()
+
+def bind_shared_assessment(shared: SharedAssessment, owner: bool):
+    """Point this session's respondent and aggregate state at a shared assessment"""
+    st.session_state.shared_assessment = shared
+    st.session_state.shared_owner = owner
+    st.session_state.people_registry = shared.people
+    st.session_state.leadership_registry = shared.leadership
+    st.session_state.respondent_aggregator = shared.respondent_aggregator
+    st.session_state.response_matrices = shared.response_matrices
+
+def share_assessment():
+    """Publish this session's respondents and their aggregates under a random share code"""
+    shared = get_shared_store().share(SharedAssessment(
+        st.session_state.people_registry,
+        st.session_state.leadership_registry,
+        st.session_state.respondent_aggregator,
+        st.session_state.response_matrices
+    ))
+    bind_shared_assessment(shared, owner=True)
+    # Joined sessions save their respondent changes on top of this snapshot
+    save_to_json(force=True)
+
+def join_assessment(code: str) -> bool:
+    """Join an assessment shared by another session; False if no open assessment has that code"""
+    shared = get_shared_store().get(code)
+    if shared is None or shared.closed:
+        return False
+    for prefix in ("people", "leadership"):
+        prune_respondent_widgets(prefix, RespondentRegistry())
+    bind_shared_assessment(shared, owner=False)
+    return True
+
+def leave_shared_assessment():
+    """Detach this session from its shared assessment, keeping a private copy.
+
+    When the sharing session leaves, the assessment is closed and every
+    joined session detaches on its next run.
+    """
+    shared = st.session_state.pop("shared_assessment", None)
+    owner = st.session_state.pop("shared_owner", False)
+    if shared is None:
+        return
+    if owner:
+        get_shared_store().close(shared)
+        mark_snapshot_due()
+    with shared.lock:
+        st.session_state.people_registry = RespondentRegistry.from_list(shared.people.to_list())
+        st.session_state.leadership_registry = RespondentRegistry.from_list(shared.leadership.to_list())
+    st.session_state.response_matrices = {}
+    rebuild_score_aggregator()
+    rebuild_response_matrices()
 
 # ---------------------- OpenAI Integration ----------------------
+OPENAI_MODEL = "gpt-4o"
+OPENAI_TEMPERATURE = 0.7
+OPENAI_MAX_TOKENS = 1000
+OPENAI_JSON_ATTEMPTS = 2  # Requests per analysis when the response cannot be repaired locally
+
+@st.cache_resource
+def get_llm_cache() -> LLMCache:
+    """Process-wide on-disk cache of LLM analysis results"""
+    return LLMCache(
+        st.secrets.get("OPENAI_CACHE_PATH", ".cache/llm_cache.sqlite3"),
+        ttl_seconds=float(st.secrets.get("OPENAI_CACHE_TTL_HOURS", 168)) * 3600,
+        max_bytes=int(float(st.secrets.get("OPENAI_CACHE_MAX_MB", 50)) * 1024 * 1024)
+    )
+
+@st.cache_resource
+def get_openai_client(api_key: str) -> "openai.OpenAI":
+    """Process-wide OpenAI client whose connection pool is kept alive across reruns and sessions"""
+    import httpx
+    import openai
+
+    http_client = openai.DefaultHttpxClient(
+        limits=httpx.Limits(
+            max_connections=int(st.secrets.get("OPENAI_MAX_CONNECTIONS", 20)),
+            max_keepalive_connections=int(st.secrets.get("OPENAI_MAX_KEEPALIVE_CONNECTIONS", 10)),
+            keepalive_expiry=float(st.secrets.get("OPENAI_KEEPALIVE_EXPIRY", 120))
+        ),
+        timeout=httpx.Timeout(
+            float(st.secrets.get("OPENAI_TIMEOUT", 60)),
+            connect=float(st.secrets.get("OPENAI_CONNECT_TIMEOUT", 5))
+        )
+    )
+    # Retries are handled by the shared RequestScheduler
+    return openai.OpenAI(api_key=api_key, http_client=http_client, max_retries=0)
+
+@st.cache_resource
+def get_request_scheduler() -> RequestScheduler:
+    """Process-wide scheduler shared by every session's OpenAI requests"""
+    return RequestScheduler(
+        requests_per_minute=int(st.secrets.get("OPENAI_RPM_LIMIT", 500)),
+        tokens_per_minute=int(st.secrets.get("OPENAI_TPM_LIMIT", 30000)),
+        max_concurrency=int(st.secrets.get("OPENAI_MAX_INFLIGHT", 8)),
+        max_retries=int(st.secrets.get("OPENAI_MAX_RETRIES", 5))
+    )
+
 def setup_openai():
-    """Setup OpenAI client with API key from Streamlit secrets"""
+    """Setup OpenAI client with API key from Streamlit secrets
+
+    The client is built once per API key and reused; no network call is made.
+    """
     api_key = get_openai_api_key()
     if not api_key or api_key == "your_openai_api_key_here":
         return None, "API key not found or placeholder detected"
     
     try:
-        # Test client creation
-        client = openai.OpenAI(api_key=api_key)
+        client = get_openai_client(api_key)
         return client, "API key valid"
     except Exception as e:
         return None, f"API key error: {e}"
 
-def analyze_comments_with_ai(comments: str, area: str, score: float, context: str = "") -> Dict:
-    """Analyze user comments using OpenAI GPT-4o"""
-    client, status = setup_openai()
-    if not client:
-        return {
-            "recommendations": [f"Focus on improving {area} based on current score of {score:.1f}/5.0"],
-            "use_cases": [f"Implement {area} best practices"],
-            "next_steps": [f"Review {area} processes", f"Train team on {area}", f"Update {area} documentation"],
-            "priority": "Medium"
-        }
-    
-    try:
-        prompt = f"""
+def fallback_analysis(area: str, score: float) -> Dict:
+    """Generic analysis used when the OpenAI request fails"""
+    return {
+        "recommendations": [f"Focus on {area} improvement based on score {score:.1f}/5.0"],
+        "use_cases": [f"Standardize {area} processes"],
+        "next_steps": [f"Review {area} current state", f"Identify gaps", f"Create action plan", f"Implement improvements", f"Measure results"],
+        "priority": "Medium"
+    }
+
+def record_token_usage(usage: Optional[Dict], response_usage) -> None:
+    """Add the token counts of one completion to a usage accumulator dict"""
+    if usage is None or response_usage is None:
+        return
+    usage["requests"] = usage.get("requests", 0) + 1
+    usage["input_tokens"] = usage.get("input_tokens", 0) + (response_usage.prompt_tokens or 0)
+    usage["output_tokens"] = usage.get("output_tokens", 0) + (response_usage.completion_tokens or 0)
+
+def analyze_comments_with_ai(comments: str, area: str, score: float, context: str = "", client=None, use_cache: bool = True,
+                             stream: bool = False, on_update: Optional[Callable[[Dict], None]] = None,
+                             usage: Optional[Dict] = None) -> Dict:
+    """Analyze user comments using OpenAI GPT-4o
+
+    Results are cached on disk by prompt, model and temperature; pass
+    use_cache=False to force a fresh completion (the cache is still refreshed).
+    With stream=True, on_update is called with the partially parsed analysis
+    each time more of the response arrives. Token counts of the request are
+    added to the optional usage dict.
+    """
+    prompt = f"""
         Analyze the following feedback for an AI readiness assessment in the area of {area}.
         
         Current Score: {score}/5.0
@@ -460,34 +519,190 @@ def analyze_comments_with_ai(comments: str, area: str, score: float, context: st
         
         Focus on practical, implementable advice for improving AI readiness. Use knowledge from what market is currently adopting
         """
+    
+    cache = get_llm_cache()
+    cache_key = cache.make_key(prompt, OPENAI_MODEL, OPENAI_TEMPERATURE)
+    if use_cache:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+    
+    if client is None:
+        client, status = setup_openai()
+    if not client:
+        return {
+            "recommendations": [f"Focus on improving {area} based on current score of {score:.1f}/5.0"],
+            "use_cases": [f"Implement {area} best practices"],
+            "next_steps": [f"Review {area} processes", f"Train team on {area}", f"Update {area} documentation"],
+            "priority": "Medium"
+        }
+    
+    try:
+        def read_stream(response):
+            """Read a streamed completion, showing recommendations progressively while the JSON streams in.
+
+            Returns the text and the finish reason, and the usage the stream reported
+            for the scheduler to settle its token estimate.
+            """
+            parser = StreamingJSONParser()
+            shown = None
+            finish_reason = None
+            stream_usage = None
+            for chunk in response:
+                record_token_usage(usage, chunk.usage)
+                stream_usage = chunk.usage or stream_usage
+                if chunk.choices and chunk.choices[0].finish_reason:
+                    finish_reason = chunk.choices[0].finish_reason
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                partial = parser.feed(chunk.choices[0].delta.content)
+                if on_update and isinstance(partial, dict) and partial != shown:
+                    shown = partial
+                    on_update(partial)
+            return (parser.text, finish_reason), stream_usage
         
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-            max_tokens=1000
-        )
-        
-        # Parse JSON response
-        try:
-            result = json.loads(response.choices[0].message.content)
-            return result
-        except json.JSONDecodeError:
-            # Fallback if JSON parsing fails
-            return {
-                "recommendations": [f"Improve {area} processes and training"],
-                "use_cases": [f"Implement {area} best practices"],
-                "next_steps": [f"Assess current {area} state", f"Develop {area} roadmap", f"Train team", f"Implement changes", f"Monitor progress"],
-                "priority": "Medium"
-            }
+        # Structured output keeps the model on the schema; anything still malformed
+        # is repaired locally and only re-requested if local repair fails
+        for attempt in range(OPENAI_JSON_ATTEMPTS):
+            # A stream is read inside the scheduler, so it holds its concurrency slot
+            # until the last chunk and is retried if it breaks part-way
+            response = get_request_scheduler().call(
+                client.chat.completions.create,
+                estimated_tokens=estimate_tokens(prompt, OPENAI_MAX_TOKENS),
+                consume=read_stream if stream else None,
+                model=OPENAI_MODEL,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=OPENAI_TEMPERATURE,
+                max_tokens=OPENAI_MAX_TOKENS,
+                response_format=analysis_response_format(),
+                **({"stream": True, "stream_options": {"include_usage": True}} if stream else {})
+            )
             
-    except Exception as e:
+            if stream:
+                content, finish_reason = response
+            else:
+                record_token_usage(usage, response.usage)
+                content, finish_reason = response.choices[0].message.content, response.choices[0].finish_reason
+            
+            result = load_analysis(content)
+            if result is not None:
+                # Output cut off by max_tokens is only good for this request, not for the cache
+                if finish_reason != "length":
+                    cache.set(cache_key, result)
+                return result
+        
+        # Fallback if the response could not be parsed or repaired
         return {
-            "recommendations": [f"Focus on {area} improvement based on score {score:.1f}/5.0"],
-            "use_cases": [f"Standardize {area} processes"],
-            "next_steps": [f"Review {area} current state", f"Identify gaps", f"Create action plan", f"Implement improvements", f"Measure results"],
+            "recommendations": [f"Improve {area} processes and training"],
+            "use_cases": [f"Implement {area} best practices"],
+            "next_steps": [f"Assess current {area} state", f"Develop {area} roadmap", f"Train team", f"Implement changes", f"Monitor progress"],
             "priority": "Medium"
         }
+            
+    except Exception as e:
+        return fallback_analysis(area, score)
+
+def analyze_areas_concurrently(jobs: List[Dict], max_workers: Optional[int] = None):
+    """Analyze several assessment areas in a bounded thread pool.
+
+    Each job is a dict with "area", "score", "comments" and "context" keys;
+    the token usage of its request is stored under the job's "usage" key.
+    Yields (area, analysis) pairs in completion order, so a slow area does not
+    delay the others and a failed area yields its fallback analysis.
+    """
+    if not jobs:
+        return
+    client, status = setup_openai()
+    workers = min(max_workers or get_ai_max_workers(), len(jobs))
+    # Worker threads share this run's context so st.secrets / st.cache_resource work inside them
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(
+        max_workers=workers,
+        thread_name_prefix="ai_analysis",
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx)
+    ) as pool:
+        futures = {
+            pool.submit(
+                analyze_comments_with_ai, job["comments"], job["area"], job["score"], job["context"], client,
+                usage=job.setdefault("usage", {})
+            ): job
+            for job in jobs
+        }
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                ai_analysis = future.result()
+            except Exception:
+                ai_analysis = fallback_analysis(job["area"], job["score"])
+            yield job["area"], ai_analysis
+
+def analyze_all_areas_with_ai(jobs: List[Dict], client=None, use_cache: bool = True, usage: Optional[Dict] = None) -> Dict[str, Dict]:
+    """Analyze every assessment area with a single OpenAI request
+
+    Takes the same jobs as analyze_areas_concurrently() and returns the
+    analyses keyed by area. The shared instructions are sent once instead of
+    once per area; areas missing from the response get the fallback analysis.
+    """
+    area_lines = "\n".join(
+        f"        - {job['area']}: Current Score {job['score']}/5.0. User Comments: {job['comments']}. Additional Context: {job['context']}"
+        for job in jobs
+    )
+    prompt = f"""
+        Analyze the following feedback for an AI readiness assessment covering these areas:
+        
+{area_lines}
+        
+        For each area, please provide:
+        1. 3-5 specific, actionable recommendations
+        2. 2-3 concrete use cases or examples
+        3. 5 prioritized next steps to achieve AI readiness maturity
+        4. Priority level (High/Medium/Low) based on the score and comments
+        
+        Format your response as a JSON object keyed by the exact area names above, where each value has these exact keys:
+        {{
+            "recommendations": ["rec1", "rec2", "rec3"],
+            "use_cases": ["use case 1", "use case 2"],
+            "next_steps": ["step 1", "step 2", "step 3", "step 4", "step 5"],
+            "priority": "High/Medium/Low"
+        }}
+        
+        Focus on practical, implementable advice for improving AI readiness. Use knowledge from what market is currently adopting
+        """
+    
+    areas = [job["area"] for job in jobs]
+    cache = get_llm_cache()
+    cache_key = cache.make_key(prompt, OPENAI_MODEL, OPENAI_TEMPERATURE)
+    result = (cache.get(cache_key) if use_cache else None) or {}
+    
+    if len(result) < len(areas):
+        if client is None:
+            client, status = setup_openai()
+        try:
+            for attempt in range(OPENAI_JSON_ATTEMPTS if client else 0):
+                response = get_request_scheduler().call(
+                    client.chat.completions.create,
+                    estimated_tokens=estimate_tokens(prompt, OPENAI_MAX_TOKENS * len(jobs)),
+                    model=OPENAI_MODEL,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=OPENAI_TEMPERATURE,
+                    max_tokens=OPENAI_MAX_TOKENS * len(jobs),
+                    response_format=analysis_response_format(areas)
+                )
+                record_token_usage(usage, response.usage)
+                # Keep every area that parsed; re-request only if some could not be repaired
+                result = {**load_analyses(response.choices[0].message.content, areas), **result}
+                if len(result) == len(areas):
+                    # Output cut off by max_tokens is only good for this request, not for the cache
+                    if response.choices[0].finish_reason != "length":
+                        cache.set(cache_key, result)
+                    break
+        except Exception:
+            pass
+    
+    return {
+        area: result[area] if area in result else fallback_analysis(area, job["score"])
+        for area, job in zip(areas, jobs)
+    }
 
 def get_section_comments(section: str) -> str:
     """Extract all relevant comments from session state for a given section"""
@@ -502,201 +717,33 @@ def get_section_comments(section: str) -> str:
             if item.get("notes"):
                 comments.append(f"Question {i+1}: {item['notes']}")
     elif section in ["People - AI Users", "People - AI Builders"]:
-        # Check both saved and current people surveys
-        for survey in st.session_state.get("people_saved", []):
-            if survey.get("notes"):
-                comments.append(f"{survey['name']} ({survey['type']}): {survey['notes']}")
-        for survey in st.session_state.get("people_surveys", []):
-            if survey.get("notes"):
+        for survey in st.session_state.people_registry:
+            if survey.get("notes") and people_area(survey["type"]) == section:
                 comments.append(f"{survey['name']} ({survey['type']}): {survey['notes']}")
     elif section == "Leadership & Strategy":
-        # Check both saved and current leadership surveys
-        for survey in st.session_state.get("leadership_saved", []):
-            if survey.get("notes"):
-                comments.append(f"{survey['name']} ({survey['role']}): {survey['notes']}")
-        for survey in st.session_state.get("leadership_surveys", []):
+        for survey in st.session_state.leadership_registry:
             if survey.get("notes"):
                 comments.append(f"{survey['name']} ({survey['role']}): {survey['notes']}")
     
     return " | ".join(comments) if comments else ""
 
-def generate_basic_recommendations(area: str, score: float) -> List[str]:
-    """Generate basic recommendations based on score when AI analysis is not available"""
-    if area == "Data Readiness":
-        if score < 2:
-            return [
-                "Create enterprise data inventory, digitize critical records",
-                "Centralize storage (DW/lake), and assign data stewards",
-                "Establish basic data governance framework",
-                "Implement data quality monitoring",
-                "Set up backup and recovery procedures"
-            ]
-        elif score < 3:
-            return [
-                "Automate ETL/ELT, define DQ rules & monitoring",
-                "Stand up catalog + lineage, and enforce access controls",
-                "Implement data validation and testing",
-                "Establish data retention policies",
-                "Create data documentation standards"
-            ]
-        elif score < 4:
-            return [
-                "Implement semantic layer, APIs/streaming",
-                "Privacy automation, and dataset feedback loops for AI",
-                "Advanced data quality and monitoring",
-                "Implement data versioning and lineage",
-                "Establish data governance committees"
-            ]
-        else:
-            return [
-                "Optimize cost/performance, enable vector/RAG ingestion at scale",
-                "Formalize observability & lifecycle management",
-                "Advanced analytics and AI-ready data pipelines",
-                "Implement data mesh architecture",
-                "Continuous data governance optimization"
-            ]
-    elif area == "Infrastructure":
-        if score < 2:
-            return [
-                "Baseline cloud readiness, provision secure environments",
-                "Pilot GPU/compute with guardrails",
-                "Establish basic security controls",
-                "Set up monitoring and alerting",
-                "Create disaster recovery plan"
-            ]
-        elif score < 3:
-            return [
-                "Standardize MLOps/LLMOps pipelines, registry, CI/CD",
-                "Implement observability and monitoring",
-                "Establish security best practices",
-                "Create infrastructure as code templates",
-                "Set up cost monitoring and controls"
-            ]
-        elif score < 4:
-            return [
-                "Scale infra with autoscaling, caching, cost tracking",
-                "Enforce SRE practices and advanced monitoring",
-                "Implement advanced security controls",
-                "Optimize performance and reliability",
-                "Establish infrastructure governance"
-            ]
-        else:
-            return [
-                "Optimize footprints, multi-cloud resilience",
-                "Advanced eval/monitoring stacks",
-                "Implement AI-specific infrastructure patterns",
-                "Continuous optimization and automation",
-                "Advanced security and compliance features"
-            ]
-    elif area == "People — AI Use":
-        if score < 2:
-            return [
-                "Launch AI literacy 101, curated tool list",
-                "Safe-use policy; run hands-on clinics",
-                "Basic AI training for all employees",
-                "Create AI usage guidelines",
-                "Establish AI champions program"
-            ]
-        elif score < 3:
-            return [
-                "Role-based training, internal champions",
-                "Usage playbooks; measure adoption KPIs",
-                "Advanced AI tool training",
-                "Create AI best practices repository",
-                "Implement AI usage tracking"
-            ]
-        elif score < 4:
-            return [
-                "Advanced prompts/cookbooks per function",
-                "Shared best-practice hub, and office hours",
-                "Specialized AI training by department",
-                "AI productivity measurement",
-                "Cross-functional AI collaboration"
-            ]
-        else:
-            return [
-                "Continuous enablement, certification",
-                "Cross-team CoPs driving measurable productivity gains",
-                "Advanced AI strategy and planning",
-                "AI innovation and experimentation",
-                "AI leadership development"
-            ]
-    elif area == "People — AI Build":
-        if score < 2:
-            return [
-                "Upskill builders on Python, APIs, data basics",
-                "Pair with mentors; start small POCs",
-                "Basic AI/ML training programs",
-                "Create learning paths and resources",
-                "Establish AI development community"
-            ]
-        elif score < 3:
-            return [
-                "Train on RAG, evals, vector DBs, and secure patterns",
-                "Create shared templates and frameworks",
-                "Intermediate AI development training",
-                "Implement development best practices",
-                "Create AI development standards"
-            ]
-        elif score < 4:
-            return [
-                "Formal SDLC for AI with guardrails",
-                "Model registry, and evaluation frameworks",
-                "Advanced AI development training",
-                "Implement AI development governance",
-                "Create AI development platform"
-            ]
-        else:
-            return [
-                "Advanced architectures, red-teaming, AB tests",
-                "Platform productization and optimization",
-                "AI development innovation and research",
-                "Advanced AI development methodologies",
-                "AI development leadership and strategy"
-            ]
-    elif area == "Leadership & Strategy":
-        if score < 2:
-            return [
-                "Define AI north star, appoint accountable leader",
-                "Allocate seed budget for pilots",
-                "Create basic AI strategy document",
-                "Establish AI governance framework",
-                "Identify initial AI use cases"
-            ]
-        elif score < 3:
-            return [
-                "Create 12–18m roadmap tied to business OKRs",
-                "Institute steering committee & KPI tracking",
-                "Develop AI investment strategy",
-                "Create AI risk management framework",
-                "Establish AI performance metrics"
-            ]
-        elif score < 4:
-            return [
-                "Scale portfolio mgmt, fund highest-ROI cases",
-                "Embed AI in BU strategies",
-                "Advanced AI governance and oversight",
-                "Implement AI value measurement",
-                "Create AI innovation programs"
-            ]
-        else:
-            return [
-                "Enterprise-wide AI operating model",
-                "Continuous value realization and governance audits",
-                "AI transformation leadership",
-                "Advanced AI strategy and planning",
-                "AI ecosystem development"
-            ]
-    else:
-        return [
-            f"Prioritize gaps by impact/effort; iterate quarterly",
-            f"Focus on high-impact, low-effort improvements",
-            f"Establish baseline measurements and tracking",
-            f"Create improvement roadmap and timeline",
-            f"Implement continuous improvement process"
-        ]
-
 # ---------------------- Helper Functions ----------------------
+@st.cache_resource
+def get_report_cache() -> ReportCache:
+    """Process-wide cache of rendered reports, keyed by assessment content"""
+    return ReportCache()
+
+def current_report_content(scores_data: List[Dict]) -> Dict:
+    """Report content for the current session's results, notes and AI analyses"""
+    onboarding = st.session_state.onboarding
+    return report_content(
+        onboarding,
+        scores_data,
+        st.session_state.get("onboarding_notes", onboarding.get("onboarding_notes", "")).strip(),
+        {row["Area"]: st.session_state[f"ai_analysis_{row['Area']}"] for row in scores_data if f"ai_analysis_{row['Area']}" in st.session_state},
+        datetime.now().isoformat()
+    )
+
 def export_csv(df, name):
     csv = df.to_csv(index=False)
     st.download_button(
@@ -706,21 +753,291 @@ def export_csv(df, name):
         mime="text/csv",
     )
 
-def summarize_text(text, max_sentences=5):
-    if not text or len(text.strip()) < 50:
-        return text
-    sentences = text.split('.')
-    return '. '.join(sentences[:max_sentences]) + ('.' if len(sentences) > max_sentences else '')
-
-def maturity_band(score):
-    if score < 2:
-        return "**Foundational** 🌱"
-    elif score < 3:
-        return "**Developing** 🔄"
-    elif score < 4:
-        return "**Advanced** 🚀"
-    else:
-        return "**Optimized** ⭐"
+def render_analysis_preview(placeholder, ai_analysis: Dict):
+    """Render a (possibly partial) AI analysis into a st.empty() placeholder"""
+    with placeholder.container():
+        if ai_analysis.get("priority"):
+            st.markdown(f"**Priority:** {ai_analysis['priority']}")
+        if ai_analysis.get("recommendations"):
+            st.markdown("**💡 Key Recommendations:**")
+            st.markdown("\n".join(f"• {rec}" for rec in ai_analysis["recommendations"]))
+        if ai_analysis.get("use_cases"):
+            st.markdown("**🧩 Use Cases:**")
+            st.markdown("\n".join(f"• {use_case}" for use_case in ai_analysis["use_cases"]))
+        if ai_analysis.get("next_steps"):
+            st.markdown("**🚀 Next Steps:**")
+            st.markdown("\n".join(f"{i}. {step}" for i, step in enumerate(ai_analysis["next_steps"], 1)))
+
+def record_widget_edit(key: str, question_id: str):
+    """on_change callback journaling a Data Readiness / Infrastructure rating or notes edit"""
+    log_edit("widget", key, st.session_state[key], question_id)
+
+def render_rating_questions(prefix: str, questions, in_form: bool = False):
+    """Render a 1-5 rating and a notes box per question, keyed {prefix}_{i} / {prefix}_notes_{i}
+
+    Outside a form every edit is journaled; a submitted form saves the section instead.
+    """
+    for i, question in enumerate(questions):
+        st.markdown(f"**{i + 1}.** {question.text}")
+        
+        # Initialize session state if not exists
+        if f"{prefix}_{i}" not in st.session_state:
+            st.session_state[f"{prefix}_{i}"] = 3
+        if f"{prefix}_notes_{i}" not in st.session_state:
+            st.session_state[f"{prefix}_notes_{i}"] = ""
+        
+        # Create radio button with current value
+        score = st.radio(
+            "Rating", 
+            [1, 2, 3, 4, 5], 
+            index=st.session_state[f"{prefix}_{i}"] - 1,
+            key=f"{prefix}_{i}",
+            on_change=None if in_form else record_widget_edit,
+            args=(f"{prefix}_{i}", question.id),
+            horizontal=True,
+            label_visibility="collapsed"
+        )
+        
+        # Create text area with current value
+        notes = st.text_area(
+            "Notes", 
+            value=st.session_state[f"{prefix}_notes_{i}"],
+            key=f"{prefix}_notes_{i}",
+            on_change=None if in_form else record_widget_edit,
+            args=(f"{prefix}_notes_{i}", question.id),
+            placeholder="Add your observations here..."
+        )
+        
+        st.divider()
+
+def save_rating_answers(prefix: str, questions, area: str):
+    """Save a section's answers into {prefix}_saved and update the area's aggregates"""
+    answers = collect_rating_answers(prefix, questions)
+    st.session_state[f"{prefix}_saved"] = answers
+    st.session_state.score_aggregator.replace(area, [answer["score"] for answer in answers])
+    mark_snapshot_due()
+
+def collect_rating_answers(prefix: str, questions) -> List[Dict]:
+    """Build the saved answer list from the rating / notes widget state"""
+    answers = []
+    for i, question in enumerate(questions):
+        answers.append({
+            "id": question.id,
+            "question": question.text,
+            "score": st.session_state.get(f"{prefix}_{i}", 3),
+            "notes": st.session_state.get(f"{prefix}_notes_{i}", "")
+        })
+    return answers
+
+def render_rating_section(prefix: str, questions, section: str):
+    """Render a section's questions, optionally inside one st.form
+
+    In form mode the answers stay in the browser until the form is submitted,
+    which saves them straight into {prefix}_saved in one round trip.
+    """
+    form_mode = st.toggle(
+        "📝 Form mode (submit all answers at once)",
+        key=f"{prefix}_form_mode",
+        help="Ratings and notes are sent to the server only when the form is submitted"
+    )
+    if not form_mode:
+        render_rating_questions(prefix, questions)
+        return
+    
+    with st.form(f"{prefix}_form"):
+        render_rating_questions(prefix, questions, in_form=True)
+        if st.form_submit_button(f"💾 Submit {section}", use_container_width=True):
+            save_rating_answers(prefix, questions, section)
+            rerun_with_message(f"✅ {section} answers submitted and saved!")
+
+def survey_area(group: str) -> str:
+    """Results area a survey group's ratings count towards"""
+    return group if group == "Leadership & Strategy" else people_area(group)
+
+def save_survey(survey: Dict, group: str, scores: List[int], expected_version: Optional[int] = None):
+    """Record a survey's ratings, replacing whatever it contributed before.
+
+    With ``expected_version`` the save fails with VersionConflict if the
+    survey was saved elsewhere since that version was read.
+    """
+    with assessment_lock():
+        if expected_version is not None:
+            SharedAssessment.check_version(survey, expected_version)
+        aggregator = st.session_state.respondent_aggregator
+        aggregator.remove(survey_area(group), survey["scores"] if survey.get("saved") else [])
+        aggregator.add(survey_area(group), scores)
+        st.session_state.response_matrices[group].upsert(survey["id"], scores, survey["name"], survey["role"])
+        survey["scores"] = scores
+        survey["saved"] = True
+        survey["version"] = survey.get("version", 0) + 1
+        respondents_changed()
+
+def respondent_version(prefix: str, survey: Dict) -> int:
+    """Version of a respondent that this session's edits are based on (read when first opened)"""
+    return st.session_state.setdefault(f"{prefix}_versions", {}).setdefault(survey["id"], survey.get("version", 0))
+
+def save_respondent(prefix: str, survey: Dict, group: str, scores: List[int]) -> bool:
+    """Save a respondent edited in this session; False if another session saved it first.
+
+    On a conflict this session's draft is dropped, so the other session's
+    answers are shown and can be edited and saved again.
+    """
+    versions = st.session_state.setdefault(f"{prefix}_versions", {})
+    try:
+        save_survey(survey, group, scores, expected_version=respondent_version(prefix, survey))
+    except VersionConflict:
+        st.session_state.get(f"{prefix}_drafts", {}).pop(survey["id"], None)
+        for key in [key for key in st.session_state.keys() if isinstance(key, str) and key.startswith(f"{prefix}_{survey['id']}_")]:
+            del st.session_state[key]
+        versions[survey["id"]] = survey.get("version", 0)
+        return False
+    versions[survey["id"]] = survey["version"]
+    return True
+
+def remove_survey(registry: RespondentRegistry, survey: Dict, group: str):
+    """Drop a respondent and everything its ratings contributed"""
+    with assessment_lock():
+        if registry.get(survey["id"]) is None:
+            return
+        if survey.get("saved"):
+            st.session_state.respondent_aggregator.remove(survey_area(group), survey["scores"])
+        st.session_state.response_matrices[group].remove(survey["id"])
+        registry.remove(survey["id"])
+        respondents_changed()
+
+def rating_draft(prefix: str, survey: Dict, question_count: int) -> List[int]:
+    """A respondent's current (possibly unsaved) ratings.
+
+    Kept in {prefix}_drafts rather than only in widget state, which
+    Streamlit discards whenever a rerun does not render the widget.
+    """
+    drafts = st.session_state.setdefault(f"{prefix}_drafts", {})
+    if survey["id"] not in drafts:
+        drafts[survey["id"]] = list(survey["scores"]) if survey.get("scores") else [3] * question_count
+    return drafts[survey["id"]]
+
+def record_rating(prefix: str, respondent_id: str, draft: List[int], index: int, question_id: str):
+    """on_change callback copying a rating widget's value into its draft and the journal"""
+    draft[index] = st.session_state[f"{prefix}_{respondent_id}_{index}"]
+    log_edit("rating", f"{prefix}:{respondent_id}", {"index": index, "score": draft[index]}, question_id)
+
+def record_respondent_notes(prefix: str, respondent_id: str):
+    """on_change callback storing a respondent's notes in its (possibly shared) survey and the journal.
+
+    Only an edit updates the survey, so a session showing stale notes never
+    overwrites notes saved by another session.
+    """
+    notes = st.session_state[f"{prefix}_notes_{respondent_id}"]
+    versions = st.session_state.setdefault(f"{prefix}_versions", {})
+    with assessment_lock():
+        survey = st.session_state[f"{prefix}_registry"].get(respondent_id)
+        if survey is None:
+            return
+        version = survey.get("version", 0)
+        survey["notes"] = notes
+        survey["version"] = version + 1
+        if versions.get(respondent_id, version) == version:
+            # This session's own notes edit must not make its next rating save conflict
+            versions[respondent_id] = survey["version"]
+        shared = shared_assessment()
+        if shared is not None:
+            shared.changed()  # journaled, but still a change every sharing session must save
+    log_edit("notes", f"{prefix}:{respondent_id}", notes)
+
+def save_all_respondents(prefix: str, registry: RespondentRegistry) -> int:
+    """Save every respondent whose draft differs from its saved ratings; returns the number of conflicts.
+
+    Respondents that were never rated (no draft and nothing saved) are
+    skipped rather than saved with the default ratings.
+    """
+    conflicts = 0
+    drafts = st.session_state.get(f"{prefix}_drafts", {})
+    for survey in registry:
+        if survey["id"] not in drafts and not survey.get("saved"):
+            continue
+        group = survey.get("type", "Leadership & Strategy")
+        scores = list(rating_draft(prefix, survey, len(survey_questions(group))))
+        if survey.get("saved") and scores == survey["scores"]:
+            continue
+        conflicts += not save_respondent(prefix, survey, group, scores)
+    return conflicts
+
+def import_surveys(surveys_by_group: Dict[str, List[Dict]]):
+    """Add imported, already saved surveys to the registries, aggregates and response matrices"""
+    with assessment_lock():
+        for group, surveys in surveys_by_group.items():
+            registry = st.session_state.leadership_registry if group == "Leadership & Strategy" else st.session_state.people_registry
+            matrix = st.session_state.response_matrices[group]
+            for survey in surveys:
+                registry.add(survey)
+                matrix.upsert(survey["id"], survey["scores"], survey["name"], survey["role"])
+            st.session_state.respondent_aggregator.add(survey_area(group), [score for survey in surveys for score in survey["scores"]])
+        respondents_changed()
+
+def prune_respondent_widgets(prefix: str, registry: RespondentRegistry):
+    """Drop the widget state and drafts of respondents no longer in the registry"""
+    for state in (st.session_state.get(f"{prefix}_drafts", {}), st.session_state.get(f"{prefix}_versions", {})):
+        for respondent_id in [respondent_id for respondent_id in state if respondent_id not in registry]:
+            del state[respondent_id]
+    pattern = re.compile(rf"^{prefix}_(?:notes_)?([0-9a-f]{{32}})(?:_\d+)?$")
+    for key in list(st.session_state.keys()):
+        match = pattern.match(key) if isinstance(key, str) else None
+        if match and match.group(1) not in registry:
+            del st.session_state[key]
+
+RESPONDENTS_PER_PAGE = 20
+
+def select_respondent(prefix: str, registry: RespondentRegistry) -> Optional[Dict]:
+    """Search box, paginated summary table and picker for a respondent list.
+
+    Only the returned respondent's survey widgets get rendered by the
+    caller, so a rerun costs the same with 5 or 500 respondents.
+    """
+    query = st.text_input("🔍 Search respondents", key=f"{prefix}_search", placeholder="Name, role or type").strip().lower()
+    matches = [
+        survey for survey in registry
+        if not query or any(query in str(survey.get(field, "")).lower() for field in ("name", "role", "type"))
+    ]
+    if not matches:
+        st.info("No respondents match your search")
+        return None
+
+    pages = (len(matches) - 1) // RESPONDENTS_PER_PAGE + 1
+    if st.session_state.get(f"{prefix}_page", 1) > pages:
+        st.session_state[f"{prefix}_page"] = pages
+    page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1, key=f"{prefix}_page") if pages > 1 else 1
+    page_surveys = matches[(page - 1) * RESPONDENTS_PER_PAGE:page * RESPONDENTS_PER_PAGE]
+
+    import pandas as pd
+
+    st.dataframe(
+        pd.DataFrame([
+            {
+                "Name": survey["name"],
+                "Role": survey["role"],
+                **({"Type": survey["type"]} if "type" in survey else {}),
+                "Status": "✅ Saved" if survey.get("saved") else "⏳ Pending",
+                "Avg Score": round(sum(survey["scores"]) / len(survey["scores"]), 2) if survey.get("saved") and survey.get("scores") else None
+            }
+            for survey in page_surveys
+        ]),
+        hide_index=True,
+        use_container_width=True
+    )
+
+    surveys_by_id = {survey["id"]: survey for survey in page_surveys}
+    selected = st.selectbox(
+        "Open respondent survey",
+        [None] + list(surveys_by_id),
+        format_func=lambda rid: "—" if rid is None else f"{surveys_by_id[rid]['name']} - {surveys_by_id[rid]['role']}",
+        key=f"{prefix}_selected"
+    )
+    return surveys_by_id.get(selected)
+
+def rerun_with_message(message: str):
+    """Rerun the whole app (not just the current fragment) and toast the message afterwards"""
+    st.session_state["toast_message"] = message
+    st.rerun()
 
 # ---------------------- Initialize Session State ----------------------
 if "onboarding" not in st.session_state:
@@ -732,17 +1049,24 @@ if "data_readiness_saved" not in st.session_state:
 if "infrastructure_saved" not in st.session_state:
     st.session_state.infrastructure_saved = []
 
-if "people_surveys" not in st.session_state:
-    st.session_state.people_surveys = []
+if "people_registry" not in st.session_state:
+    st.session_state.people_registry = RespondentRegistry()
 
-if "leadership_surveys" not in st.session_state:
-    st.session_state.leadership_surveys = []
+if "leadership_registry" not in st.session_state:
+    st.session_state.leadership_registry = RespondentRegistry()
 
-if "people_saved" not in st.session_state:
-    st.session_state.people_saved = []
+if "score_aggregator" not in st.session_state or "respondent_aggregator" not in st.session_state:
+    rebuild_score_aggregator()
 
-if "leadership_saved" not in st.session_state:
-    st.session_state.leadership_saved = []
+if "response_matrices" not in st.session_state:
+    rebuild_response_matrices()
+
+# A session whose shared assessment was closed by the session that shared it
+# continues on a private copy, which it now saves itself
+if shared_assessment() is not None and shared_assessment().closed:
+    leave_shared_assessment()
+    mark_snapshot_due()
+    st.session_state["toast_message"] = "Sharing was stopped; your respondents are kept as a private copy of the assessment"
 
 # ---------------------- Enhanced Sidebar ----------------------
 with st.sidebar:
@@ -813,6 +1137,72 @@ with st.sidebar:
         st.info("AI vendor evaluation and selection criteria")
     
     # Note: Data Management and AI Integration features are available in the main app tabs
+    
+    st.divider()
+    st.markdown("### 💾 Saved Assessments")
+    st.caption("Your work is saved automatically a few seconds after each change.")
+    if st.button("💾 Save Now", key="save_snapshot", use_container_width=True):
+        try:
+            path = save_to_json(force=True)
+            st.success(f"Saved to {path}" if path else "No changes since the last save")
+        except OSError as e:
+            st.error(f"Could not save the assessment: {e}")
+    
+    # Browse the indexed snapshots one page at a time
+    repository = get_assessment_repository()
+    if repository.count():
+        search = st.text_input("Search by company", key="assessment_search").strip()
+        sector = st.selectbox("Sector", ["All sectors"] + repository.sectors(), key="assessment_sector")
+        sector = None if sector == "All sectors" else sector
+        total = repository.count(search, sector)
+        pages = max(1, (total - 1) // ASSESSMENTS_PER_PAGE + 1)
+        if st.session_state.get("assessment_page", 1) > pages:
+            st.session_state.assessment_page = pages
+        page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1, key="assessment_page") if pages > 1 else 1
+        assessments = {
+            row["name"]: row
+            for row in repository.search(search, sector, limit=ASSESSMENTS_PER_PAGE, offset=(page - 1) * ASSESSMENTS_PER_PAGE)
+        }
+        if assessments:
+            snapshot_to_load = st.selectbox(
+                f"Open a saved assessment ({total} found)",
+                list(assessments),
+                format_func=lambda name: (
+                    f"{assessments[name]['company'] or 'Unnamed'} · {assessments[name]['saved_at'][:16].replace('T', ' ')}"
+                    f" · {assessments[name]['overall_score']:.2f}"
+                ),
+                key="snapshot_to_load"
+            )
+            st.caption(f"{assessments[snapshot_to_load]['sector'] or 'No sector'} · {assessments[snapshot_to_load]['respondents']} respondents")
+            if st.button("📂 Load Assessment", key="load_snapshot", use_container_width=True):
+                load_from_json(snapshot_to_load)
+        else:
+            st.info("No saved assessments match your search")
+
+    st.divider()
+    st.markdown("### 🤝 Live Collaboration")
+    shared = shared_assessment()
+    if shared is None:
+        st.caption("Share this assessment so other respondents can fill in their surveys at the same time.")
+        if st.button("🔗 Share Assessment", key="share_assessment", use_container_width=True):
+            share_assessment()
+            rerun_with_message("Assessment shared")
+        join_code = st.text_input("Join with a share code", key="join_code").strip()
+        if st.button("➡️ Join", key="join_assessment", use_container_width=True, disabled=not join_code):
+            if join_assessment(join_code):
+                rerun_with_message("Joined the shared assessment")
+            else:
+                st.error("No shared assessment with that code is open")
+    else:
+        st.success(f"Shared · code `{shared.code}`")
+        if st.session_state.get("shared_owner", False):
+            st.caption("Give this code to respondents; stopping disconnects everyone who joined.")
+        else:
+            st.caption("Respondents are shared live and saved into the shared assessment; "
+                       "this session's own onboarding and section answers are not saved while joined.")
+        if st.button("⏏️ Stop Sharing" if st.session_state.get("shared_owner", False) else "⏏️ Leave", key="leave_shared", use_container_width=True):
+            leave_shared_assessment()
+            st.rerun()
 
 # ---------------------- Enhanced Main Header ----------------------
 st.markdown("""
@@ -824,6 +1214,9 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
+if "toast_message" in st.session_state:
+    st.toast(st.session_state.pop("toast_message"))
+
 # Professional description with enhanced styling
 st.markdown("""
 <div class="assessment-card fade-in-up">
@@ -838,7 +1231,9 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# ---------------------- Onboarding Tab ----------------------
+# Each tab is rendered by an st.fragment, so interacting with one tab's widgets
+# reruns only that tab. Actions that change saved data rerun the whole app so
+# the Results tab is recomputed.
 tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
     "🏠 Onboarding", 
     "📊 Data Readiness", 
@@ -848,7 +1243,10 @@ tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
     "📈 Results"
 ])
 
-with tab1:
+# ---------------------- Onboarding Tab ----------------------
+@st.fragment
+def render_onboarding_tab():
+    """Render the Onboarding tab"""
     st.markdown("""
     <div class="assessment-card fade-in-up">
         <h2 style="color: #1e3c72; margin-bottom: 1rem; font-weight: 600; display: flex; align-items: center;">
@@ -871,6 +1269,7 @@ with tab1:
             "Company Name", 
             value=st.session_state.onboarding.get("Company Name", ""),
             placeholder="Enter your company name",
+            on_change=mark_snapshot_due,
             help="The official name of your organization"
         )
         st.session_state.onboarding["Sector"] = st.selectbox(
@@ -887,12 +1286,14 @@ with tab1:
             "Other"
             ], 
             index=0 if "Sector" not in st.session_state.onboarding else ["Banking/Finance", "Insurance", "Retail", "Manufacturing", "Healthcare", "Education", "Public Sector", "Technology", "Other"].index(st.session_state.onboarding["Sector"]),
+            on_change=mark_snapshot_due,
             help="Select your primary industry sector"
         )
         st.session_state.onboarding["Phone"] = st.text_input(
             "Phone Number", 
             value=st.session_state.onboarding.get("Phone", ""),
             placeholder="+1 (555) 123-4567",
+            on_change=mark_snapshot_due,
             help="Primary contact phone number"
         )
         st.session_state.onboarding["Address"] = st.text_area(
@@ -900,6 +1301,7 @@ with tab1:
             value=st.session_state.onboarding.get("Address", ""), 
             height=80,
             placeholder="Enter your business address",
+            on_change=mark_snapshot_due,
             help="Primary business location address"
         )
     
@@ -909,12 +1311,14 @@ with tab1:
             "Email Address", 
             value=st.session_state.onboarding.get("Email", ""),
             placeholder="contact@company.com",
+            on_change=mark_snapshot_due,
             help="Primary contact email address"
         )
         st.session_state.onboarding["Website"] = st.text_input(
             "Website (Optional)", 
             value=st.session_state.onboarding.get("Website", ""),
             placeholder="https://www.company.com",
+            on_change=mark_snapshot_due,
             help="Company website URL"
         )
     
@@ -924,6 +1328,7 @@ with tab1:
         value=st.session_state.onboarding.get("onboarding_notes", ""), 
         key="onboarding_notes", 
         placeholder="Provide any additional context, goals, constraints, or specific areas of focus for this AI readiness assessment...",
+        on_change=mark_snapshot_due,
         help="Share any relevant background information that might influence the assessment"
     )
     
@@ -944,17 +1349,24 @@ with tab1:
             # Update onboarding notes in session state
             if "onboarding_notes" in st.session_state:
                 st.session_state.onboarding["onboarding_notes"] = st.session_state["onboarding_notes"]
-            st.success("✅ Onboarding information saved successfully!")
+            mark_snapshot_due()
+            rerun_with_message("✅ Onboarding information saved successfully!")
     
     with col3:
         if st.button("🔄 Reset Form", key="reset_onboarding", use_container_width=True):
             st.session_state.onboarding = {}
             if "onboarding_notes" in st.session_state:
                 del st.session_state["onboarding_notes"]
+            mark_snapshot_due()
             st.rerun()
 
+with tab1:
+    render_onboarding_tab()
+
 # ---------------------- Data Readiness Tab ----------------------
-with tab2:
+@st.fragment
+def render_data_readiness_tab():
+    """Render the Data Readiness tab"""
     st.markdown("""
     <div class="assessment-card fade-in-up">
         <h2 style="color: #1e3c72; margin-bottom: 1rem; font-weight: 600; display: flex; align-items: center;">
@@ -970,71 +1382,7 @@ with tab2:
     </div>
     """, unsafe_allow_html=True)
     
-    data_readiness_questions = [
-        "An enterprise data catalog exists listing key datasets and owners",
-        ">90% of critical data is digitized (vs. paper/PDF only)",
-        "Data is centralized or virtually unified (DW/lake, federated catalog)",
-        "Key datasets have primary keys/relationships (customer_id, account_id)",
-        "Data is timestamped with clear refresh frequencies",
-        "Unstructured data (PDFs/emails/audio) is organized/OCR/transcribed",
-        "Completeness targets & monitoring exist (missing value thresholds)",
-        "Accuracy checks & de-duplication routines run regularly",
-        "Consistency rules enforced across systems (types/codes/master data)",
-        "Update SLAs are met for intended uses (dashboards/AI)",
-        "Validation tests are automated; failures trigger alerts",
-        "Modern data platform (warehouse/lakehouse) with scalable storage",
-        "Reliable ETL/ELT pipelines (batch/stream) connect source systems",
-        "Governed data APIs provide access for apps/AI services",
-        "Backups, DR, and versioning are implemented & tested",
-        "Cost monitoring for storage/egress/compute guides lifecycle",
-        "Business & technical metadata maintained in searchable catalog",
-        "Automated lineage shows flow from source to consumption",
-        "Semantic layer / data contracts define metrics & schemas",
-        "Docs/playbooks exist for dataset usage, refresh, ownership",
-        "Data owners/stewards assigned with responsibilities",
-        "RBAC/ABAC and audit logs enforced for sensitive data",
-        "Sensitive data classified & protected (encryption/key mgmt)",
-        "3rd-party & shadow AI data flows inventoried & governed",
-        "Incident response & rollback plans exist and are tested",
-        "Compliance map (GDPR/CCPA/HIPAA/KYC/AML etc.) exists",
-        "Consent mgmt & subject rights implemented",
-        "Retention & deletion policies defined & automated where possible",
-        "Privacy impact assessments (DPIA) done for new data uses",
-        "Regulatory reporting data is accurate, timely, auditable",
-        "Vector DB / embeddings layer available for semi/unstructured content",
-        "Pipelines for OCR/ASR ingestion, chunking, and enrichment exist",
-        "Human feedback loops & labeling used for improvement",
-        "Evaluation & observability for drift and model performance exist"
-    ]
-    
-    for i, q in enumerate(data_readiness_questions):
-        st.markdown(f"**{i + 1}.** {q}")
-        
-        # Initialize session state if not exists
-        if f"data_readiness_{i}" not in st.session_state:
-            st.session_state[f"data_readiness_{i}"] = 3
-        if f"data_readiness_notes_{i}" not in st.session_state:
-            st.session_state[f"data_readiness_notes_{i}"] = ""
-        
-        # Create radio button with current value
-        score = st.radio(
-            "Rating", 
-            [1, 2, 3, 4, 5], 
-            index=st.session_state[f"data_readiness_{i}"] - 1,
-            key=f"data_readiness_{i}",
-            horizontal=True,
-            label_visibility="collapsed"
-        )
-        
-        # Create text area with current value
-        notes = st.text_area(
-            "Notes", 
-            value=st.session_state[f"data_readiness_notes_{i}"],
-            key=f"data_readiness_notes_{i}",
-            placeholder="Add your observations here..."
-        )
-        
-        st.divider()
+    render_rating_section("data_readiness", DATA_READINESS_QUESTIONS, "Data Readiness")
     
     # Enhanced Save and Reset buttons
     st.markdown("""
@@ -1048,76 +1396,28 @@ with tab2:
     
     with col2:
         if st.button("💾 Save Data Readiness", key="save_data_readiness", use_container_width=True):
-            st.session_state.data_readiness_saved = []
-            for i, q in enumerate(data_readiness_questions):
-                score = st.session_state.get(f"data_readiness_{i}", 3)
-                notes = st.session_state.get(f"data_readiness_notes_{i}", "")
-                st.session_state.data_readiness_saved.append({
-                    "question": q,
-                    "score": score,
-                    "notes": notes
-                })
-            st.success("✅ Data Readiness assessment saved successfully!")
+            save_rating_answers("data_readiness", DATA_READINESS_QUESTIONS, "Data Readiness")
+            rerun_with_message("✅ Data Readiness assessment saved successfully!")
     
     with col3:
         if st.button("🔄 Reset Assessment", key="reset_data_readiness", use_container_width=True):
-            for i in range(len(data_readiness_questions)):
+            for i in range(len(DATA_READINESS_QUESTIONS)):
                 if f"data_readiness_{i}" in st.session_state:
                     del st.session_state[f"data_readiness_{i}"]
                 if f"data_readiness_notes_{i}" in st.session_state:
                     del st.session_state[f"data_readiness_notes_{i}"]
             st.rerun()
 
+with tab2:
+    render_data_readiness_tab()
+
 # ---------------------- Infrastructure Tab ----------------------
-with tab3:
+@st.fragment
+def render_infrastructure_tab():
+    """Render the Infrastructure tab"""
     st.header("⚙️ Infrastructure")
     
-    infrastructure_questions = [
-        "Sufficient compute (CPU/GPU) capacity available on-demand",
-        "Cloud/hybrid foundations in place with secure networking",
-        "Environment isolation & guardrails for AI experimentation",
-        "Standardized pipelines for training/eval/deployment (CI/CD)",
-        "Model/Prompt registry & versioning",
-        "Feature store / vector store operationalized",
-        "Secure APIs & connectors to embed AI in workflows",
-        "Streaming/batch data pipelines for production use",
-        "Eventing/queues for robust orchestration",
-        "Monitoring (performance, cost, latency) and alerting exist",
-        "SLOs/SLIs for AI services defined and tracked",
-        "Incident response runbooks and chaos testing",
-        "Secrets mgmt, KMS, egress controls for LLM/RAG patterns",
-        "Access controls (RBAC/ABAC) and audit logs enforced",
-        "Regular pen-tests and red-teaming for AI systems"
-    ]
-    
-    for i, q in enumerate(infrastructure_questions):
-        st.markdown(f"**{i + 1}.** {q}")
-        
-        # Initialize session state if not exists
-        if f"infrastructure_{i}" not in st.session_state:
-            st.session_state[f"infrastructure_{i}"] = 3
-        if f"infrastructure_notes_{i}" not in st.session_state:
-            st.session_state[f"infrastructure_notes_{i}"] = ""
-        
-        # Create radio button with current value
-        score = st.radio(
-            "Rating", 
-            [1, 2, 3, 4, 5], 
-            index=st.session_state[f"infrastructure_{i}"] - 1,
-            key=f"infrastructure_{i}",
-            horizontal=True,
-            label_visibility="collapsed"
-        )
-        
-        # Create text area with current value
-        notes = st.text_area(
-            "Notes", 
-            value=st.session_state[f"infrastructure_notes_{i}"],
-            key=f"infrastructure_notes_{i}",
-            placeholder="Add your observations here..."
-        )
-        
-        st.divider()
+    render_rating_section("infrastructure", INFRASTRUCTURE_QUESTIONS, "Infrastructure")
     
     # Save and Reset buttons at the bottom
     st.divider()
@@ -1125,28 +1425,25 @@ with tab3:
     
     with col1:
         if st.button("💾 Save Infrastructure", key="save_infrastructure"):
-            st.session_state.infrastructure_saved = []
-            for i, q in enumerate(infrastructure_questions):
-                score = st.session_state.get(f"infrastructure_{i}", 3)
-                notes = st.session_state.get(f"infrastructure_notes_{i}", "")
-                st.session_state.infrastructure_saved.append({
-                    "question": q,
-                    "score": score,
-                    "notes": notes
-                })
-            st.success("Infrastructure saved!")
+            save_rating_answers("infrastructure", INFRASTRUCTURE_QUESTIONS, "Infrastructure")
+            rerun_with_message("Infrastructure saved!")
     
     with col2:
         if st.button("🔄 Reset Infrastructure", key="reset_infrastructure"):
-            for i in range(len(infrastructure_questions)):
+            for i in range(len(INFRASTRUCTURE_QUESTIONS)):
                 if f"infrastructure_{i}" in st.session_state:
                     del st.session_state[f"infrastructure_{i}"]
                 if f"infrastructure_notes_{i}" in st.session_state:
                     del st.session_state[f"infrastructure_notes_{i}"]
             st.rerun()
 
+with tab3:
+    render_infrastructure_tab()
+
 # ---------------------- People Tab ----------------------
-with tab4:
+@st.fragment
+def render_people_tab():
+    """Render the People tab"""
     st.header("👥 People")
     
     # Add new respondent survey
@@ -1162,6 +1459,7 @@ with tab4:
         if st.button("Add Respondent Survey", key="add_people_survey"):
             if new_name and new_role:
                 new_survey = {
+                    "id": new_respondent_id(),
                     "name": new_name,
                     "role": new_role,
                     "type": new_type,
@@ -1169,58 +1467,70 @@ with tab4:
                     "notes": "",
                     "saved": False
                 }
-                st.session_state.people_surveys.append(new_survey)
-                st.success(f"Added survey for {new_name}")
-                st.rerun()
+                with assessment_lock():
+                    st.session_state.people_registry.add(new_survey)
+                    respondents_changed()
+                rerun_with_message(f"Added survey for {new_name}")
             else:
                 st.error("Please provide both name and role")
     
+    # Bulk import of People and Leadership responses
+    with st.expander("📥 Bulk Import Responses", expanded=False):
+        st.caption(
+            "CSV or Excel (.xlsx, needs openpyxl) with columns name, role, type (AI Use / AI Build / Leadership), "
+            "q1..q6 rated 1-5 and optional notes. Leadership rows go to the Leadership & Strategy tab."
+        )
+        uploaded = st.file_uploader("Responses file", type=["csv", "xlsx"], key="people_import_file")
+        if uploaded is not None and st.button("Import Responses", key="people_import"):
+            from survey_import import read_responses, to_surveys, validate_responses
+
+            try:
+                valid, errors = validate_responses(read_responses(uploaded.getvalue(), uploaded.name))
+            except ValueError as e:
+                st.error(f"Could not import {uploaded.name}: {e}")
+            else:
+                import_surveys(to_surveys(valid))
+                st.session_state.people_import_errors = errors
+                rerun_with_message(f"Imported {len(valid)} responses ({len(errors)} rows rejected)")
+        
+        import_errors = st.session_state.get("people_import_errors")
+        if import_errors is not None and not import_errors.empty:
+            st.warning(f"{len(import_errors)} rows were rejected by the last import")
+            st.dataframe(import_errors, hide_index=True, use_container_width=True)
+            export_csv(import_errors, "Import Errors")
+    
     # Current survey status
-    if st.session_state.people_surveys:
+    registry = st.session_state.people_registry
+    if registry:
         st.subheader("📊 Current Survey Status")
-        total_surveys = len(st.session_state.people_surveys)
-        saved_surveys = sum(1 for s in st.session_state.people_surveys if s.get("saved", False))
+        total_surveys = len(registry)
+        saved_surveys = sum(1 for s in registry if s.get("saved", False))
         st.info(f"Total Surveys: {total_surveys} | Saved: {saved_surveys} | Pending: {total_surveys - saved_surveys}")
     
-    # Display existing surveys
-    for i, survey in enumerate(st.session_state.people_surveys):
-        with st.expander(f"📝 {survey['name']} - {survey['role']} ({survey['type']})", expanded=False):
+    # Display the selected survey
+    survey = select_respondent("people", registry) if registry else None
+    if survey is not None:
+        rid = survey["id"]
+        with st.expander(f"📝 {survey['name']} - {survey['role']} ({survey['type']})", expanded=True):
             st.markdown(f"**Type:** {survey['type']}")
             
-            if survey['type'] == "AI Use (End Users)":
-                people_questions = [
-                    "General AI literacy (understanding of capabilities/limits)",
-                    "Have you used any AI tools at work? (1:No → 5:Daily heavy use)",
-                    "How many distinct AI tools have you tried? (1:0 → 5:5+)",
-                    "Average time per week using AI tools (1:<30m → 5:5h+)",
-                    "Did tools measurably help productivity/quality?",
-                    "Willingness to learn and adopt more AI at work"
-                ]
-            else:  # AI Build (Builders)
-                people_questions = [
-                    "Understands key terms (AI, ML, LLMs, embeddings, RAG, evals)",
-                    "Can build basic prototypes (APIs, Python, notebooks)",
-                    "Understands what is needed to build/ship an AI feature (data, evals, guardrails)",
-                    "Familiar with vector DBs, prompt versioning, and evaluation basics",
-                    "Can integrate AI into an app via secure patterns (auth, logging)",
-                    "Willingness to upskill with targeted AI training"
-                ]
+            people_questions = PEOPLE_QUESTIONS.get(survey['type'], AI_BUILD_QUESTIONS)
             
             # Collect scores
             scores = []
-            for j, q in enumerate(people_questions):
-                st.markdown(f"**{j + 1}.** {q}")
-                
-                # Initialize session state if not exists
-                if f"people_{i}_{j}" not in st.session_state:
-                    st.session_state[f"people_{i}_{j}"] = 3
+            respondent_version("people", survey)
+            draft = rating_draft("people", survey, len(people_questions))
+            for j, question in enumerate(people_questions):
+                st.markdown(f"**{j + 1}.** {question.text}")
                 
                 # Create radio button with current value
                 score = st.radio(
                     "Rating", 
                     [1, 2, 3, 4, 5], 
-                    index=st.session_state[f"people_{i}_{j}"] - 1,
-                    key=f"people_{i}_{j}",
+                    index=draft[j] - 1,
+                    key=f"people_{rid}_{j}",
+                    on_change=record_rating,
+                    args=("people", rid, draft, j, question.id),
                     horizontal=True,
                     label_visibility="collapsed"
                 )
@@ -1228,21 +1538,23 @@ with tab4:
                 scores.append(score)
             
             # Notes
-            survey["notes"] = st.text_area(
+            st.text_area(
                 "Overall Notes", 
                 value=survey.get("notes", ""),
-                key=f"people_notes_{i}",
+                key=f"people_notes_{rid}",
+                on_change=record_respondent_notes,
+                args=("people", rid),
                 placeholder="Add your observations here..."
             )
             
             # Save individual survey
             col1, col2 = st.columns([1, 3])
             with col1:
-                if st.button(f"💾 Save {survey['name']}'s Survey", key=f"save_people_{i}"):
-                    survey["scores"] = scores
-                    survey["saved"] = True
-                    st.success(f"{survey['name']}'s survey saved!")
-                    st.rerun()
+                if st.button(f"💾 Save {survey['name']}'s Survey", key=f"save_people_{rid}"):
+                    if save_respondent("people", survey, survey['type'], scores):
+                        rerun_with_message(f"{survey['name']}'s survey saved!")
+                    else:
+                        rerun_with_message(f"⚠️ {survey['name']}'s survey was saved in another session meanwhile; showing their latest answers")
             
             with col2:
                 if survey.get("saved", False):
@@ -1251,8 +1563,9 @@ with tab4:
                     st.warning("⏳ Survey Not Saved")
             
             # Remove survey
-            if st.button(f"🗑️ Remove Survey", key=f"remove_people_{i}"):
-                st.session_state.people_surveys.pop(i)
+            if st.button(f"🗑️ Remove Survey", key=f"remove_people_{rid}"):
+                remove_survey(registry, survey, survey['type'])
+                prune_respondent_widgets("people", registry)
                 st.rerun()
     
     # Save and Reset buttons at the bottom
@@ -1260,23 +1573,34 @@ with tab4:
     col1, col2 = st.columns(2)
     
     with col1:
-        if st.session_state.people_surveys:
+        if registry:
             if st.button("💾 Save All People Surveys", key="save_all_people"):
-                st.session_state.people_saved = st.session_state.people_surveys.copy()
-                st.success("All people surveys saved!")
+                conflicts = save_all_respondents("people", registry)
+                rerun_with_message(f"All people surveys saved ({conflicts} changed in another session were skipped)" if conflicts else "All people surveys saved!")
         else:
             st.info("No surveys to save")
     
     with col2:
-        if st.session_state.people_surveys:
+        if registry:
             if st.button("🔄 Reset All People Surveys", key="reset_all_people"):
-                st.session_state.people_surveys = []
+                with assessment_lock():
+                    registry.clear()
+                    st.session_state.respondent_aggregator.clear("People - AI Users")
+                    st.session_state.respondent_aggregator.clear("People - AI Builders")
+                    rebuild_response_matrices()
+                    respondents_changed()
+                prune_respondent_widgets("people", registry)
                 st.rerun()
         else:
             st.info("No surveys to reset")
 
+with tab4:
+    render_people_tab()
+
 # ---------------------- Leadership & Strategy Tab ----------------------
-with tab5:
+@st.fragment
+def render_leadership_tab():
+    """Render the Leadership & Strategy tab"""
     st.header("🎯 Leadership & Strategy")
     
     # Add new leadership survey
@@ -1290,45 +1614,41 @@ with tab5:
         if st.button("Add Leadership Survey", key="add_leadership_survey"):
             if new_leadership_name and new_leadership_role:
                 new_survey = {
+                    "id": new_respondent_id(),
                     "name": new_leadership_name,
                     "role": new_leadership_role,
                     "scores": [],
                     "notes": "",
                     "saved": False
                 }
-                st.session_state.leadership_surveys.append(new_survey)
-                st.success(f"Added survey for {new_leadership_name}")
-                st.rerun()
+                with assessment_lock():
+                    st.session_state.leadership_registry.add(new_survey)
+                    respondents_changed()
+                rerun_with_message(f"Added survey for {new_leadership_name}")
             else:
                 st.error("Please provide both name and role")
     
-    # Display existing surveys
-    for i, survey in enumerate(st.session_state.leadership_surveys):
-        with st.expander(f"📝 {survey['name']} - {survey['role']}", expanded=False):
-            leadership_questions = [
-                "AI is explicitly included in the 3–5 year corporate strategy",
-                "A dedicated senior owner for AI exists (with decision rights)",
-                "Annual budget is allocated for AI initiatives",
-                "Leadership communicates AI vision and expected outcomes",
-                "Use cases are prioritized by ROI/feasibility; KPIs tracked",
-                "Long-term plan to improve operations with AI is defined"
-            ]
-            
+    # Display the selected survey
+    registry = st.session_state.leadership_registry
+    survey = select_respondent("leadership", registry) if registry else None
+    if survey is not None:
+        rid = survey["id"]
+        with st.expander(f"📝 {survey['name']} - {survey['role']}", expanded=True):
             # Collect scores
             scores = []
-            for j, q in enumerate(leadership_questions):
-                st.markdown(f"**{j + 1}.** {q}")
-                
-                # Initialize session state if not exists
-                if f"leadership_{i}_{j}" not in st.session_state:
-                    st.session_state[f"leadership_{i}_{j}"] = 3
+            respondent_version("leadership", survey)
+            draft = rating_draft("leadership", survey, len(LEADERSHIP_QUESTIONS))
+            for j, question in enumerate(LEADERSHIP_QUESTIONS):
+                st.markdown(f"**{j + 1}.** {question.text}")
                 
                 # Create radio button
                 score = st.radio(
                     "Rating", 
                     [1, 2, 3, 4, 5], 
-                    index=st.session_state[f"leadership_{i}_{j}"] - 1,
-                    key=f"leadership_{i}_{j}",
+                    index=draft[j] - 1,
+                    key=f"leadership_{rid}_{j}",
+                    on_change=record_rating,
+                    args=("leadership", rid, draft, j, question.id),
                     horizontal=True,
                     label_visibility="collapsed"
                 )
@@ -1338,21 +1658,23 @@ with tab5:
                 scores.append(score)
             
             # Notes
-            survey["notes"] = st.text_area(
+            st.text_area(
                 "Overall Notes", 
                 value=survey.get("notes", ""),
-                key=f"leadership_notes_{i}",
+                key=f"leadership_notes_{rid}",
+                on_change=record_respondent_notes,
+                args=("leadership", rid),
                 placeholder="Add your observations here..."
             )
             
             # Save individual survey
             col1, col2 = st.columns([1, 3])
             with col1:
-                if st.button(f"💾 Save {survey['name']}'s Survey", key=f"save_leadership_{i}"):
-                    survey["scores"] = scores
-                    survey["saved"] = True
-                    st.success(f"{survey['name']}'s survey saved!")
-                    st.rerun()
+                if st.button(f"💾 Save {survey['name']}'s Survey", key=f"save_leadership_{rid}"):
+                    if save_respondent("leadership", survey, "Leadership & Strategy", scores):
+                        rerun_with_message(f"{survey['name']}'s survey saved!")
+                    else:
+                        rerun_with_message(f"⚠️ {survey['name']}'s survey was saved in another session meanwhile; showing their latest answers")
             
             with col2:
                 if survey.get("saved", False):
@@ -1361,8 +1683,9 @@ with tab5:
                     st.warning("⏳ Survey Not Saved")
             
             # Remove survey
-            if st.button(f"🗑️ Remove Survey", key=f"remove_leadership_{i}"):
-                st.session_state.leadership_surveys.pop(i)
+            if st.button(f"🗑️ Remove Survey", key=f"remove_leadership_{rid}"):
+                remove_survey(registry, survey, "Leadership & Strategy")
+                prune_respondent_widgets("leadership", registry)
                 st.rerun()
     
     # Save and Reset buttons at the bottom
@@ -1370,23 +1693,33 @@ with tab5:
     col1, col2 = st.columns(2)
     
     with col1:
-        if st.session_state.leadership_surveys:
+        if registry:
             if st.button("💾 Save All Leadership Surveys", key="save_all_leadership"):
-                st.session_state.leadership_saved = st.session_state.leadership_surveys.copy()
-                st.success("All leadership surveys saved!")
+                conflicts = save_all_respondents("leadership", registry)
+                rerun_with_message(f"All leadership surveys saved ({conflicts} changed in another session were skipped)" if conflicts else "All leadership surveys saved!")
         else:
             st.info("No surveys to save")
     
     with col2:
-        if st.session_state.leadership_surveys:
+        if registry:
             if st.button("🔄 Reset All Leadership Surveys", key="reset_all_leadership"):
-                st.session_state.leadership_surveys = []
+                with assessment_lock():
+                    registry.clear()
+                    st.session_state.respondent_aggregator.clear("Leadership & Strategy")
+                    rebuild_response_matrices()
+                    respondents_changed()
+                prune_respondent_widgets("leadership", registry)
                 st.rerun()
         else:
             st.info("No surveys to reset")
 
+with tab5:
+    render_leadership_tab()
+
 # ---------------------- Results Tab ----------------------
-with tab6:
+@st.fragment
+def render_results_tab():
+    """Render the Results tab"""
     st.markdown("""
     <div class="assessment-card fade-in-up">
         <h2 style="color: #1e3c72; margin-bottom: 1rem; font-weight: 600; display: flex; align-items: center;">
@@ -1399,86 +1732,17 @@ with tab6:
     </div>
     """, unsafe_allow_html=True)
     
-    # Calculate scores
-    scores_data = []
-    
-    # Data Readiness
-    if st.session_state.data_readiness_saved:
-        data_scores = [item["score"] for item in st.session_state.data_readiness_saved]
-        scores_data.append({
-            "Area": "Data Readiness",
-            "Avg Score": np.mean(data_scores),
-            "Count": len(data_scores)
-        })
-    
-    # Infrastructure
-    if st.session_state.infrastructure_saved:
-        infra_scores = [item["score"] for item in st.session_state.infrastructure_saved]
-        scores_data.append({
-            "Area": "Infrastructure",
-            "Avg Score": np.mean(infra_scores),
-            "Count": len(infra_scores)
-        })
-    
-    # People - AI Users (check both saved and current surveys)
-    ai_use_scores = []
-    # Check saved surveys
-    for survey in st.session_state.people_saved:
-        if survey.get("scores") and survey["type"] == "AI Use (End Users)":
-            ai_use_scores.extend(survey["scores"])
-    # Check current surveys (not yet saved)
-    for survey in st.session_state.people_surveys:
-        if survey.get("scores") and survey["type"] == "AI Use (End Users)":
-            ai_use_scores.extend(survey["scores"])
-    
-    if ai_use_scores:
-        scores_data.append({
-            "Area": "People - AI Users",
-            "Avg Score": np.mean(ai_use_scores),
-            "Count": len(ai_use_scores)
-        })
-    
-    # People - AI Builders (check both saved and current surveys)
-    ai_build_scores = []
-    # Check saved surveys
-    for survey in st.session_state.people_saved:
-        if survey.get("scores") and survey["type"] == "AI Build (Builders)":
-            ai_build_scores.extend(survey["scores"])
-    # Check current surveys (not yet saved)
-    for survey in st.session_state.people_surveys:
-        if survey.get("scores") and survey["type"] == "AI Build (Builders)":
-            ai_build_scores.extend(survey["scores"])
-    
-    if ai_build_scores:
-        scores_data.append({
-            "Area": "People - AI Builders",
-            "Avg Score": np.mean(ai_build_scores),
-            "Count": len(ai_build_scores)
-        })
-    
-    # Leadership (check both saved and current surveys)
-    leadership_scores = []
-    # Check saved surveys
-    for survey in st.session_state.leadership_saved:
-        if survey.get("scores"):
-            leadership_scores.extend(survey["scores"])
-    # Check current surveys (not yet saved)
-    for survey in st.session_state.leadership_surveys:
-        if survey.get("scores"):
-            leadership_scores.extend(survey["scores"])
-    
-    if leadership_scores:
-        scores_data.append({
-            "Area": "Leadership & Strategy",
-            "Avg Score": np.mean(leadership_scores),
-            "Count": len(leadership_scores)
-        })
+    # Read the running per-area aggregates (respondents' possibly shared with other sessions)
+    scores_data = results_aggregator().snapshot()
     
     # Initialize variables
     scores_df = None
     overall = 0.0
     
     if scores_data:
+        import pandas as pd
+        from charts import radar_figure, radar_key
+
         scores_df = pd.DataFrame(scores_data)
         scores_df = scores_df.sort_values("Avg Score", ascending=False)
         
@@ -1520,76 +1784,32 @@ with tab6:
             </div>
             """, unsafe_allow_html=True)
         
-        # Enhanced Radar Chart - All 4 Dimensions Visible
+        # Enhanced Radar Chart - All 4 Dimensions Visible (built once per distinct set of scores)
         if len(scores_df) > 0:
-            fig = go.Figure()
-            
-            # Add the main radar trace
-            fig.add_trace(go.Scatterpolar(
-                r=scores_df["Avg Score"].tolist(),
-                theta=scores_df["Area"].tolist(),
-                fill='toself',
-                name='AI Readiness Score',
-                fillcolor='rgba(102, 126, 234, 0.25)',
-                line_color='rgba(102, 126, 234, 1)',
-                line_width=3,
-                marker=dict(
-                    size=8,
-                    color='rgba(102, 126, 234, 1)',
-                    line=dict(width=2, color='white')
-                ),
-                hovertemplate='<b>%{theta}</b><br>Score: %{r:.2f}/5.0<extra></extra>'
-            ))
-            
-            # Enhanced layout for better visibility
-            fig.update_layout(
-                polar=dict(
-                    radialaxis=dict(
-                        visible=True,
-                        range=[0, 5],
-                        ticktext=['0', '1', '2', '3', '4', '5'],
-                        tickvals=[0, 1, 2, 3, 4, 5],
-                        tickfont=dict(size=12, color='#4a5568'),
-                        gridcolor='rgba(102, 126, 234, 0.2)',
-                        linecolor='rgba(102, 126, 234, 0.3)',
-                        linewidth=1,
-                        showline=True
-                    ),
-                    angularaxis=dict(
-                        tickfont=dict(size=11, color='#2d3748'),
-                        gridcolor='rgba(102, 126, 234, 0.15)',
-                        linecolor='rgba(102, 126, 234, 0.3)',
-                        linewidth=1,
-                        showline=True,
-                        rotation=0
-                    ),
-                    bgcolor='rgba(255, 255, 255, 0.8)'
-                ),
-                showlegend=False,
-                height=450,
-                width=500,
-                margin=dict(l=20, r=20, t=30, b=20),
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                font=dict(family="Inter, sans-serif")
-            )
-            
-            # Add title and center the chart
-            fig.update_layout(
-                title=dict(
-                    text="",
-                    x=0.5,
-                    y=0.98,
-                    font=dict(size=14, color='#1e3c72'),
-                    xanchor='center'
-                )
-            )
+            fig = radar_figure(radar_key(scores_df["Area"], scores_df["Avg Score"]))
             
             # Center the chart with better proportions
             col1, col2, col3 = st.columns([1, 3, 1])
             with col2:
                 st.plotly_chart(fig, use_container_width=True)
         
+        # Per-question statistics of the multi-respondent surveys
+        matrices = {group: matrix for group, matrix in st.session_state.response_matrices.items() if len(matrix)}
+        if matrices:
+            with st.expander("📐 Per-Question Survey Statistics", expanded=False):
+                st.caption("Agreement is r_wg: 1 means every respondent gave the same rating, 0 means ratings are spread as if at random.")
+                for group, matrix in matrices.items():
+                    question_texts = [question.text for question in survey_questions(group)]
+                    with assessment_lock():
+                        respondent_count = len(matrix)
+                        summary = matrix.question_summary(question_texts)
+                    st.markdown(f"**{group}** ({respondent_count} respondents)")
+                    st.dataframe(
+                        pd.DataFrame(summary).round(2),
+                        hide_index=True,
+                        use_container_width=True
+                    )
+        
         # Ultra-compact AI Analysis
         col1, col2 = st.columns([1, 1])
         
@@ -1600,9 +1820,24 @@ with tab6:
                 st.success("✅ OpenAI API connected")
             else:
                 st.warning(f"⚠️ {status}")
+            
+            # Token usage of the last run in each mode, to compare their cost
+            for mode, usage in st.session_state.get("ai_token_usage", {}).items():
+                st.caption(
+                    f"{mode}: {usage.get('input_tokens', 0)} input / {usage.get('output_tokens', 0)} output tokens "
+                    f"({usage.get('requests', 0)} requests)"
+                )
         
         with col2:
+            analysis_mode = st.radio(
+                "Analysis mode",
+                ["Per-area (parallel)", "Single batched request"],
+                key="ai_analysis_mode",
+                horizontal=True,
+                help="Per-area sends one request for each assessment area; batched covers every area in one request"
+            )
             if st.button("🚀 Generate AI Analysis", use_container_width=True):
+                jobs = []
                 for _, row in scores_df.iterrows():
                     area = row['Area']
                     score = row['Avg Score']
@@ -1610,9 +1845,29 @@ with tab6:
                     
                     # Generate AI analysis even if no comments, using score context
                     context = f"Current score: {score}/5.0. Area: {area}. No specific user comments provided."
-                    ai_analysis = analyze_comments_with_ai(comments or "No specific feedback provided", area, score, context)
-                    st.session_state[f"ai_analysis_{area}"] = ai_analysis
+                    jobs.append({
+                        "area": area,
+                        "score": score,
+                        "comments": comments or "No specific feedback provided",
+                        "context": context
+                    })
                 
+                usage = {}
+                if analysis_mode == "Single batched request":
+                    with st.spinner("Analyzing all assessment areas..."):
+                        for area, ai_analysis in analyze_all_areas_with_ai(jobs, usage=usage).items():
+                            st.session_state[f"ai_analysis_{area}"] = ai_analysis
+                else:
+                    # Areas are analyzed in parallel; store each result as soon as it arrives
+                    progress = st.progress(0.0, text="Analyzing assessment areas...")
+                    for done, (area, ai_analysis) in enumerate(analyze_areas_concurrently(jobs), 1):
+                        st.session_state[f"ai_analysis_{area}"] = ai_analysis
+                        progress.progress(done / len(jobs), text=f"✅ {area} ({done}/{len(jobs)})")
+                    for job in jobs:
+                        for key, value in job["usage"].items():
+                            usage[key] = usage.get(key, 0) + value
+                
+                st.session_state.setdefault("ai_token_usage", {})[analysis_mode] = usage
                 st.success("✅ AI analysis generated!")
                 st.rerun()
         
@@ -1645,21 +1900,31 @@ with tab6:
                     for i, step in enumerate(ai_analysis.get("next_steps", [])[:3], 1):  # Show only first 3
                         st.markdown(f"{i}. {step}")
                     
-                    # Regenerate button (compact)
+                    # Regenerate button (compact) - bypasses the analysis cache on purpose
                     if st.button(f"🔄 Regenerate", key=f"ai_regenerate_{area}"):
-                        del st.session_state[f"ai_analysis_{area}"]
+                        comments = get_section_comments(area)
+                        context = f"Current score: {score}/5.0. Area: {area}. No specific user comments provided."
+                        preview = st.empty()
+                        st.session_state[f"ai_analysis_{area}"] = analyze_comments_with_ai(
+                            comments or "No specific feedback provided", area, score, context, use_cache=False,
+                            stream=True, on_update=lambda partial: render_analysis_preview(preview, partial)
+                        )
                         st.rerun()
                         
                 else:
                     # Generate AI analysis if not already available
                     if st.button(f"🧠 Generate Analysis", key=f"ai_generate_{area}"):
                         context = f"Current score: {score}/5.0. Area: {area}. No specific user comments provided."
-                        ai_analysis = analyze_comments_with_ai("No specific feedback provided", area, score, context)
+                        preview = st.empty()
+                        ai_analysis = analyze_comments_with_ai(
+                            "No specific feedback provided", area, score, context,
+                            stream=True, on_update=lambda partial: render_analysis_preview(preview, partial)
+                        )
                         st.session_state[f"ai_analysis_{area}"] = ai_analysis
                         st.rerun()
                     
                     # Generate basic recommendations based on score
-                    basic_recs = generate_basic_recommendations(area, score)
+                    basic_recs = basic_recommendations(area, score)
                     st.markdown("**📊 Basic Recommendations:**")
                     for rec in basic_recs[:2]:  # Show only first 2
                         st.markdown(f"• {rec}")
@@ -1680,66 +1945,39 @@ with tab6:
             export_csv(scores_df, "Module Scores")
         
         with col2:
-            # Markdown report
-            ts = datetime.now().isoformat()
-            ob = st.session_state.onboarding
-            report_lines = []
-            report_lines.append(f"# IB Analytics — AI Readiness Report\n")
-            report_lines.append(f"**Company:** {ob.get('Company Name','(unspecified)')}  ")
-            report_lines.append(f"**Sector:** {ob.get('Sector','(unspecified)')}  ")
-            report_lines.append(f"**Email:** {ob.get('Email','')}  ")
-            report_lines.append(f"**Phone:** {ob.get('Phone','')}  ")
-            report_lines.append(f"**Date:** {ts}\n")
-            report_lines.append("## Scores")
-            report_lines.append(scores_df.to_markdown(index=False))
-            report_lines.append(f"\n**Overall:** {overall:.2f}/5.00  \n**Maturity:** {maturity_band(overall)}\n")
-            
-            # Collect all comments
-            comment_blob = ""
-            for key, value in st.session_state.items():
-                if isinstance(key, str) and key.endswith("_notes") and isinstance(value, str) and value.strip():
-                    comment_blob += value.strip() + " "
-            
-            report_lines.append("## AI Summary of Comments")
-            report_lines.append(summarize_text(comment_blob, max_sentences=8) or "_No comments provided._")
-            report_lines.append("\n## AI-Powered Recommendations")
-            
-            for _, row in scores_df.iterrows():
-                area = row['Area']
-                score = row['Avg Score']
-                
-                # Check if AI analysis exists
-                if f"ai_analysis_{area}" in st.session_state:
-                    ai_analysis = st.session_state[f"ai_analysis_{area}"]
-                    report_lines.append(f"\n### {area} (Score: {score:.2f}/5.00)")
-                    report_lines.append(f"**Priority:** {ai_analysis.get('priority', 'Medium')}")
-                    
-                    report_lines.append("\n**Key Recommendations:**")
-                    for rec in ai_analysis.get("recommendations", []):
-                        report_lines.append(f"- {rec}")
-                    
-                    report_lines.append("\n**Concrete Use Cases:**")
-                    for use_case in ai_analysis.get("use_cases", []):
-                        report_lines.append(f"- {use_case}")
-                    
-                    report_lines.append("\n**Next Steps:**")
-                    for i, step in enumerate(ai_analysis.get("next_steps", []), 1):
-                        report_lines.append(f"{i}. {step}")
-                else:
-                    # Fallback to basic recommendations
-                    basic_recs = generate_basic_recommendations(area, score)
-                    report_lines.append(f"\n### {area} (Score: {score:.2f}/5.00)")
-                    report_lines.append("**Basic Recommendations:**")
-                    for rec in basic_recs:
-                        report_lines.append(f"- {rec}")
-            
-            st.download_button(
-                "📊 Download Report",
-                "\n".join(report_lines).encode("utf-8"),
-                file_name="ai_readiness_report.md",
-                mime="text/markdown",
-                use_container_width=True
-            )
+            # Reports are rendered only when requested, then cached by content
+            report_format = st.selectbox("Report format", list(REPORT_FORMATS), key="report_format", label_visibility="collapsed")
+            content = current_report_content(scores_data)
+            report = get_report_cache().get(content, report_format)
+            if report is None and st.button("📊 Prepare Report", key="prepare_report", use_container_width=True):
+                try:
+                    report = get_report_cache().render(content, report_format)
+                except ValueError as e:
+                    st.error(str(e))
+            if report is not None:
+                extension, mime = REPORT_FORMATS[report_format]
+                st.download_button(
+                    "📊 Download Report",
+                    report,
+                    file_name=f"ai_readiness_report.{extension}",
+                    mime=mime,
+                    use_container_width=True
+                )
     else:
         st.info("📄 Complete assessments to generate downloadable reports")
 
+with tab6:
+    render_results_tab()
+
+# ---------------------- Autosave ----------------------
+# Rating and notes edits are journaled as they happen; a snapshot (which
+# compacts the journal) is written after structural changes, after
+# SNAPSHOT_COMPACT_EVENTS journaled edits, or once SNAPSHOT_DEBOUNCE_SECONDS
+# have passed since the last one. log_edit() runs the same check, as edits
+# only rerun their fragment. A session that joined a shared assessment saves
+# only respondent changes, into the sharing session's snapshot.
+if snapshot_due() and (is_shared_guest() or has_assessment_data() or has_snapshot()):
+    try:
+        save_to_json(force=True)
+    except OSError as e:
+        st.sidebar.warning(f"Autosave failed: {e}")
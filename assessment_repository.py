@@ -0,0 +1,113 @@
+"""SQLite index of saved assessment snapshots"""
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+from snapshot_store import SnapshotStore
+
+
+class AssessmentRepository:
+    """Searchable index of snapshots by company, sector, save time and overall score.
+
+    Rows are upserted whenever a snapshot is written, so browsing and
+    searching are paginated SQL queries that never open the JSON files.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS assessments (
+                name TEXT PRIMARY KEY,
+                company TEXT NOT NULL,
+                sector TEXT NOT NULL,
+                saved_at TEXT NOT NULL,
+                overall_score REAL NOT NULL,
+                respondents INTEGER NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS assessments_saved_at ON assessments (saved_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS assessments_sector ON assessments (sector, saved_at)")
+
+    def upsert(self, name: str, company: str, sector: str, saved_at: str, overall_score: float, respondents: int = 0):
+        """Index (or re-index) one snapshot"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO assessments (name, company, sector, saved_at, overall_score, respondents) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (name, company or "", sector or "", saved_at, overall_score, respondents)
+            )
+
+    def upsert_snapshot(self, name: str, data: Dict):
+        """Index a snapshot from its content"""
+        onboarding = data.get("onboarding", {})
+        self.upsert(
+            name,
+            onboarding.get("Company Name", ""),
+            onboarding.get("Sector", ""),
+            data.get("timestamp", ""),
+            data.get("overall_score", 0.0),
+            len(data.get("people", [])) + len(data.get("leadership", []))
+        )
+
+    def remove(self, name: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM assessments WHERE name = ?", (name,))
+
+    def search(self, query: str = "", sector: Optional[str] = None, limit: int = 10, offset: int = 0) -> List[Dict]:
+        """One page of assessments matching a company substring and sector, newest first"""
+        where, params = self._filters(query, sector)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name, company, sector, saved_at, overall_score, respondents FROM assessments"
+                f"{where} ORDER BY saved_at DESC, name LIMIT ? OFFSET ?",
+                (*params, limit, offset)
+            ).fetchall()
+        columns = ("name", "company", "sector", "saved_at", "overall_score", "respondents")
+        return [dict(zip(columns, row)) for row in rows]
+
+    def count(self, query: str = "", sector: Optional[str] = None) -> int:
+        where, params = self._filters(query, sector)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM assessments{where}", params).fetchone()[0]
+
+    def sectors(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT sector FROM assessments WHERE sector != '' ORDER BY sector").fetchall()
+        return [row[0] for row in rows]
+
+    def sync(self, store: SnapshotStore) -> int:
+        """Index snapshot files missing from the index (e.g. written before it existed); returns how many"""
+        names = {entry[:-len(".json")] for entry in os.listdir(store.directory) if entry.endswith(".json")}
+        with self._lock:
+            indexed = {row[0] for row in self._conn.execute("SELECT name FROM assessments")}
+            self._conn.executemany("DELETE FROM assessments WHERE name = ?", [(name,) for name in indexed - names])
+        added = 0
+        for name in sorted(names - indexed):
+            try:
+                data = store.load(name)
+            except (OSError, ValueError):
+                continue
+            self.upsert_snapshot(name, data)
+            added += 1
+        return added
+
+    @staticmethod
+    def _filters(query: str, sector: Optional[str]):
+        clauses, params = [], []
+        if query:
+            clauses.append("company LIKE ? ESCAPE '\\'")
+            escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            params.append(f"%{escaped}%")
+        if sector:
+            clauses.append("sector = ?")
+            params.append(sector)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), tuple(params)
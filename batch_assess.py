@@ -0,0 +1,144 @@
+"""Headless batch assessment: score saved assessments and write their reports
+
+Reads every assessment snapshot (*.json, as saved by the app) in a directory,
+scores them in a process pool, writes one report per organization and a
+combined summary CSV:
+
+    python batch_assess.py snapshots --output-dir reports --format Markdown --format HTML
+
+Edits the app journaled after a snapshot (events.sqlite3 next to the
+snapshots) are folded in as the app does when reopening it. They are unsaved
+ratings and notes, so scores still come from the saved answers; the summary
+counts them as pending_edits. Recommendations come from the basic
+recommendation tables; AI analysis needs the interactive app.
+"""
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Dict, List, Optional
+
+from event_log import EventLog, apply_events
+from question_bank import MATURITY_BANDS, band_index
+from report import REPORT_FORMATS, render_report, report_content
+from scoring import AREAS, ScoreAggregator
+from snapshot_store import loads, migrate_snapshot
+
+SUMMARY_COLUMNS = (
+    ["assessment", "company", "sector", "saved_at", "respondents", "overall_score", "maturity", "pending_edits"]
+    + [f"{area} {column}" for area in AREAS for column in ("avg", "n")]
+    + ["error"]
+)
+
+
+def snapshot_paths(directory: str) -> List[str]:
+    """Assessment snapshots in a directory (temporary files of in-progress saves are skipped)"""
+    return sorted(
+        os.path.join(directory, entry) for entry in os.listdir(directory)
+        if entry.endswith(".json") and not entry.startswith(".")
+    )
+
+
+@lru_cache(maxsize=None)
+def event_log(directory: str) -> Optional[EventLog]:
+    """The app's edit journal for a snapshot directory, opened once per worker; None if there is none"""
+    path = os.path.join(directory, "events.sqlite3")
+    return EventLog(path) if os.path.exists(path) else None
+
+
+def assess(path: str, output_dir: str, formats: List[str]) -> Dict:
+    """Score one snapshot and write its reports; returns its summary row (with the error, if any)"""
+    name = os.path.basename(path)[:-len(".json")]
+    row = {"assessment": name}
+    try:
+        with open(path, "rb") as f:
+            data = migrate_snapshot(loads(f.read()))
+        journal = event_log(os.path.dirname(os.path.abspath(path)))
+        events = journal.events(name, data.get("event_seq", 0)) if journal is not None else []
+        onboarding = data.get("onboarding", {})
+        if not isinstance(onboarding, dict):
+            raise ValueError("'onboarding' is not an object")
+        for field in ("people", "leadership", "data_readiness", "infrastructure"):
+            items = data.get(field, [])
+            if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+                raise ValueError(f"'{field}' is not a list of objects")
+        apply_events(data, events)
+        people = [survey for survey in data.get("people", []) if survey.get("saved")]
+        leadership = [survey for survey in data.get("leadership", []) if survey.get("saved")]
+        aggregator = ScoreAggregator.from_assessment(
+            data.get("data_readiness", []), data.get("infrastructure", []), people, leadership
+        )
+        overall = aggregator.overall()
+        row.update({
+            "company": onboarding.get("Company Name", ""),
+            "sector": onboarding.get("Sector", ""),
+            "saved_at": data.get("timestamp", ""),
+            "respondents": len(people) + len(leadership),
+            "overall_score": round(overall, 4),
+            "maturity": MATURITY_BANDS[band_index(overall)][0] if aggregator.snapshot() else "",
+            "pending_edits": len(events)
+        })
+        for area in AREAS:
+            stats = aggregator.stats(area)
+            row[f"{area} avg"] = round(stats.mean, 4) if stats.count else ""
+            row[f"{area} n"] = stats.count
+
+        content = report_content(
+            onboarding, aggregator.snapshot(), onboarding.get("onboarding_notes", "").strip(), {}, data.get("timestamp", "")
+        )
+        for report_format in formats:
+            extension, _ = REPORT_FORMATS[report_format]
+            with open(os.path.join(output_dir, f"{name}.{extension}"), "wb") as f:
+                f.write(render_report(content, report_format))
+    except Exception as e:  # one bad snapshot must not abort the whole batch
+        row["error"] = f"{type(e).__name__}: {e}"
+    return row
+
+
+def write_summary(rows: List[Dict], path: str):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_COLUMNS, restval="")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input_dir", nargs="?", default="snapshots", help="directory of saved assessment JSON files")
+    parser.add_argument("--output-dir", default="reports", help="where reports and summary.csv are written")
+    parser.add_argument("--format", dest="formats", action="append", choices=list(REPORT_FORMATS),
+                        help="report format, repeatable (default: Markdown)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--summary", default="summary.csv", help="combined CSV file name, inside the output directory")
+    args = parser.parse_args()
+    formats = args.formats or ["Markdown"]
+    if not os.path.isdir(args.input_dir):
+        parser.error(f"{args.input_dir} is not a directory")
+
+    paths = snapshot_paths(args.input_dir)
+    if not paths:
+        print(f"No assessment snapshots found in {args.input_dir}", file=sys.stderr)
+        return 1
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    started = time.perf_counter()
+    workers = max(1, min(args.workers, len(paths)))
+    # Several snapshots per task keep inter-process overhead low on large batches
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        rows = list(executor.map(partial(assess, output_dir=args.output_dir, formats=formats), paths, chunksize=chunksize))
+
+    write_summary(rows, os.path.join(args.output_dir, args.summary))
+    failed = [row for row in rows if row.get("error")]
+    print(f"Assessed {len(rows) - len(failed)} of {len(rows)} organizations in {time.perf_counter() - started:.1f}s "
+          f"({workers} workers); reports and {args.summary} are in {args.output_dir}")
+    for row in failed:
+        print(f"  {row['assessment']}: {row['error']}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""Startup benchmark for app.py: import time and cold start to first paint, checked against a budget.
+
+Each measurement runs in a fresh interpreter, the way an autoscaled container
+starts: the app is rendered once through Streamlit's AppTest with no API key
+and an empty snapshot directory.
+
+    python bench_startup.py                 # report, exit 1 if over budget
+    python bench_startup.py --runs 5 --cold-start-budget 3
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Budgets in seconds; tighten them when startup gets faster
+COLD_START_BUDGET_SECONDS = 2.5
+IMPORT_BUDGET_SECONDS = 1.0
+
+# Modules app.py imports lazily; rendering an empty assessment must not load them
+LAZY_MODULES = ("openai", "httpx", "pandas", "plotly.graph_objects")
+
+# Written to stderr once the harness is loaded; -X importtime lines before it are not the app's
+APP_START_MARKER = "bench_startup: app start"
+
+CHILD_SCRIPT = """
+import json, sys
+from streamlit.testing.v1 import AppTest
+harness = set(sys.modules)  # AppTest itself pulls in plotly.graph_objects
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+at.secrets["OPENAI_API_KEY"] = ""
+at.secrets["SNAPSHOT_DIR"] = sys.argv[2]
+at.secrets["OPENAI_CACHE_PATH"] = sys.argv[2] + "/llm_cache.sqlite3"
+print(%r, file=sys.stderr, flush=True)
+at.run()
+if at.exception:
+    sys.exit(f"app raised: {at.exception[0].value}")
+print(json.dumps([name for name in sys.argv[3:] if name in sys.modules and name not in harness]))
+""" % APP_START_MARKER
+
+
+def run_app(python_flags: List[str]) -> Tuple[float, subprocess.CompletedProcess]:
+    """Render the app once in a new interpreter; returns the wall time and the finished process"""
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        command = [sys.executable, *python_flags, "-c", CHILD_SCRIPT,
+                   os.path.join(APP_DIR, "app.py"), snapshot_dir, *LAZY_MODULES]
+        started = time.perf_counter()
+        result = subprocess.run(command, cwd=APP_DIR, capture_output=True, text=True)
+        elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        raise RuntimeError(f"cold start failed:\n{result.stderr[-2000:]}")
+    return elapsed, result
+
+
+def import_times(stderr: str) -> Dict[str, float]:
+    """Cumulative seconds per top-level import the app made, from ``python -X importtime`` output.
+
+    Imports before APP_START_MARKER belong to the interpreter and the
+    AppTest harness (streamlit itself included), so they are not counted.
+    """
+    lines = stderr.splitlines()
+    if APP_START_MARKER in lines:
+        lines = lines[lines.index(APP_START_MARKER) + 1:]
+    times = {}
+    for line in lines:
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):  # nested imports are indented under their importer
+            times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3, help="cold starts to time (the median is reported)")
+    parser.add_argument("--cold-start-budget", type=float, default=COLD_START_BUDGET_SECONDS,
+                        help="seconds from process start to the first rendered page")
+    parser.add_argument("--import-budget", type=float, default=IMPORT_BUDGET_SECONDS,
+                        help="seconds the app spends importing modules during a cold start")
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list")
+    args = parser.parse_args()
+
+    _, profiled = run_app(["-X", "importtime"])
+    imports = import_times(profiled.stderr)
+    total_import = sum(imports.values())
+    eager = json.loads(profiled.stdout.strip().splitlines()[-1])
+
+    cold_starts = [run_app([])[0] for _ in range(args.runs)]
+    cold_start = statistics.median(cold_starts)
+
+    print(f"Import time:  {total_import:.2f}s (budget {args.import_budget:.2f}s)")
+    for name, seconds in sorted(imports.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {seconds:7.3f}s  {name}")
+    print(f"Cold start:   {cold_start:.2f}s median of {args.runs} "
+          f"({', '.join(f'{seconds:.2f}' for seconds in cold_starts)}) (budget {args.cold_start_budget:.2f}s)")
+
+    failures = []
+    if total_import > args.import_budget:
+        failures.append(f"import time {total_import:.2f}s is over budget")
+    if cold_start > args.cold_start_budget:
+        failures.append(f"cold start {cold_start:.2f}s is over budget")
+    if eager:
+        failures.append(f"lazily imported modules loaded at startup: {', '.join(eager)}")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
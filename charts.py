@@ -0,0 +1,137 @@
+"""Memoized Plotly figures for the Results tab and exports"""
+import html
+import math
+from functools import lru_cache
+from typing import Iterable, Tuple
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+# ((area, average score), ...) in display order
+RadarScores = Tuple[Tuple[str, float], ...]
+
+ACCENT = "rgba(102, 126, 234, 1)"
+
+
+def radar_key(areas: Iterable[str], scores: Iterable[float]) -> RadarScores:
+    """Hashable cache key for a radar chart of per-area average scores"""
+    return tuple((str(area), float(score)) for area, score in zip(areas, scores))
+
+
+@lru_cache(maxsize=64)
+def radar_figure(scores: RadarScores) -> go.Figure:
+    """Radar chart of per-area average scores, built once per distinct set of scores.
+
+    The figure is shared by every caller (and session) asking for the same
+    scores, so treat it as read-only.
+    """
+    fig = go.Figure()
+
+    # Add the main radar trace
+    fig.add_trace(go.Scatterpolar(
+        r=[score for _, score in scores],
+        theta=[area for area, _ in scores],
+        fill='toself',
+        name='AI Readiness Score',
+        fillcolor='rgba(102, 126, 234, 0.25)',
+        line_color=ACCENT,
+        line_width=3,
+        marker=dict(
+            size=8,
+            color=ACCENT,
+            line=dict(width=2, color='white')
+        ),
+        hovertemplate='<b>%{theta}</b><br>Score: %{r:.2f}/5.0<extra></extra>'
+    ))
+
+    # Enhanced layout for better visibility
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 5],
+                ticktext=['0', '1', '2', '3', '4', '5'],
+                tickvals=[0, 1, 2, 3, 4, 5],
+                tickfont=dict(size=12, color='#4a5568'),
+                gridcolor='rgba(102, 126, 234, 0.2)',
+                linecolor='rgba(102, 126, 234, 0.3)',
+                linewidth=1,
+                showline=True
+            ),
+            angularaxis=dict(
+                tickfont=dict(size=11, color='#2d3748'),
+                gridcolor='rgba(102, 126, 234, 0.15)',
+                linecolor='rgba(102, 126, 234, 0.3)',
+                linewidth=1,
+                showline=True,
+                rotation=0
+            ),
+            bgcolor='rgba(255, 255, 255, 0.8)'
+        ),
+        showlegend=False,
+        height=450,
+        width=500,
+        margin=dict(l=20, r=20, t=30, b=20),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(family="system-ui, -apple-system, Segoe UI, Roboto, Arial, sans-serif"),
+        title=dict(
+            text="",
+            x=0.5,
+            y=0.98,
+            font=dict(size=14, color='#1e3c72'),
+            xanchor='center'
+        )
+    )
+    return fig
+
+
+@lru_cache(maxsize=64)
+def radar_figure_json(scores: RadarScores) -> str:
+    """Serialized radar figure (Plotly JSON), e.g. for embedding in HTML reports"""
+    return pio.to_json(radar_figure(scores), validate=False)
+
+
+@lru_cache(maxsize=16)
+def radar_image(scores: RadarScores, image_format: str = "png", scale: float = 2.0) -> bytes:
+    """Static image of the radar figure; needs the optional kaleido package"""
+    try:
+        import kaleido  # noqa: F401
+    except ImportError:
+        raise ValueError("Exporting charts as images requires kaleido (pip install kaleido)")
+    return pio.to_image(radar_figure(scores), format=image_format, scale=scale)
+
+
+@lru_cache(maxsize=64)
+def radar_svg(scores: RadarScores, size: int = 420) -> str:
+    """Dependency-free SVG version of the radar chart, for offline HTML and PDF reports"""
+    # Extra width leaves room for area labels left and right of the chart
+    width, center_x, center_y, radius = size + 200, size / 2 + 100, size / 2, size / 2 - 60
+    # Same orientation as the Plotly chart: first area at 3 o'clock, counterclockwise
+    angles = [-2 * math.pi * i / len(scores) for i in range(len(scores))]
+
+    def point(angle: float, value: float) -> Tuple[float, float]:
+        return center_x + radius * value / 5 * math.cos(angle), center_y + radius * value / 5 * math.sin(angle)
+
+    def polygon(values: Iterable[float]) -> str:
+        return " ".join("%.1f,%.1f" % point(angle, value) for angle, value in zip(angles, values))
+
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{size}" viewBox="0 0 {width} {size}" '
+             f'font-family="system-ui, -apple-system, Segoe UI, Roboto, Arial, sans-serif" role="img" aria-label="AI readiness radar chart">']
+    for ring in range(1, 6):
+        parts.append(f'<polygon points="{polygon([ring] * len(scores))}" fill="none" stroke="rgba(102, 126, 234, 0.2)"/>')
+    for angle, (area, _) in zip(angles, scores):
+        x, y = point(angle, 5)
+        parts.append(f'<line x1="{center_x}" y1="{center_y}" x2="{x:.1f}" y2="{y:.1f}" stroke="rgba(102, 126, 234, 0.15)"/>')
+        x, y = point(angle, 5.5)
+        anchor = "start" if math.cos(angle) > 0.3 else "end" if math.cos(angle) < -0.3 else "middle"
+        parts.append(f'<text x="{x:.1f}" y="{y:.1f}" text-anchor="{anchor}" dominant-baseline="middle" font-size="11" '
+                     f'fill="#2d3748">{html.escape(area)}</text>')
+    parts.append(f'<polygon points="{polygon(score for _, score in scores)}" '
+                 f'fill="rgba(102, 126, 234, 0.25)" stroke="{ACCENT}" stroke-width="3"/>')
+    for angle, (area, score) in zip(angles, scores):
+        x, y = point(angle, score)
+        parts.append(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="4" fill="{ACCENT}" stroke="white" stroke-width="2">'
+                     f'<title>{html.escape(area)}: {score:.2f}/5.0</title></circle>')
+    parts.append("</svg>")
+    return "".join(parts)
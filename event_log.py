@@ -0,0 +1,105 @@
+"""Append-only journal of answer edits between assessment snapshots"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from question_bank import survey_questions
+
+
+class EventLog:
+    """SQLite (WAL) table of small edit events keyed by assessment and question.
+
+    Each rating or notes edit appends one row, so persisting an edit costs
+    O(change). A snapshot records the last sequence number it includes;
+    compact() then drops the events it covers, and replaying the remaining
+    events on top of the snapshot rebuilds the latest state after a crash.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS events (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                assessment TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                target TEXT NOT NULL,
+                question_id TEXT,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS events_assessment ON events (assessment, seq)")
+
+    def append(self, assessment: str, kind: str, target: str, value: Any, question_id: Optional[str] = None) -> int:
+        """Record one edit and return its sequence number"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO events (assessment, kind, target, question_id, value, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (assessment, kind, target, question_id, json.dumps(value, ensure_ascii=False), time.time())
+            )
+        return cursor.lastrowid
+
+    def events(self, assessment: str, after_seq: int = 0) -> List[Dict]:
+        """Events of an assessment newer than ``after_seq``, oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, kind, target, question_id, value FROM events WHERE assessment = ? AND seq > ? ORDER BY seq",
+                (assessment, after_seq)
+            ).fetchall()
+        return [
+            {"seq": seq, "kind": kind, "target": target, "question_id": question_id, "value": json.loads(value)}
+            for seq, kind, target, question_id, value in rows
+        ]
+
+    def last_seq(self, assessment: str) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(seq) FROM events WHERE assessment = ?", (assessment,)).fetchone()
+        return row[0] or 0
+
+    def compact(self, assessment: str, upto_seq: int):
+        """Drop the events already folded into a snapshot"""
+        with self._lock:
+            self._conn.execute("DELETE FROM events WHERE assessment = ? AND seq <= ?", (assessment, upto_seq))
+
+
+def apply_events(data: Dict, events: List[Dict]) -> Dict:
+    """Fold journaled edits into a snapshot's data, in place; returns ``data``.
+
+    Widget events set the Data Readiness / Infrastructure widget state,
+    rating events the respondent's unsaved draft and notes events the
+    survey's notes, exactly as the app shows them after reopening.
+    """
+    widgets = data.setdefault("widgets", {})
+    surveys = {
+        prefix: {survey["id"]: survey for survey in data.get(prefix, []) if "id" in survey}
+        for prefix in ("people", "leadership")
+    }
+    for event in events:
+        if event["kind"] == "widget":
+            widgets[event["target"]] = event["value"]
+            continue
+        prefix, respondent_id = event["target"].split(":", 1)
+        survey = surveys.get(prefix, {}).get(respondent_id)
+        if survey is None:
+            continue
+        if event["kind"] == "rating":
+            drafts = widgets.setdefault(f"{prefix}_drafts", {})
+            if respondent_id not in drafts:
+                questions = survey_questions(survey.get("type", "Leadership & Strategy"))
+                drafts[respondent_id] = list(survey["scores"]) if survey.get("scores") else [3] * len(questions)
+            drafts[respondent_id][event["value"]["index"]] = event["value"]["score"]
+        elif event["kind"] == "notes":
+            survey["notes"] = event["value"]
+    return data
@@ -0,0 +1,264 @@
+"""JSON helpers for LLM responses"""
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+_CLOSERS = {"{": "}", "[": "]"}
+_PARTIAL_UNICODE_ESCAPE = re.compile(r"\\u[0-9a-fA-F]{0,3}$")
+
+
+class StreamingJSONParser:
+    """Incrementally parse a JSON document while it is still being streamed.
+
+    feed() scans each chunk once, tracking open containers and the last
+    position where the document could be closed cleanly. The received text
+    is only parsed again when that position moves (a value or container
+    ended) or a string value starts; while a string value streams in, just
+    that string is decoded and set into the cached parse, so value() can
+    return the best-effort object for everything received so far with the
+    string's text received so far. Returned values are shared between
+    calls; treat them as read-only.
+    """
+
+    def __init__(self):
+        self._parts: List[str] = []
+        self._length = 0
+        self._start: Optional[int] = None
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_is_key = False
+        self._expect_key = False
+        self._safe_index = 0
+        self._safe_closers = ""
+        # Opening quote of the string being read, and the raw text of a string value read so far
+        self._string_start = 0
+        self._string_parts: List[str] = []
+        # (position, value) of the last parse up to the safe index / with an empty string value at a string start
+        self._safe_value: Tuple[int, Any] = (-1, None)
+        self._string_base: Tuple[int, Any] = (-1, None)
+
+    def feed(self, chunk: str) -> Optional[Any]:
+        """Consume the next chunk of text and return the current partial value"""
+        for offset, char in enumerate(chunk):
+            position = self._length + offset
+            if self._start is None:
+                # Skip any preamble (e.g. a ```json fence) before the document starts
+                if char not in "{[":
+                    continue
+                self._start = position
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if not self._string_is_key:
+                        self._mark_safe(position + 1)
+                continue
+            if char == '"':
+                self._in_string = True
+                self._string_is_key = self._expect_key
+                self._string_start = position
+            elif char in "{[":
+                self._stack.append(char)
+                self._expect_key = char == "{"
+                self._mark_safe(position + 1)
+            elif char in "}]":
+                if self._stack:
+                    self._stack.pop()
+                self._expect_key = False
+                self._mark_safe(position + 1)
+            elif char == ":":
+                self._expect_key = False
+            elif char == ",":
+                self._mark_safe(position)
+                self._expect_key = bool(self._stack) and self._stack[-1] == "{"
+        if self._in_string and not self._string_is_key:
+            opened = self._string_start - self._length
+            if opened >= 0:
+                self._string_parts = [chunk[opened + 1:]]
+            else:
+                self._string_parts.append(chunk)
+        self._parts.append(chunk)
+        self._length += len(chunk)
+        return self.value()
+
+    @property
+    def text(self) -> str:
+        """All text fed so far"""
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+    def value(self, partial_strings: bool = True) -> Optional[Any]:
+        """Best-effort value of the document received so far, or None.
+
+        With ``partial_strings=False`` a string value that was cut off is
+        dropped instead of being returned with the text received so far.
+        """
+        if self._start is None:
+            return None
+        if partial_strings and self._in_string and not self._string_is_key:
+            partial = self._partial_string_value()
+            if partial is not None:
+                return partial
+        if self._safe_value[0] != self._safe_index:
+            self._safe_value = (self._safe_index, self._loads(self.text[self._start:self._safe_index] + self._safe_closers))
+        return self._safe_value[1]
+
+    def _partial_string_value(self) -> Optional[Any]:
+        if self._string_base[0] != self._string_start:
+            text = self.text[self._start:self._string_start] + '""' + self._closers(self._stack)
+            self._string_base = (self._string_start, self._loads(text))
+        base = self._string_base[1]
+        if base is None:
+            return None
+        if len(self._string_parts) > 1:
+            self._string_parts = ["".join(self._string_parts)]
+        partial = self._string_parts[0] if self._string_parts else ""
+        if self._escape:
+            partial = partial[:-1]
+        string = self._loads('"' + _PARTIAL_UNICODE_ESCAPE.sub("", partial) + '"')
+        if string is None:
+            return None
+        return _with_last(base, len(self._stack) - 1, string)
+
+    def _mark_safe(self, index: int):
+        self._safe_index = index
+        self._safe_closers = self._closers(self._stack)
+
+    @staticmethod
+    def _closers(stack: List[str]) -> str:
+        return "".join(_CLOSERS[opener] for opener in reversed(stack))
+
+    @staticmethod
+    def _loads(text: str) -> Optional[Any]:
+        try:
+            return json.loads(text)
+        except ValueError:
+            return None
+
+
+def _with_last(container: Any, depth: int, leaf: Any) -> Any:
+    """Copy of ``container`` whose last item ``depth`` levels down is ``leaf``; only that path is copied"""
+    if isinstance(container, dict):
+        key = next(reversed(container))
+        return {**container, key: leaf if depth == 0 else _with_last(container[key], depth - 1, leaf)}
+    return container[:-1] + [leaf if depth == 0 else _with_last(container[-1], depth - 1, leaf)]
+
+
+def parse_partial_json(text: str, partial_strings: bool = True) -> Optional[Any]:
+    """Parse a possibly truncated JSON document"""
+    parser = StreamingJSONParser()
+    parser.feed(text)
+    return parser.value(partial_strings)
+
+
+# ---------------------- Analysis Schema ----------------------
+ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "recommendations": {"type": "array", "items": {"type": "string"}},
+        "use_cases": {"type": "array", "items": {"type": "string"}},
+        "next_steps": {"type": "array", "items": {"type": "string"}},
+        "priority": {"type": "string", "enum": ["High", "Medium", "Low"]}
+    },
+    "required": ["recommendations", "use_cases", "next_steps", "priority"],
+    "additionalProperties": False
+}
+
+_LIST_FIELDS = ("recommendations", "use_cases", "next_steps")
+_CODE_FENCE = re.compile(r"^\s*```[a-zA-Z]*\s*|\s*```\s*$")
+_TRAILING_COMMA = re.compile(r",(\s*[}\]])")
+
+
+def analysis_response_format(areas: Optional[List[str]] = None) -> Dict:
+    """OpenAI structured-output response_format for one analysis, or one per area"""
+    if areas is None:
+        name, schema = "ai_readiness_analysis", ANALYSIS_SCHEMA
+    else:
+        name = "ai_readiness_analyses"
+        schema = {
+            "type": "object",
+            "properties": {area: ANALYSIS_SCHEMA for area in areas},
+            "required": list(areas),
+            "additionalProperties": False
+        }
+    return {"type": "json_schema", "json_schema": {"name": name, "strict": True, "schema": schema}}
+
+
+def repair_json(text: str) -> Optional[Any]:
+    """Parse an LLM JSON response, fixing common defects locally.
+
+    Handles code fences, prose around the document, trailing commas and
+    output truncated by the token limit. Returns None if nothing parses.
+    """
+    if not text:
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    cleaned = _CODE_FENCE.sub("", text.strip())
+    start = min((i for i in (cleaned.find("{"), cleaned.find("[")) if i >= 0), default=-1)
+    if start < 0:
+        return None
+    end = max(cleaned.rfind("}"), cleaned.rfind("]"))
+    candidate = _TRAILING_COMMA.sub(r"\1", cleaned[start:end + 1] if end > start else cleaned[start:])
+    try:
+        return json.loads(candidate)
+    except ValueError:
+        # Truncated output: close whatever was complete, dropping a cut-off last string
+        return parse_partial_json(_TRAILING_COMMA.sub(r"\1", cleaned[start:]), partial_strings=False)
+
+
+def validate_analysis(analysis: Any) -> List[str]:
+    """Return the schema violations of one area's analysis (empty when valid)"""
+    if not isinstance(analysis, dict):
+        return ["analysis is not a JSON object"]
+    errors = []
+    for field in _LIST_FIELDS:
+        value = analysis.get(field)
+        if not isinstance(value, list) or not value:
+            errors.append(f"{field} must be a non-empty list")
+        elif not all(isinstance(item, str) for item in value):
+            errors.append(f"{field} must only contain strings")
+    if analysis.get("priority") not in ANALYSIS_SCHEMA["properties"]["priority"]["enum"]:
+        errors.append("priority must be High, Medium or Low")
+    return errors
+
+
+def coerce_analysis(analysis: Any) -> Optional[Dict]:
+    """Normalize one area's analysis to the schema, or None if it cannot be repaired"""
+    if not isinstance(analysis, dict):
+        return None
+    result = {}
+    for field in _LIST_FIELDS:
+        value = analysis.get(field)
+        if isinstance(value, str):
+            value = [value]
+        if isinstance(value, list):
+            value = [str(item).strip() for item in value if item is not None and str(item).strip()]
+        result[field] = value
+    result["priority"] = str(analysis.get("priority", "")).strip().capitalize()
+    return result if not validate_analysis(result) else None
+
+
+def load_analysis(text: str) -> Optional[Dict]:
+    """Parse, repair and validate one area's analysis from a model response"""
+    return coerce_analysis(repair_json(text))
+
+
+def load_analyses(text: str, areas: List[str]) -> Dict[str, Dict]:
+    """Parse a batched response keyed by area, keeping only the areas that validate"""
+    document = repair_json(text)
+    if not isinstance(document, dict):
+        return {}
+    analyses = {}
+    for area in areas:
+        analysis = coerce_analysis(document.get(area))
+        if analysis is not None:
+            analyses[area] = analysis
+    return analyses
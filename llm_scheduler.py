@@ -0,0 +1,165 @@
+"""Rate-limit aware scheduler for OpenAI requests"""
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Optional, Tuple
+
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at ``per_minute`` units per minute"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1, timeout: Optional[float] = None) -> bool:
+        """Block until ``amount`` units are available; False if ``timeout`` expires first"""
+        amount = min(float(amount), self.capacity)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return True
+                wait = (amount - self._tokens) / self.rate
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+    def refund(self, amount: float):
+        """Return unused units, e.g. when a request used fewer tokens than estimated"""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + amount)
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class RequestScheduler:
+    """Gate every chat completion through shared rate limits, a concurrency cap and retries.
+
+    One instance is meant to be shared by the whole process, so concurrent
+    Streamlit sessions queue behind the same requests-per-minute and
+    tokens-per-minute budgets instead of all hitting 429s at once. Failed
+    requests are retried with exponential backoff and full jitter, honoring
+    the server's Retry-After header when present.
+    """
+
+    def __init__(self, requests_per_minute: int = 500, tokens_per_minute: int = 30000, max_concurrency: int = 8,
+                 max_retries: int = 5, base_delay: float = 1.0, max_delay: float = 60.0, max_queue_wait: float = 120.0):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_queue_wait = max_queue_wait
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+
+    def call(self, func: Callable[..., Any], *args, estimated_tokens: int = 0,
+             consume: Optional[Callable[[Any], Tuple[Any, Any]]] = None, **kwargs) -> Any:
+        """Run ``func(*args, **kwargs)`` once budget and a concurrency slot are available.
+
+        For streamed responses pass ``consume``: it reads the response while
+        the concurrency slot is still held and returns ``(result, usage)``,
+        with the usage reported by the stream (or None). Only ``result`` is
+        returned, and a stream that fails part-way is retried like a failed
+        request. Either way the unused part of ``estimated_tokens`` goes back
+        to the tokens-per-minute budget.
+        """
+        for attempt in range(self.max_retries + 1):
+            charged = self._acquire(estimated_tokens)
+            response = None
+            try:
+                response = func(*args, **kwargs)
+                if consume is not None:
+                    result, usage = consume(response)
+                else:
+                    result, usage = response, getattr(response, "usage", None)
+            except Exception as e:
+                if response is not None and hasattr(response, "close"):
+                    response.close()  # release the connection of a stream that failed part-way
+                if attempt >= self.max_retries or not is_retryable(e):
+                    raise
+                delay = self._backoff(attempt, retry_after_seconds(e))
+            else:
+                if usage is not None and getattr(usage, "total_tokens", None):
+                    self.tokens.refund(max(0, charged - usage.total_tokens))
+                return result
+            finally:
+                self._slots.release()
+            time.sleep(delay)
+
+    def _acquire(self, estimated_tokens: int) -> float:
+        """Take a request, the token estimate and a concurrency slot; returns the tokens taken.
+
+        Whatever was already taken is handed back if a later wait times out.
+        """
+        tokens = min(float(estimated_tokens), self.tokens.capacity)
+        if not self.requests.acquire(1, self.max_queue_wait):
+            raise TimeoutError("Timed out waiting for OpenAI rate-limit budget")
+        if not self.tokens.acquire(tokens, self.max_queue_wait):
+            self.requests.refund(1)
+            raise TimeoutError("Timed out waiting for OpenAI rate-limit budget")
+        if not self._slots.acquire(timeout=self.max_queue_wait):
+            self.requests.refund(1)
+            self.tokens.refund(tokens)
+            raise TimeoutError("Timed out waiting for a free OpenAI request slot")
+        return tokens
+
+    def _backoff(self, attempt: int, retry_after: Optional[float]) -> float:
+        if retry_after is not None:
+            return min(self.max_delay, retry_after) + random.uniform(0, self.base_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+def estimate_tokens(prompt: str, max_tokens: int) -> int:
+    """Rough token cost of a request as counted against tokens-per-minute limits"""
+    return len(prompt) // 4 + max_tokens
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether a failed request is worth retrying (rate limits, timeouts, 5xx, broken streams)"""
+    import httpx
+    import openai  # only reached once a request has failed, so openai is already loaded
+
+    if getattr(error, "code", None) == "insufficient_quota":
+        return False
+    if isinstance(error, (openai.APIConnectionError, openai.APITimeoutError, httpx.TransportError)):
+        return True
+    if type(error) is openai.APIError:
+        # An error event in the middle of a stream (HTTP errors raise APIStatusError subclasses)
+        return True
+    return getattr(error, "status_code", None) in RETRYABLE_STATUS_CODES
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """Delay requested by the server through Retry-After / retry-after-ms headers"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        value = headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,301 @@
+"""Versioned question bank and basic recommendation tables
+
+Everything here is built once per process at import time, so Streamlit reruns
+only look questions and recommendations up instead of rebuilding them.
+Question IDs are stable: reword a question in place, but never renumber or
+reuse an ID. Bump QUESTION_BANK_VERSION whenever questions change.
+"""
+from typing import Dict, List, NamedTuple, Tuple
+
+QUESTION_BANK_VERSION = "1"
+
+
+class Question(NamedTuple):
+    id: str
+    text: str
+
+
+# ---------------------- Questions ----------------------
+DATA_READINESS_QUESTIONS: Tuple[Question, ...] = (
+    Question("DR01", "An enterprise data catalog exists listing key datasets and owners"),
+    Question("DR02", ">90% of critical data is digitized (vs. paper/PDF only)"),
+    Question("DR03", "Data is centralized or virtually unified (DW/lake, federated catalog)"),
+    Question("DR04", "Key datasets have primary keys/relationships (customer_id, account_id)"),
+    Question("DR05", "Data is timestamped with clear refresh frequencies"),
+    Question("DR06", "Unstructured data (PDFs/emails/audio) is organized/OCR/transcribed"),
+    Question("DR07", "Completeness targets & monitoring exist (missing value thresholds)"),
+    Question("DR08", "Accuracy checks & de-duplication routines run regularly"),
+    Question("DR09", "Consistency rules enforced across systems (types/codes/master data)"),
+    Question("DR10", "Update SLAs are met for intended uses (dashboards/AI)"),
+    Question("DR11", "Validation tests are automated; failures trigger alerts"),
+    Question("DR12", "Modern data platform (warehouse/lakehouse) with scalable storage"),
+    Question("DR13", "Reliable ETL/ELT pipelines (batch/stream) connect source systems"),
+    Question("DR14", "Governed data APIs provide access for apps/AI services"),
+    Question("DR15", "Backups, DR, and versioning are implemented & tested"),
+    Question("DR16", "Cost monitoring for storage/egress/compute guides lifecycle"),
+    Question("DR17", "Business & technical metadata maintained in searchable catalog"),
+    Question("DR18", "Automated lineage shows flow from source to consumption"),
+    Question("DR19", "Semantic layer / data contracts define metrics & schemas"),
+    Question("DR20", "Docs/playbooks exist for dataset usage, refresh, ownership"),
+    Question("DR21", "Data owners/stewards assigned with responsibilities"),
+    Question("DR22", "RBAC/ABAC and audit logs enforced for sensitive data"),
+    Question("DR23", "Sensitive data classified & protected (encryption/key mgmt)"),
+    Question("DR24", "3rd-party & shadow AI data flows inventoried & governed"),
+    Question("DR25", "Incident response & rollback plans exist and are tested"),
+    Question("DR26", "Compliance map (GDPR/CCPA/HIPAA/KYC/AML etc.) exists"),
+    Question("DR27", "Consent mgmt & subject rights implemented"),
+    Question("DR28", "Retention & deletion policies defined & automated where possible"),
+    Question("DR29", "Privacy impact assessments (DPIA) done for new data uses"),
+    Question("DR30", "Regulatory reporting data is accurate, timely, auditable"),
+    Question("DR31", "Vector DB / embeddings layer available for semi/unstructured content"),
+    Question("DR32", "Pipelines for OCR/ASR ingestion, chunking, and enrichment exist"),
+    Question("DR33", "Human feedback loops & labeling used for improvement"),
+    Question("DR34", "Evaluation & observability for drift and model performance exist")
+)
+
+INFRASTRUCTURE_QUESTIONS: Tuple[Question, ...] = (
+    Question("INF01", "Sufficient compute (CPU/GPU) capacity available on-demand"),
+    Question("INF02", "Cloud/hybrid foundations in place with secure networking"),
+    Question("INF03", "Environment isolation & guardrails for AI experimentation"),
+    Question("INF04", "Standardized pipelines for training/eval/deployment (CI/CD)"),
+    Question("INF05", "Model/Prompt registry & versioning"),
+    Question("INF06", "Feature store / vector store operationalized"),
+    Question("INF07", "Secure APIs & connectors to embed AI in workflows"),
+    Question("INF08", "Streaming/batch data pipelines for production use"),
+    Question("INF09", "Eventing/queues for robust orchestration"),
+    Question("INF10", "Monitoring (performance, cost, latency) and alerting exist"),
+    Question("INF11", "SLOs/SLIs for AI services defined and tracked"),
+    Question("INF12", "Incident response runbooks and chaos testing"),
+    Question("INF13", "Secrets mgmt, KMS, egress controls for LLM/RAG patterns"),
+    Question("INF14", "Access controls (RBAC/ABAC) and audit logs enforced"),
+    Question("INF15", "Regular pen-tests and red-teaming for AI systems")
+)
+
+AI_USE_QUESTIONS: Tuple[Question, ...] = (
+    Question("USE01", "General AI literacy (understanding of capabilities/limits)"),
+    Question("USE02", "Have you used any AI tools at work? (1:No → 5:Daily heavy use)"),
+    Question("USE03", "How many distinct AI tools have you tried? (1:0 → 5:5+)"),
+    Question("USE04", "Average time per week using AI tools (1:<30m → 5:5h+)"),
+    Question("USE05", "Did tools measurably help productivity/quality?"),
+    Question("USE06", "Willingness to learn and adopt more AI at work")
+)
+
+AI_BUILD_QUESTIONS: Tuple[Question, ...] = (
+    Question("BLD01", "Understands key terms (AI, ML, LLMs, embeddings, RAG, evals)"),
+    Question("BLD02", "Can build basic prototypes (APIs, Python, notebooks)"),
+    Question("BLD03", "Understands what is needed to build/ship an AI feature (data, evals, guardrails)"),
+    Question("BLD04", "Familiar with vector DBs, prompt versioning, and evaluation basics"),
+    Question("BLD05", "Can integrate AI into an app via secure patterns (auth, logging)"),
+    Question("BLD06", "Willingness to upskill with targeted AI training")
+)
+
+LEADERSHIP_QUESTIONS: Tuple[Question, ...] = (
+    Question("LDR01", "AI is explicitly included in the 3–5 year corporate strategy"),
+    Question("LDR02", "A dedicated senior owner for AI exists (with decision rights)"),
+    Question("LDR03", "Annual budget is allocated for AI initiatives"),
+    Question("LDR04", "Leadership communicates AI vision and expected outcomes"),
+    Question("LDR05", "Use cases are prioritized by ROI/feasibility; KPIs tracked"),
+    Question("LDR06", "Long-term plan to improve operations with AI is defined")
+)
+
+PEOPLE_QUESTIONS: Dict[str, Tuple[Question, ...]] = {
+    "AI Use (End Users)": AI_USE_QUESTIONS,
+    "AI Build (Builders)": AI_BUILD_QUESTIONS
+}
+
+QUESTIONS_BY_ID: Dict[str, Question] = {
+    question.id: question
+    for questions in (DATA_READINESS_QUESTIONS, INFRASTRUCTURE_QUESTIONS, AI_USE_QUESTIONS, AI_BUILD_QUESTIONS, LEADERSHIP_QUESTIONS)
+    for question in questions
+}
+
+
+def survey_questions(group: str) -> Tuple[Question, ...]:
+    """Question list of a survey group: a people survey type or Leadership & Strategy"""
+    if group == "Leadership & Strategy":
+        return LEADERSHIP_QUESTIONS
+    return PEOPLE_QUESTIONS.get(group, AI_BUILD_QUESTIONS)
+
+
+# ---------------------- Recommendations ----------------------
+# Maturity bands: 0 = Foundational (<2), 1 = Developing (<3), 2 = Advanced (<4), 3 = Optimized
+RECOMMENDATIONS: Dict[Tuple[str, int], Tuple[str, ...]] = {
+    ("Data Readiness", 0): (
+        "Create enterprise data inventory, digitize critical records",
+        "Centralize storage (DW/lake), and assign data stewards",
+        "Establish basic data governance framework",
+        "Implement data quality monitoring",
+        "Set up backup and recovery procedures"
+    ),
+    ("Data Readiness", 1): (
+        "Automate ETL/ELT, define DQ rules & monitoring",
+        "Stand up catalog + lineage, and enforce access controls",
+        "Implement data validation and testing",
+        "Establish data retention policies",
+        "Create data documentation standards"
+    ),
+    ("Data Readiness", 2): (
+        "Implement semantic layer, APIs/streaming",
+        "Privacy automation, and dataset feedback loops for AI",
+        "Advanced data quality and monitoring",
+        "Implement data versioning and lineage",
+        "Establish data governance committees"
+    ),
+    ("Data Readiness", 3): (
+        "Optimize cost/performance, enable vector/RAG ingestion at scale",
+        "Formalize observability & lifecycle management",
+        "Advanced analytics and AI-ready data pipelines",
+        "Implement data mesh architecture",
+        "Continuous data governance optimization"
+    ),
+    ("Infrastructure", 0): (
+        "Baseline cloud readiness, provision secure environments",
+        "Pilot GPU/compute with guardrails",
+        "Establish basic security controls",
+        "Set up monitoring and alerting",
+        "Create disaster recovery plan"
+    ),
+    ("Infrastructure", 1): (
+        "Standardize MLOps/LLMOps pipelines, registry, CI/CD",
+        "Implement observability and monitoring",
+        "Establish security best practices",
+        "Create infrastructure as code templates",
+        "Set up cost monitoring and controls"
+    ),
+    ("Infrastructure", 2): (
+        "Scale infra with autoscaling, caching, cost tracking",
+        "Enforce SRE practices and advanced monitoring",
+        "Implement advanced security controls",
+        "Optimize performance and reliability",
+        "Establish infrastructure governance"
+    ),
+    ("Infrastructure", 3): (
+        "Optimize footprints, multi-cloud resilience",
+        "Advanced eval/monitoring stacks",
+        "Implement AI-specific infrastructure patterns",
+        "Continuous optimization and automation",
+        "Advanced security and compliance features"
+    ),
+    ("People - AI Users", 0): (
+        "Launch AI literacy 101, curated tool list",
+        "Safe-use policy; run hands-on clinics",
+        "Basic AI training for all employees",
+        "Create AI usage guidelines",
+        "Establish AI champions program"
+    ),
+    ("People - AI Users", 1): (
+        "Role-based training, internal champions",
+        "Usage playbooks; measure adoption KPIs",
+        "Advanced AI tool training",
+        "Create AI best practices repository",
+        "Implement AI usage tracking"
+    ),
+    ("People - AI Users", 2): (
+        "Advanced prompts/cookbooks per function",
+        "Shared best-practice hub, and office hours",
+        "Specialized AI training by department",
+        "AI productivity measurement",
+        "Cross-functional AI collaboration"
+    ),
+    ("People - AI Users", 3): (
+        "Continuous enablement, certification",
+        "Cross-team CoPs driving measurable productivity gains",
+        "Advanced AI strategy and planning",
+        "AI innovation and experimentation",
+        "AI leadership development"
+    ),
+    ("People - AI Builders", 0): (
+        "Upskill builders on Python, APIs, data basics",
+        "Pair with mentors; start small POCs",
+        "Basic AI/ML training programs",
+        "Create learning paths and resources",
+        "Establish AI development community"
+    ),
+    ("People - AI Builders", 1): (
+        "Train on RAG, evals, vector DBs, and secure patterns",
+        "Create shared templates and frameworks",
+        "Intermediate AI development training",
+        "Implement development best practices",
+        "Create AI development standards"
+    ),
+    ("People - AI Builders", 2): (
+        "Formal SDLC for AI with guardrails",
+        "Model registry, and evaluation frameworks",
+        "Advanced AI development training",
+        "Implement AI development governance",
+        "Create AI development platform"
+    ),
+    ("People - AI Builders", 3): (
+        "Advanced architectures, red-teaming, AB tests",
+        "Platform productization and optimization",
+        "AI development innovation and research",
+        "Advanced AI development methodologies",
+        "AI development leadership and strategy"
+    ),
+    ("Leadership & Strategy", 0): (
+        "Define AI north star, appoint accountable leader",
+        "Allocate seed budget for pilots",
+        "Create basic AI strategy document",
+        "Establish AI governance framework",
+        "Identify initial AI use cases"
+    ),
+    ("Leadership & Strategy", 1): (
+        "Create 12–18m roadmap tied to business OKRs",
+        "Institute steering committee & KPI tracking",
+        "Develop AI investment strategy",
+        "Create AI risk management framework",
+        "Establish AI performance metrics"
+    ),
+    ("Leadership & Strategy", 2): (
+        "Scale portfolio mgmt, fund highest-ROI cases",
+        "Embed AI in BU strategies",
+        "Advanced AI governance and oversight",
+        "Implement AI value measurement",
+        "Create AI innovation programs"
+    ),
+    ("Leadership & Strategy", 3): (
+        "Enterprise-wide AI operating model",
+        "Continuous value realization and governance audits",
+        "AI transformation leadership",
+        "Advanced AI strategy and planning",
+        "AI ecosystem development"
+    )
+}
+
+DEFAULT_RECOMMENDATIONS: Tuple[str, ...] = (
+    "Prioritize gaps by impact/effort; iterate quarterly",
+    "Focus on high-impact, low-effort improvements",
+    "Establish baseline measurements and tracking",
+    "Create improvement roadmap and timeline",
+    "Implement continuous improvement process"
+)
+
+# Maturity band names (with their Results icon) by band_index
+MATURITY_BANDS: Tuple[Tuple[str, str], ...] = (
+    ("Foundational", "🌱"),
+    ("Developing", "🔄"),
+    ("Advanced", "🚀"),
+    ("Optimized", "⭐")
+)
+
+
+def band_index(score: float) -> int:
+    """Maturity band (0-3) of an average score"""
+    if score < 2:
+        return 0
+    elif score < 3:
+        return 1
+    elif score < 4:
+        return 2
+    return 3
+
+
+def maturity_band(score: float) -> str:
+    """Maturity band of an average score as Markdown (bold band name and icon)"""
+    name, icon = MATURITY_BANDS[band_index(score)]
+    return f"**{name}** {icon}"
+
+
+def basic_recommendations(area: str, score: float) -> List[str]:
+    """Precomputed recommendations for an assessment area at a given score"""
+    return list(RECOMMENDATIONS.get((area, band_index(score)), DEFAULT_RECOMMENDATIONS))
@@ -0,0 +1,199 @@
+"""Assessment reports rendered on request as Markdown, self-contained HTML or PDF"""
+import base64
+import html
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from tabulate import tabulate
+
+from question_bank import basic_recommendations, maturity_band
+from snapshot_store import content_digest
+
+# Report format -> (file extension, MIME type)
+REPORT_FORMATS = {
+    "Markdown": ("md", "text/markdown"),
+    "HTML": ("html", "text/html"),
+    "PDF": ("pdf", "application/pdf")
+}
+
+REPORT_CSS = """
+body{font-family:system-ui,-apple-system,'Segoe UI',Roboto,Arial,sans-serif;color:#2d3748;max-width:860px;margin:2rem auto;padding:0 1.5rem;line-height:1.5}
+h1{color:#1e3c72;border-bottom:3px solid #667eea;padding-bottom:.4rem}h2{color:#1e3c72;margin-top:2rem}h3{color:#2a5298;margin-bottom:.3rem}
+table{border-collapse:collapse;width:100%;margin:.75rem 0}th,td{border:1px solid #e2e8f0;padding:.4rem .6rem;text-align:left}th{background:#f7fafc}
+.meta{color:#4a5568}.chart{text-align:center;margin:1rem 0}.chart img{max-width:100%}.note{color:#718096;font-style:italic}
+"""
+
+
+def report_content(onboarding: Dict, scores: List[Dict], comments: str,
+                   analyses: Dict[str, Dict], timestamp: str) -> Dict:
+    """Everything a report shows, as plain data.
+
+    ``scores`` are ScoreAggregator.snapshot() rows; ``analyses`` maps an
+    area to its AI analysis, and areas without one get the basic
+    recommendations for their score.
+    """
+    scores = sorted(scores, key=lambda row: row["Avg Score"], reverse=True)
+    overall = sum(row["Avg Score"] for row in scores) / len(scores) if scores else 0.0
+    areas = []
+    for row in scores:
+        area, score = row["Area"], row["Avg Score"]
+        analysis = analyses.get(area)
+        if analysis:
+            areas.append({
+                "area": area,
+                "score": score,
+                "priority": analysis.get("priority", "Medium"),
+                "recommendations": list(analysis.get("recommendations", [])),
+                "use_cases": list(analysis.get("use_cases", [])),
+                "next_steps": list(analysis.get("next_steps", []))
+            })
+        else:
+            areas.append({"area": area, "score": score, "basic_recommendations": basic_recommendations(area, score)})
+    return {
+        "timestamp": timestamp,
+        "company": onboarding.get("Company Name", "(unspecified)"),
+        "sector": onboarding.get("Sector", "(unspecified)"),
+        "email": onboarding.get("Email", ""),
+        "phone": onboarding.get("Phone", ""),
+        "scores": scores,
+        "overall": overall,
+        "comments": comments,
+        "areas": areas
+    }
+
+
+def summarize_text(text: str, max_sentences: int = 5) -> str:
+    if not text or len(text.strip()) < 50:
+        return text
+    sentences = text.split('.')
+    return '. '.join(sentences[:max_sentences]) + ('.' if len(sentences) > max_sentences else '')
+
+
+def render_markdown(content: Dict) -> str:
+    lines = [
+        "# IB Analytics — AI Readiness Report\n",
+        f"**Company:** {content['company']}  ",
+        f"**Sector:** {content['sector']}  ",
+        f"**Email:** {content['email']}  ",
+        f"**Phone:** {content['phone']}  ",
+        f"**Date:** {content['timestamp']}\n",
+        "## Scores",
+        tabulate(content["scores"], headers="keys", tablefmt="pipe"),
+        f"\n**Overall:** {content['overall']:.2f}/5.00  \n**Maturity:** {maturity_band(content['overall'])}\n",
+        "## AI Summary of Comments",
+        summarize_text(content["comments"], max_sentences=8) or "_No comments provided._",
+        "\n## AI-Powered Recommendations"
+    ]
+    for area in content["areas"]:
+        lines.append(f"\n### {area['area']} (Score: {area['score']:.2f}/5.00)")
+        if "basic_recommendations" in area:
+            lines.append("**Basic Recommendations:**")
+            lines.extend(f"- {rec}" for rec in area["basic_recommendations"])
+            continue
+        lines.append(f"**Priority:** {area['priority']}")
+        lines.append("\n**Key Recommendations:**")
+        lines.extend(f"- {rec}" for rec in area["recommendations"])
+        lines.append("\n**Concrete Use Cases:**")
+        lines.extend(f"- {use_case}" for use_case in area["use_cases"])
+        lines.append("\n**Next Steps:**")
+        lines.extend(f"{i}. {step}" for i, step in enumerate(area["next_steps"], 1))
+    return "\n".join(lines)
+
+
+def radar_html(content: Dict) -> str:
+    """The radar chart as an embedded PNG when kaleido is installed, otherwise as inline SVG"""
+    from charts import radar_image, radar_key, radar_svg
+
+    key = radar_key((row["Area"] for row in content["scores"]), (row["Avg Score"] for row in content["scores"]))
+    try:
+        image = base64.b64encode(radar_image(key)).decode("ascii")
+        return f'<div class="chart"><img alt="AI readiness radar chart" src="data:image/png;base64,{image}"></div>'
+    except ValueError:
+        return f'<div class="chart">{radar_svg(key)}</div>'
+
+
+def render_html(content: Dict) -> str:
+    """Self-contained HTML report: inline styles and chart, no external requests"""
+    e = html.escape
+
+    def list_html(items: List[str], tag: str = "ul") -> str:
+        return f"<{tag}>{''.join(f'<li>{e(item)}</li>' for item in items)}</{tag}>"
+
+    band = maturity_band(content["overall"]).replace("**", "")
+    parts = [
+        "<!DOCTYPE html><html lang=\"en\"><head><meta charset=\"utf-8\">",
+        f"<title>AI Readiness Report — {e(content['company'])}</title><style>{REPORT_CSS}</style></head><body>",
+        "<h1>IB Analytics — AI Readiness Report</h1>",
+        f"<p class=\"meta\"><strong>Company:</strong> {e(content['company'])}<br><strong>Sector:</strong> {e(content['sector'])}<br>"
+        f"<strong>Email:</strong> {e(content['email'])}<br><strong>Phone:</strong> {e(content['phone'])}<br>"
+        f"<strong>Date:</strong> {e(content['timestamp'])}</p>",
+        "<h2>Scores</h2>",
+        tabulate(content["scores"], headers="keys", tablefmt="html", floatfmt=".2f"),
+        f"<p><strong>Overall:</strong> {content['overall']:.2f}/5.00<br><strong>Maturity:</strong> {e(band)}</p>",
+        radar_html(content),
+        "<h2>AI Summary of Comments</h2>",
+        f"<p>{e(summarize_text(content['comments'], max_sentences=8))}</p>" if content["comments"] else "<p class=\"note\">No comments provided.</p>",
+        "<h2>AI-Powered Recommendations</h2>"
+    ]
+    for area in content["areas"]:
+        parts.append(f"<h3>{e(area['area'])} (Score: {area['score']:.2f}/5.00)</h3>")
+        if "basic_recommendations" in area:
+            parts.append(f"<p><strong>Basic Recommendations:</strong></p>{list_html(area['basic_recommendations'])}")
+            continue
+        parts.append(f"<p><strong>Priority:</strong> {e(area['priority'])}</p>")
+        parts.append(f"<p><strong>Key Recommendations:</strong></p>{list_html(area['recommendations'])}")
+        parts.append(f"<p><strong>Concrete Use Cases:</strong></p>{list_html(area['use_cases'])}")
+        parts.append(f"<p><strong>Next Steps:</strong></p>{list_html(area['next_steps'], 'ol')}")
+    parts.append("</body></html>")
+    return "".join(parts)
+
+
+def render_pdf(content: Dict) -> bytes:
+    """PDF report; needs the optional weasyprint package"""
+    try:
+        from weasyprint import HTML
+    except ImportError:
+        raise ValueError("PDF reports require weasyprint (pip install weasyprint); download the HTML report instead")
+    return HTML(string=render_html(content)).write_pdf()
+
+
+def render_report(content: Dict, report_format: str) -> bytes:
+    if report_format == "Markdown":
+        return render_markdown(content).encode("utf-8")
+    if report_format == "HTML":
+        return render_html(content).encode("utf-8")
+    if report_format == "PDF":
+        return render_pdf(content)
+    raise ValueError(f"Unknown report format '{report_format}'")
+
+
+class ReportCache:
+    """Rendered reports keyed by a hash of their content and format.
+
+    The generation timestamp is not part of the key, so re-requesting an
+    unchanged assessment returns the report rendered the first time.
+    """
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._reports: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def render(self, content: Dict, report_format: str) -> bytes:
+        key = (content_digest(content), report_format)
+        with self._lock:
+            if key in self._reports:
+                self._reports.move_to_end(key)
+                return self._reports[key]
+        report = render_report(content, report_format)
+        with self._lock:
+            self._reports[key] = report
+            while len(self._reports) > self.max_entries:
+                self._reports.popitem(last=False)
+        return report
+
+    def get(self, content: Dict, report_format: str) -> Optional[bytes]:
+        """The cached report for this content, without rendering it"""
+        with self._lock:
+            return self._reports.get((content_digest(content), report_format))
@@ -0,0 +1,61 @@
+"""Registry of survey respondents keyed by stable IDs"""
+import uuid
+from typing import Dict, Iterator, List, Optional
+
+
+def new_respondent_id() -> str:
+    return uuid.uuid4().hex
+
+
+class RespondentRegistry:
+    """Insertion-ordered respondents addressed by ID.
+
+    Each respondent is stored exactly once, so aggregating over the
+    registry never double counts, and lookup and removal are O(1)
+    without shifting the position of any other respondent.
+    """
+
+    def __init__(self):
+        self._respondents: Dict[str, Dict] = {}
+
+    @classmethod
+    def from_list(cls, surveys: List[Dict]) -> "RespondentRegistry":
+        """Build a registry from saved survey dicts, assigning IDs to those without one"""
+        registry = cls()
+        for survey in surveys:
+            registry.add(dict(survey))
+        return registry
+
+    def __len__(self) -> int:
+        return len(self._respondents)
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(list(self._respondents.values()))
+
+    def __contains__(self, respondent_id: str) -> bool:
+        return respondent_id in self._respondents
+
+    def add(self, survey: Dict) -> str:
+        """Register a survey (replacing any respondent with the same ID) and return its ID"""
+        survey.setdefault("id", new_respondent_id())
+        self._respondents[survey["id"]] = survey
+        return survey["id"]
+
+    def get(self, respondent_id: str) -> Optional[Dict]:
+        return self._respondents.get(respondent_id)
+
+    def remove(self, respondent_id: str) -> Optional[Dict]:
+        return self._respondents.pop(respondent_id, None)
+
+    def clear(self):
+        self._respondents.clear()
+
+    def ids(self) -> List[str]:
+        return list(self._respondents)
+
+    def saved(self) -> List[Dict]:
+        """Surveys whose ratings have been saved"""
+        return [survey for survey in self._respondents.values() if survey.get("saved") and survey.get("scores")]
+
+    def to_list(self) -> List[Dict]:
+        return list(self._respondents.values())
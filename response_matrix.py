@@ -0,0 +1,132 @@
+"""Columnar store of multi-respondent survey ratings"""
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+RATING_LEVELS = 5
+# Variance of ratings spread uniformly over 1..RATING_LEVELS, the r_wg null distribution
+UNIFORM_VARIANCE = (RATING_LEVELS ** 2 - 1) / 12
+
+
+class ResponseMatrix:
+    """Respondents x questions int8 rating matrix with respondent metadata in parallel arrays.
+
+    Rows are addressed by respondent ID. Storage grows by doubling, and
+    removal moves the last row into the freed slot, so both are O(1) per
+    respondent. Statistics are vectorized over the live rows.
+    """
+
+    def __init__(self, question_ids: Sequence[str], capacity: int = 16):
+        self.question_ids = tuple(question_ids)
+        self._scores = np.zeros((capacity, len(self.question_ids)), dtype=np.int8)
+        self._ids = np.empty(capacity, dtype=object)
+        self._names = np.empty(capacity, dtype=object)
+        self._roles = np.empty(capacity, dtype=object)
+        self._size = 0
+        self._rows: Dict[str, int] = {}
+
+    @classmethod
+    def from_surveys(cls, question_ids: Sequence[str], surveys: List[Dict]) -> "ResponseMatrix":
+        """Build a matrix from survey dicts that have an id and saved scores"""
+        matrix = cls(question_ids, capacity=max(16, len(surveys)))
+        for survey in surveys:
+            if survey.get("scores") and survey.get("id"):
+                matrix.upsert(survey["id"], survey["scores"], survey.get("name", ""), survey.get("role", ""))
+        return matrix
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, respondent_id: str) -> bool:
+        return respondent_id in self._rows
+
+    @property
+    def scores(self) -> np.ndarray:
+        """View of the live rows (respondents x questions)"""
+        return self._scores[:self._size]
+
+    @property
+    def respondent_ids(self) -> np.ndarray:
+        return self._ids[:self._size]
+
+    @property
+    def names(self) -> np.ndarray:
+        return self._names[:self._size]
+
+    @property
+    def roles(self) -> np.ndarray:
+        return self._roles[:self._size]
+
+    def upsert(self, respondent_id: str, scores: Sequence[int], name: str = "", role: str = ""):
+        """Insert or overwrite one respondent's ratings"""
+        if len(scores) != len(self.question_ids):
+            raise ValueError(f"Expected {len(self.question_ids)} ratings, got {len(scores)}")
+        row = self._rows.get(respondent_id)
+        if row is None:
+            if self._size == len(self._ids):
+                self._grow()
+            row = self._size
+            self._size += 1
+            self._rows[respondent_id] = row
+            self._ids[row] = respondent_id
+        self._scores[row] = scores
+        self._names[row] = name
+        self._roles[row] = role
+
+    def remove(self, respondent_id: str):
+        """Drop a respondent, moving the last row into its slot"""
+        row = self._rows.pop(respondent_id, None)
+        if row is None:
+            return
+        last = self._size - 1
+        if row != last:
+            self._scores[row] = self._scores[last]
+            self._ids[row] = self._ids[last]
+            self._names[row] = self._names[last]
+            self._roles[row] = self._roles[last]
+            self._rows[self._ids[row]] = row
+        self._ids[last] = self._names[last] = self._roles[last] = None
+        self._size = last
+
+    def question_means(self) -> np.ndarray:
+        return self.scores.mean(axis=0) if self._size else np.zeros(len(self.question_ids))
+
+    def question_stds(self) -> np.ndarray:
+        return self.scores.std(axis=0) if self._size else np.zeros(len(self.question_ids))
+
+    def question_percentiles(self, percentiles: Sequence[float] = (25, 50, 75)) -> np.ndarray:
+        """Array of shape (len(percentiles), questions)"""
+        if not self._size:
+            return np.zeros((len(percentiles), len(self.question_ids)))
+        return np.percentile(self.scores, percentiles, axis=0)
+
+    def agreement(self) -> np.ndarray:
+        """Inter-respondent agreement per question (r_wg: 1 = full agreement, 0 = uniform spread)"""
+        if self._size < 2:
+            return np.ones(len(self.question_ids)) if self._size else np.zeros(len(self.question_ids))
+        variance = self.scores.var(axis=0, ddof=1)
+        return np.clip(1 - variance / UNIFORM_VARIANCE, 0.0, 1.0)
+
+    def question_summary(self, question_texts: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """Column-oriented per-question statistics, ready for pd.DataFrame"""
+        p25, median, p75 = self.question_percentiles()
+        return {
+            "Question": np.asarray(question_texts if question_texts is not None else self.question_ids, dtype=object),
+            "Mean": self.question_means(),
+            "Std Dev": self.question_stds(),
+            "P25": p25,
+            "Median": median,
+            "P75": p75,
+            "Agreement": self.agreement(),
+            "N": np.full(len(self.question_ids), self._size)
+        }
+
+    def _grow(self):
+        capacity = max(16, 2 * len(self._ids))
+        scores = np.zeros((capacity, len(self.question_ids)), dtype=np.int8)
+        scores[:self._size] = self.scores
+        self._scores = scores
+        for attr in ("_ids", "_names", "_roles"):
+            column = np.empty(capacity, dtype=object)
+            column[:self._size] = getattr(self, attr)[:self._size]
+            setattr(self, attr, column)
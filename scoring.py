@@ -0,0 +1,117 @@
+"""Incremental score aggregation for the assessment areas"""
+import math
+from typing import Dict, Iterable, List
+
+AREAS = ["Data Readiness", "Infrastructure", "People - AI Users", "People - AI Builders", "Leadership & Strategy"]
+
+# Respondent survey type -> Results area
+PEOPLE_AREAS = {
+    "AI Use (End Users)": "People - AI Users",
+    "AI Build (Builders)": "People - AI Builders"
+}
+
+
+def people_area(survey_type: str) -> str:
+    """Results area a people survey contributes to"""
+    return PEOPLE_AREAS.get(survey_type, "People - AI Builders")
+
+
+class AreaStats:
+    """Running count, sum and sum of squares of one area's scores"""
+
+    __slots__ = ("count", "total", "total_sq")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.total_sq = 0
+
+    def add(self, scores: Iterable[int]):
+        for score in scores:
+            self.count += 1
+            self.total += score
+            self.total_sq += score * score
+
+    def remove(self, scores: Iterable[int]):
+        for score in scores:
+            self.count -= 1
+            self.total -= score
+            self.total_sq -= score * score
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        if not self.count:
+            return 0.0
+        return math.sqrt(max(0.0, self.total_sq / self.count - self.mean ** 2))
+
+
+class ScoreAggregator:
+    """Per-area aggregates updated as answers are saved or removed.
+
+    Callers report each change (add / remove / replace), so reading the
+    results is O(number of areas) however many respondents there are.
+    """
+
+    def __init__(self):
+        self._areas: Dict[str, AreaStats] = {area: AreaStats() for area in AREAS}
+
+    @classmethod
+    def from_assessment(cls, data_readiness: List[Dict], infrastructure: List[Dict],
+                        people: List[Dict], leadership: List[Dict]) -> "ScoreAggregator":
+        """Build an aggregator from saved answer and survey lists"""
+        aggregator = cls()
+        aggregator.add("Data Readiness", [item["score"] for item in data_readiness])
+        aggregator.add("Infrastructure", [item["score"] for item in infrastructure])
+        for survey in people:
+            if survey.get("scores"):
+                aggregator.add(people_area(survey["type"]), survey["scores"])
+        for survey in leadership:
+            if survey.get("scores"):
+                aggregator.add("Leadership & Strategy", survey["scores"])
+        return aggregator
+
+    @classmethod
+    def combined(cls, *aggregators: "ScoreAggregator") -> "ScoreAggregator":
+        """New aggregator holding every score of the given aggregators (e.g. section and respondent aggregates)"""
+        combined = cls()
+        for aggregator in aggregators:
+            for area, stats in aggregator._areas.items():
+                target = combined._areas.setdefault(area, AreaStats())
+                target.count += stats.count
+                target.total += stats.total
+                target.total_sq += stats.total_sq
+        return combined
+
+    def add(self, area: str, scores: Iterable[int]):
+        self._areas.setdefault(area, AreaStats()).add(scores)
+
+    def remove(self, area: str, scores: Iterable[int]):
+        self._areas[area].remove(scores)
+
+    def replace(self, area: str, scores: Iterable[int]):
+        """Replace every score of an area (e.g. a re-saved Data Readiness section)"""
+        self._areas[area] = AreaStats()
+        self._areas[area].add(scores)
+
+    def clear(self, area: str):
+        self._areas[area] = AreaStats()
+
+    def stats(self, area: str) -> AreaStats:
+        return self._areas.get(area, AreaStats())
+
+    def overall(self) -> float:
+        """Unweighted mean of the assessed areas' averages (the Results "Overall Score")"""
+        means = [stats.mean for stats in self._areas.values() if stats.count]
+        return sum(means) / len(means) if means else 0.0
+
+    def snapshot(self) -> List[Dict]:
+        """Rows for every area with at least one score, in Results order"""
+        return [
+            {"Area": area, "Avg Score": stats.mean, "Count": stats.count, "Std Dev": stats.std}
+            for area, stats in self._areas.items()
+            if stats.count
+        ]
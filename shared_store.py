@@ -0,0 +1,86 @@
+"""Process-level assessment state shared by concurrent sessions"""
+import secrets
+import threading
+import weakref
+from typing import Dict, Optional
+
+from respondents import RespondentRegistry
+from scoring import ScoreAggregator
+
+
+class VersionConflict(Exception):
+    """A respondent was changed by another session after this session read it"""
+
+
+class SharedAssessment:
+    """Respondents and their live aggregates, shared by every session that joined an assessment.
+
+    Sessions bind these objects into their session state instead of
+    copying them, so the Results tab of every session reads the same
+    People and Leadership aggregates; onboarding and section answers stay
+    in each session. Mutations happen under ``lock`` and bump ``version``;
+    respondent saves use optimistic versioning through check_version().
+    ``code`` is the random token other sessions join with, and ``closed`` is
+    set once the sharing session stops sharing.
+
+    ``owner_snapshot`` is the sharing session's last saved snapshot, so any
+    session that changes respondents can persist them on top of it (under
+    ``snapshot_name``) without waiting for the sharing session to rerun.
+    ``saved_version`` is the version the snapshot on disk includes.
+    """
+
+    def __init__(self, people: RespondentRegistry, leadership: RespondentRegistry,
+                 respondent_aggregator: ScoreAggregator, response_matrices: Dict):
+        self.code = secrets.token_urlsafe(12)
+        self.people = people
+        self.leadership = leadership
+        self.respondent_aggregator = respondent_aggregator
+        self.response_matrices = response_matrices
+        self.lock = threading.RLock()
+        self.closed = False
+        self.version = 0
+        self.saved_version = 0
+        self.snapshot_name: Optional[str] = None
+        self.owner_snapshot: Optional[Dict] = None
+
+    def changed(self):
+        """Record a respondent change; call with ``lock`` held"""
+        self.version += 1
+
+    @property
+    def unsaved(self) -> bool:
+        return self.version != self.saved_version
+
+    @staticmethod
+    def check_version(survey: Dict, expected_version: int):
+        """Raise VersionConflict unless ``survey`` is still at the version the caller read"""
+        if survey.get("version", 0) != expected_version:
+            raise VersionConflict(f"{survey.get('name', 'This respondent')}'s survey was changed in another session")
+
+
+class SharedAssessmentStore:
+    """Registry of shared assessments by share code.
+
+    Entries are weakly referenced: an assessment disappears once no
+    session holds it any more.
+    """
+
+    def __init__(self):
+        self._assessments: "weakref.WeakValueDictionary[str, SharedAssessment]" = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def share(self, assessment: SharedAssessment) -> SharedAssessment:
+        """Publish ``assessment`` under its share code"""
+        with self._lock:
+            self._assessments[assessment.code] = assessment
+        return assessment
+
+    def get(self, code: str) -> Optional[SharedAssessment]:
+        with self._lock:
+            return self._assessments.get(code)
+
+    def close(self, assessment: SharedAssessment):
+        """Stop sharing: nobody can join any more, and joined sessions detach on their next run"""
+        with self._lock:
+            assessment.closed = True
+            self._assessments.pop(assessment.code, None)
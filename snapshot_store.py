@@ -0,0 +1,108 @@
+"""Atomic on-disk snapshots of assessment sessions"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is the fallback
+    orjson = None
+
+# 1: the unversioned files written by the original save_to_json
+# 2: adds schema_version and the widget state needed to render a reopened assessment
+SNAPSHOT_SCHEMA_VERSION = 2
+
+
+def dumps(data: Dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(raw: bytes) -> Dict:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def content_digest(data: Dict) -> str:
+    """Hash of a snapshot's content, ignoring when it was written and its journal position"""
+    content = {key: value for key, value in data.items() if key not in ("timestamp", "schema_version", "event_seq")}
+    return hashlib.sha256(dumps(content)).hexdigest()
+
+
+def migrate_snapshot(data: Dict) -> Dict:
+    """Bring a snapshot of any known schema version up to SNAPSHOT_SCHEMA_VERSION"""
+    if not isinstance(data, dict):
+        raise ValueError(f"Snapshot is a JSON {type(data).__name__}, not an object")
+    version = data.get("schema_version", 1)
+    if version > SNAPSHOT_SCHEMA_VERSION:
+        raise ValueError(f"Snapshot schema version {version} is newer than this app supports ({SNAPSHOT_SCHEMA_VERSION})")
+    if version < 2:
+        data = {**data, "widgets": data.get("widgets", {})}
+    data["schema_version"] = SNAPSHOT_SCHEMA_VERSION
+    return data
+
+
+class SnapshotStore:
+    """Directory of JSON snapshots written atomically, with write debouncing.
+
+    save() skips the write when the content is unchanged since the last
+    save under that name, and otherwise writes at most once per
+    ``debounce_seconds`` unless forced. Files are written to a temporary
+    file in the same directory and renamed into place, so a crash never
+    leaves a half-written snapshot.
+    """
+
+    def __init__(self, directory: str, debounce_seconds: float = 5.0):
+        self.directory = directory
+        self.debounce_seconds = debounce_seconds
+        self._digests: Dict[str, str] = {}
+        self._saved_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.json")
+
+    def save(self, name: str, data: Dict, force: bool = False) -> Optional[str]:
+        """Write ``data`` as snapshot ``name``; returns the path, or None if the write was skipped"""
+        digest = content_digest(data)
+        now = time.monotonic()
+        with self._lock:
+            if digest == self._digests.get(name):
+                return None
+            if not force and now - self._saved_at.get(name, float("-inf")) < self.debounce_seconds:
+                return None
+            path = self.path(name)
+            payload = dumps({**data, "schema_version": SNAPSHOT_SCHEMA_VERSION})
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{name}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+            self._digests[name] = digest
+            self._saved_at[name] = now
+        return path
+
+    def load(self, name: str) -> Dict:
+        """Read and migrate snapshot ``name``"""
+        with open(self.path(name), "rb") as f:
+            data = migrate_snapshot(loads(f.read()))
+        with self._lock:
+            self._digests[name] = content_digest(data)
+        return data
+
+    def list(self) -> List[str]:
+        """Snapshot names, most recently written first"""
+        entries = [entry for entry in os.scandir(self.directory) if entry.name.endswith(".json") and entry.is_file()]
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        return [entry.name[:-len(".json")] for entry in entries]
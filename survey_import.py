@@ -0,0 +1,115 @@
+"""Bulk import of People and Leadership survey responses from CSV / Excel"""
+import io
+import os
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from question_bank import LEADERSHIP_QUESTIONS, PEOPLE_QUESTIONS
+from respondents import new_respondent_id
+
+LEADERSHIP_GROUP = "Leadership & Strategy"
+
+QUESTION_COUNTS = {**{survey_type: len(questions) for survey_type, questions in PEOPLE_QUESTIONS.items()},
+                   LEADERSHIP_GROUP: len(LEADERSHIP_QUESTIONS)}
+QUESTION_COLUMNS = [f"q{i + 1}" for i in range(max(QUESTION_COUNTS.values()))]
+REQUIRED_COLUMNS = ["name", "role", "type"] + QUESTION_COLUMNS
+
+# Accepted spellings of the type column -> survey group
+TYPE_ALIASES = {
+    "ai use (end users)": "AI Use (End Users)",
+    "ai use": "AI Use (End Users)",
+    "end user": "AI Use (End Users)",
+    "end users": "AI Use (End Users)",
+    "ai build (builders)": "AI Build (Builders)",
+    "ai build": "AI Build (Builders)",
+    "builder": "AI Build (Builders)",
+    "builders": "AI Build (Builders)",
+    "leadership & strategy": LEADERSHIP_GROUP,
+    "leadership": LEADERSHIP_GROUP,
+    "leader": LEADERSHIP_GROUP
+}
+
+
+def read_responses(data: bytes, filename: str) -> pd.DataFrame:
+    """Read an uploaded CSV or XLSX file; XLSX needs the optional openpyxl package"""
+    extension = os.path.splitext(filename)[1].lower()
+    if extension in (".xlsx", ".xlsm"):
+        try:
+            import openpyxl  # noqa: F401
+        except ImportError:
+            raise ValueError("Reading Excel files requires openpyxl (pip install openpyxl); upload a CSV instead")
+        df = pd.read_excel(io.BytesIO(data), dtype=str)
+    elif extension == ".csv":
+        df = pd.read_csv(io.BytesIO(data), dtype=str, skipinitialspace=True)
+    else:
+        raise ValueError(f"Unsupported file type '{extension}'; upload a .csv or .xlsx file")
+    df.columns = [str(column).strip().lower() for column in df.columns]
+    return df
+
+
+def validate_responses(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Split rows into valid responses and a per-row error report.
+
+    Every check is a vectorized mask over the whole frame. The valid frame
+    has normalized name/role/notes, a ``group`` column and int8 ratings;
+    the report has the file row number and every problem found in it.
+    """
+    missing = [column for column in REQUIRED_COLUMNS if column not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+    text = df[["name", "role", "type"]].fillna("").apply(lambda column: column.str.strip())
+    group = text["type"].str.lower().map(TYPE_ALIASES)
+    expected = group.map(QUESTION_COUNTS).fillna(0).to_numpy()[:, None]
+
+    ratings = df[QUESTION_COLUMNS].apply(pd.to_numeric, errors="coerce")
+    values = ratings.to_numpy(dtype=float)
+    in_use = np.arange(len(QUESTION_COLUMNS))[None, :] < expected
+    bad = in_use & (np.isnan(values) | (values < 1) | (values > 5) | (np.mod(values, 1) != 0))
+
+    checks = [(text["name"].eq("").to_numpy(), "name is empty"),
+              (text["role"].eq("").to_numpy(), "role is empty"),
+              (group.isna().to_numpy(), "type must be AI Use, AI Build or Leadership")]
+    checks += [(bad[:, i], f"{column} must be a whole number from 1 to 5") for i, column in enumerate(QUESTION_COLUMNS)]
+
+    row_numbers = np.arange(len(df)) + 2  # header is file row 1
+    errors = pd.DataFrame(
+        [(row, message) for mask, message in checks for row in row_numbers[mask]],
+        columns=["Row", "Error"]
+    )
+    if not errors.empty:
+        errors = errors.groupby("Row", sort=True)["Error"].agg("; ".join).reset_index()
+
+    invalid = np.zeros(len(df), dtype=bool)
+    for mask, _ in checks:
+        invalid |= mask
+    valid = pd.DataFrame({
+        "name": text["name"],
+        "role": text["role"],
+        "group": group,
+        "notes": df["notes"].fillna("").str.strip() if "notes" in df.columns else ""
+    })[~invalid]
+    valid[QUESTION_COLUMNS] = np.nan_to_num(values[~invalid]).astype(np.int8)
+    return valid, errors
+
+
+def to_surveys(valid: pd.DataFrame) -> Dict[str, List[Dict]]:
+    """Saved survey dicts per survey group, ready for the respondent registries"""
+    surveys: Dict[str, List[Dict]] = {}
+    for group, rows in valid.groupby("group", sort=False):
+        scores = rows[QUESTION_COLUMNS[:QUESTION_COUNTS[group]]].to_numpy().tolist()
+        surveys[group] = [
+            {
+                "id": new_respondent_id(),
+                "name": name,
+                "role": role,
+                **({"type": group} if group != LEADERSHIP_GROUP else {}),
+                "scores": row_scores,
+                "notes": notes,
+                "saved": True
+            }
+            for name, role, notes, row_scores in zip(rows["name"], rows["role"], rows["notes"], scores)
+        ]
+    return surveys
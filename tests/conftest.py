@@ -0,0 +1,145 @@
+"""Shared fixtures; the app's modules live flat in the repository root"""
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    """Minimal OpenAI-compatible /chat/completions endpoint.
+
+    Each request pops the next scripted reply from the server's ``replies``
+    list: ("json", body), ("status", code, headers) or ("stream", chunks,
+    break_after) where a stream is cut off after ``break_after`` chunks.
+    Once the list is empty, ``respond(request_body)`` makes the reply.
+    Requests are held for ``delay`` seconds; ``peak`` is the most requests
+    that were in flight at once.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.active += 1
+            self.server.peak = max(self.server.peak, self.server.active)
+            reply = self.server.replies.pop(0) if self.server.replies else self.server.respond(request)
+        try:
+            time.sleep(self.server.delay)
+            self._reply(reply)
+        finally:
+            with self.server.lock:
+                self.server.active -= 1
+
+    def _reply(self, reply):
+        if reply[0] == "status":
+            body = json.dumps({"error": {"message": "scripted failure", "type": "server_error"}}).encode()
+            self.send_response(reply[1])
+            for name, value in reply[2].items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif reply[0] == "json":
+            body = json.dumps(reply[1]).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            _, chunks, break_after = reply
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for i, chunk in enumerate(chunks):
+                if break_after is not None and i == break_after:
+                    # Drop the connection in the middle of the chunked body
+                    self.wfile.flush()
+                    self.close_connection = True
+                    return
+                self._write_chunk(f"data: {json.dumps(chunk)}\n\n")
+            self._write_chunk("data: [DONE]\n\n")
+            self.wfile.write(b"0\r\n\r\n")
+
+    def _write_chunk(self, text: str):
+        data = text.encode()
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+
+def completion(content: str, finish_reason: str = "stop"):
+    """A non-streamed chat.completion body"""
+    return {
+        "id": "chatcmpl-test", "object": "chat.completion", "created": 0, "model": "fake",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": finish_reason}],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+    }
+
+
+def completion_chunk(content=None, finish_reason=None):
+    """One chat.completion.chunk event"""
+    return {
+        "id": "chatcmpl-test", "object": "chat.completion.chunk", "created": 0, "model": "fake",
+        "choices": [{"index": 0, "delta": {"content": content} if content is not None else {},
+                     "finish_reason": finish_reason}]
+    }
+
+
+@pytest.fixture
+def fake_openai():
+    """A running fake server; script it through ``server.replies``"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOpenAIHandler)
+    server.replies = []
+    server.respond = lambda request: ("status", 500, {})
+    server.delay = 0.0
+    server.lock = threading.Lock()
+    server.requests = server.active = server.peak = 0
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def app_test(tmp_path):
+    """Factory for an AppTest of app.py whose snapshots, journal and caches live in tmp_path"""
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    # Stores are process-wide st.cache_resource singletons; start each test with fresh ones
+    st.cache_resource.clear()
+
+    def make(api_key: str = "", **secrets):
+        at = AppTest.from_file(os.path.join(APP_DIR, "app.py"), default_timeout=60)
+        at.secrets["OPENAI_API_KEY"] = api_key
+        at.secrets["SNAPSHOT_DIR"] = str(tmp_path / "snapshots")
+        at.secrets["OPENAI_CACHE_PATH"] = str(tmp_path / "llm_cache.sqlite3")
+        for name, value in secrets.items():
+            at.secrets[name] = value
+        return at
+
+    return make
+
+
+def add_people(at, *names):
+    """Add People respondents through the Add Respondent Survey form"""
+    for name in names:
+        at.text_input(key="new_people_name").input(name)
+        at.text_input(key="new_people_role").input("Analyst")
+        at.button(key="add_people_survey").click().run()
@@ -0,0 +1,54 @@
+from assessment_repository import AssessmentRepository
+from snapshot_store import SnapshotStore
+
+
+def repository(tmp_path) -> AssessmentRepository:
+    repo = AssessmentRepository(str(tmp_path / "index.sqlite3"))
+    for i in range(25):
+        sector = "Banking/Finance" if i % 2 else "Healthcare"
+        repo.upsert(f"a{i:02d}", f"Company {i:02d}", sector, f"2026-01-{i + 1:02d}T10:00:00", i / 10, i)
+    return repo
+
+
+def test_search_pages_newest_first(tmp_path):
+    repo = repository(tmp_path)
+    first = repo.search(limit=10)
+    assert [row["name"] for row in first] == [f"a{i:02d}" for i in range(24, 14, -1)]
+    last = repo.search(limit=10, offset=20)
+    assert [row["name"] for row in last] == ["a04", "a03", "a02", "a01", "a00"]
+    assert repo.count() == 25
+    assert first[0] == {"name": "a24", "company": "Company 24", "sector": "Healthcare",
+                        "saved_at": "2026-01-25T10:00:00", "overall_score": 2.4, "respondents": 24}
+
+
+def test_search_filters_by_company_and_sector(tmp_path):
+    repo = repository(tmp_path)
+    assert [row["name"] for row in repo.search("company 1", limit=100)] == [f"a{i}" for i in range(19, 9, -1)]
+    assert repo.count("Company 1", "Banking/Finance") == 5
+    assert repo.sectors() == ["Banking/Finance", "Healthcare"]
+    # LIKE wildcards in the query are matched literally
+    assert repo.count("%") == 0
+    repo.upsert("odd", "100%_Data", "", "2026-02-01T00:00:00", 1.0)
+    assert [row["name"] for row in repo.search("0%_")] == ["odd"]
+
+
+def test_upsert_replaces_and_remove(tmp_path):
+    repo = repository(tmp_path)
+    repo.upsert("a00", "Renamed", "Retail", "2026-03-01T00:00:00", 4.5)
+    assert repo.search(limit=1)[0]["company"] == "Renamed"
+    assert repo.count() == 25
+    repo.remove("a00")
+    assert repo.count("Renamed") == 0
+
+
+def test_sync_indexes_existing_snapshots(tmp_path):
+    store = SnapshotStore(str(tmp_path / "snapshots"))
+    store.save("kept", {"onboarding": {"Company Name": "Acme", "Sector": "Retail"}, "timestamp": "2026-01-01",
+                        "overall_score": 3.5, "people": [{}, {}], "leadership": [{}]})
+    (tmp_path / "snapshots" / "broken.json").write_text("{not json")
+    repo = AssessmentRepository(str(tmp_path / "index.sqlite3"))
+    repo.upsert("deleted", "Gone", "", "2025-01-01", 0.0)
+
+    assert repo.sync(store) == 1
+    assert repo.search() == [{"name": "kept", "company": "Acme", "sector": "Retail", "saved_at": "2026-01-01",
+                              "overall_score": 3.5, "respondents": 3}]
@@ -0,0 +1,79 @@
+import csv
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from batch_assess import assess
+from conftest import APP_DIR
+from event_log import EventLog
+
+SNAPSHOT = {
+    "schema_version": 2, "timestamp": "2026-01-01T10:00:00",
+    "onboarding": {"Company Name": "Acme", "Sector": "Retail"},
+    "data_readiness": [{"question": "q", "score": 4}], "infrastructure": [{"question": "q", "score": 2}],
+    "people": [{"id": "p1", "name": "Ann", "type": "AI User", "scores": [5, 5], "saved": True},
+               {"name": "Bob", "type": "AI User", "scores": [1, 1]}],
+    "leadership": []
+}
+
+
+def write(directory, name, body):
+    path = directory / f"{name}.json"
+    path.write_text(body if isinstance(body, str) else json.dumps(body))
+    return str(path)
+
+
+def test_assess_scores_saved_surveys_and_writes_reports(tmp_path):
+    row = assess(write(tmp_path, "acme", SNAPSHOT), str(tmp_path), ["Markdown", "HTML"])
+    assert "error" not in row and row["pending_edits"] == 0
+    assert not (tmp_path / "events.sqlite3").exists()
+    assert row["company"] == "Acme" and row["respondents"] == 1
+    assert row["overall_score"] == round((4 + 2 + 5) / 3, 4)
+    assert (tmp_path / "acme.md").exists() and (tmp_path / "acme.html").exists()
+
+
+def test_assess_replays_the_journal_after_the_snapshot(tmp_path):
+    journal = EventLog(str(tmp_path / "events.sqlite3"))
+    journal.append("acme", "notes", "people:p1", "folded in before the snapshot")
+    journal.append("acme", "notes", "people:p1", "newer notes")
+    journal.append("acme", "rating", "people:p1", {"index": 0, "score": 1})
+    journal.append("other", "notes", "people:p1", "another assessment")
+    snapshot = {**SNAPSHOT, "event_seq": 1}
+    row = assess(write(tmp_path, "acme", snapshot), str(tmp_path), ["Markdown"])
+    assert row["pending_edits"] == 2
+    # Journaled ratings are unsaved drafts and do not change the scores
+    assert row["overall_score"] == round((4 + 2 + 5) / 3, 4)
+
+
+@pytest.mark.parametrize("body, error", [
+    ("[1, 2]", "ValueError: Snapshot is a JSON list"),
+    ({**SNAPSHOT, "onboarding": None}, "ValueError: 'onboarding' is not an object"),
+    ({**SNAPSHOT, "people": [None]}, "ValueError: 'people' is not a list of objects"),
+    ("{not json", "JSONDecodeError"),
+])
+def test_malformed_snapshots_get_an_error_row(tmp_path, body, error):
+    row = assess(write(tmp_path, "bad", body), str(tmp_path), ["Markdown"])
+    assert error in row["error"]
+    assert not (tmp_path / "bad.md").exists()
+
+
+def test_batch_run_survives_malformed_snapshots(tmp_path):
+    snapshots = tmp_path / "snapshots"
+    snapshots.mkdir()
+    write(snapshots, "acme", SNAPSHOT)
+    write(snapshots, "list", "[]")
+    write(snapshots, "null_onboarding", {**SNAPSHOT, "onboarding": None})
+    result = subprocess.run(
+        [sys.executable, os.path.join(APP_DIR, "batch_assess.py"), str(snapshots),
+         "--output-dir", str(tmp_path / "reports"), "--workers", "2"],
+        capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 1
+    with open(tmp_path / "reports" / "summary.csv", newline="") as f:
+        rows = {row["assessment"]: row for row in csv.DictReader(f)}
+    assert rows["acme"]["error"] == "" and rows["acme"]["company"] == "Acme"
+    assert rows["list"]["error"] and rows["null_onboarding"]["error"]
+    assert "Assessed 1 of 3 organizations" in result.stdout
@@ -0,0 +1,46 @@
+import json
+
+from conftest import completion, completion_chunk
+
+ANALYSIS = {"recommendations": ["Build a data catalog"], "use_cases": ["Churn prediction"],
+            "next_steps": ["Inventory data sources"], "priority": "High"}
+
+
+def test_generate_ai_analysis_runs_areas_concurrently(app_test, fake_openai, monkeypatch):
+    def respond(request):
+        if "area of Infrastructure" in request["messages"][0]["content"]:
+            return "status", 400, {}  # not retryable: this area gets the fallback analysis
+        return "json", completion(json.dumps(ANALYSIS))
+
+    fake_openai.respond = respond
+    fake_openai.delay = 0.3
+    monkeypatch.setenv("OPENAI_BASE_URL", fake_openai.base_url)
+    at = app_test(api_key=f"sk-test-{fake_openai.server_address[1]}")  # a fresh cached client per server
+    at.run()
+    at.button(key="save_data_readiness").click().run()
+    at.button(key="save_infrastructure").click().run()
+    next(button for button in at.button if "Generate AI Analysis" in button.label).click().run()
+
+    assert not at.exception
+    assert fake_openai.peak == 2
+    assert at.session_state["ai_analysis_Data Readiness"] == ANALYSIS
+    assert at.session_state["ai_analysis_Infrastructure"]["recommendations"][0].startswith("Focus on Infrastructure")
+    usage = at.session_state["ai_token_usage"]["Per-area (parallel)"]
+    assert usage == {"requests": 1, "input_tokens": 10, "output_tokens": 5}
+
+
+def test_generate_analysis_streams_one_area(app_test, fake_openai, monkeypatch):
+    text = json.dumps(ANALYSIS)
+    usage = {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+    chunks = ([completion_chunk(text[i:i + 16]) for i in range(0, len(text), 16)]
+              + [completion_chunk(finish_reason="stop"), {**completion_chunk(), "choices": [], "usage": usage}])
+    fake_openai.replies = [("stream", chunks, None)]
+    monkeypatch.setenv("OPENAI_BASE_URL", fake_openai.base_url)
+    at = app_test(api_key=f"sk-test-{fake_openai.server_address[1]}")
+    at.run()
+    at.button(key="save_data_readiness").click().run()
+    at.button(key="ai_generate_Data Readiness").click().run()
+
+    assert not at.exception
+    assert at.session_state["ai_analysis_Data Readiness"] == ANALYSIS
+    assert fake_openai.requests == 1
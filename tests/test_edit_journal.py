@@ -0,0 +1,49 @@
+import json
+
+from conftest import add_people
+from event_log import EventLog
+
+
+def test_edits_are_journaled_and_replayed_after_a_crash(app_test, tmp_path):
+    at = app_test(SNAPSHOT_DEBOUNCE_SECONDS=3600)
+    at.run()
+    add_people(at, "Ann")
+    name = at.session_state["snapshot_name"]
+    rid = at.session_state["people_registry"].ids()[0]
+    at.selectbox(key="people_selected").set_value(rid).run()
+    at.radio(key=f"people_{rid}_2").set_value(5).run()
+    at.text_area(key=f"people_notes_{rid}").input("needs training").run()
+    at.radio(key="data_readiness_4").set_value(1).run()
+
+    log = EventLog(str(tmp_path / "snapshots" / "events.sqlite3"))
+    assert [event["kind"] for event in log.events(name)] == ["rating", "notes", "widget"]
+    with open(tmp_path / "snapshots" / f"{name}.json") as f:
+        assert json.load(f)["widgets"].get("data_readiness_4") != 1  # only journaled so far
+
+    # A new session reopening the assessment replays the journal and compacts it
+    restarted = app_test(SNAPSHOT_DEBOUNCE_SECONDS=3600)
+    restarted.run()
+    restarted.selectbox(key="snapshot_to_load").set_value(name).run()
+    restarted.button(key="load_snapshot").click().run()
+    restarted.selectbox(key="people_selected").set_value(rid).run()
+    assert not at.exception and not restarted.exception
+    assert restarted.radio(key=f"people_{rid}_2").value == 5
+    assert restarted.text_area(key=f"people_notes_{rid}").value == "needs training"
+    assert restarted.radio(key="data_readiness_4").value == 1
+    assert log.events(name) == []
+
+
+def test_first_edit_snapshots_and_journal_is_compacted(app_test, tmp_path):
+    at = app_test(SNAPSHOT_DEBOUNCE_SECONDS=3600, SNAPSHOT_COMPACT_EVENTS=3)
+    at.run()
+    at.radio(key="data_readiness_4").set_value(1).run()
+    name = at.session_state["snapshot_name"]
+    log = EventLog(str(tmp_path / "snapshots" / "events.sqlite3"))
+    assert (tmp_path / "snapshots" / f"{name}.json").exists()
+    assert len(log.events(name)) == 1
+
+    at.radio(key="data_readiness_3").set_value(2).run()
+    at.radio(key="data_readiness_2").set_value(2).run()
+    assert log.events(name) == []
+    with open(tmp_path / "snapshots" / f"{name}.json") as f:
+        assert json.load(f)["widgets"]["data_readiness_2"] == 2
@@ -0,0 +1,44 @@
+from event_log import EventLog, apply_events
+from question_bank import LEADERSHIP_QUESTIONS
+
+
+def test_event_log_replay_after_compaction(tmp_path):
+    log = EventLog(str(tmp_path / "events.sqlite3"))
+    first = log.append("a", "rating", "data_readiness", 3, question_id="dr1")
+    log.append("b", "rating", "data_readiness", 1, question_id="dr1")
+    second = log.append("a", "notes", "people", "more training", question_id=None)
+    assert log.last_seq("a") == second
+
+    # A snapshot taken after the first event folds it in; only later events are replayed
+    log.compact("a", first)
+    events = log.events("a", after_seq=first)
+    assert [(event["seq"], event["kind"], event["value"]) for event in events] == [(second, "notes", "more training")]
+    assert log.events("a") == events
+    assert len(log.events("b")) == 1
+
+    log.compact("a", log.last_seq("a"))
+    assert log.events("a") == []
+    assert log.last_seq("a") == 0
+
+
+def test_apply_events_folds_edits_into_snapshot_data():
+    data = {
+        "widgets": {"people_drafts": {"p1": [5, 5, 5]}},
+        "people": [{"id": "p1", "type": "AI Use (End Users)", "scores": [1, 1, 1], "saved": True}],
+        "leadership": [{"id": "l1", "scores": [], "notes": "old"}]
+    }
+    events = [
+        {"kind": "widget", "target": "data_readiness_0", "value": 2},
+        {"kind": "rating", "target": "people:p1", "value": {"index": 1, "score": 2}},
+        {"kind": "rating", "target": "leadership:l1", "value": {"index": 0, "score": 4}},
+        {"kind": "notes", "target": "leadership:l1", "value": "new"},
+        {"kind": "notes", "target": "people:removed", "value": "ignored"}
+    ]
+    assert apply_events(data, events) is data
+    assert data["widgets"]["data_readiness_0"] == 2
+    assert data["widgets"]["people_drafts"]["p1"] == [5, 2, 5]
+    # A respondent without a draft starts from the default ratings
+    assert data["widgets"]["leadership_drafts"]["l1"] == [4] + [3] * (len(LEADERSHIP_QUESTIONS) - 1)
+    assert data["leadership"][0]["notes"] == "new"
+    # Saved ratings are untouched: edits only change drafts
+    assert data["people"][0]["scores"] == [1, 1, 1]
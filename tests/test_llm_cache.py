@@ -0,0 +1,35 @@
+import json
+import time
+
+from llm_cache import LLMCache
+
+
+def test_llm_cache_ttl(tmp_path, monkeypatch):
+    cache = LLMCache(str(tmp_path / "cache.sqlite3"), ttl_seconds=10)
+    key = LLMCache.make_key("prompt", "model", 0.3)
+    assert key != LLMCache.make_key("prompt", "model", 0.7)
+    cache.set(key, {"priority": "High"})
+    assert cache.get(key) == {"priority": "High"}
+
+    now = time.time()
+    monkeypatch.setattr("llm_cache.time.time", lambda: now + 11)
+    assert cache.get(key) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_llm_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("llm_cache.time.time", lambda: clock[0])
+    entry = {"text": "x" * 100}
+    size = len(json.dumps(entry))
+    cache = LLMCache(str(tmp_path / "cache.sqlite3"), max_bytes=2 * size)
+    for key in ("a", "b"):
+        clock[0] += 1
+        cache.set(key, entry)
+    clock[0] += 1
+    cache.get("a")  # "b" is now the least recently used
+    clock[0] += 1
+    cache.set("c", entry)
+    assert cache.get("b") is None
+    assert cache.get("a") == entry and cache.get("c") == entry
+    assert cache.stats() == {"entries": 2, "bytes": 2 * size}
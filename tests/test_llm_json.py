@@ -0,0 +1,95 @@
+import json
+
+from llm_json import (
+    StreamingJSONParser, analysis_response_format, load_analyses, load_analysis, parse_partial_json, repair_json
+)
+
+ANALYSIS = {"recommendations": ["a", "b"], "use_cases": ["u"], "next_steps": ["s1", "s2"], "priority": "High"}
+
+
+def test_repair_json_fixes_fences_prose_and_trailing_commas():
+    text = 'Here you go:\n```json\n{"recommendations": ["a", "b",], "priority": "High",}\n```'
+    assert repair_json(text) == {"recommendations": ["a", "b"], "priority": "High"}
+    assert repair_json("no json here") is None
+    assert repair_json("") is None
+
+
+def test_repair_json_drops_cut_off_string():
+    assert repair_json('{"recommendations": ["a", "b cut off') == {"recommendations": ["a"]}
+
+
+def test_truncated_analysis_does_not_validate():
+    text = json.dumps(ANALYSIS)
+    cut = text[:text.index('"priority"')]
+    assert load_analysis(cut) is None
+
+
+def test_missing_priority_is_not_defaulted():
+    analysis = {key: value for key, value in ANALYSIS.items() if key != "priority"}
+    assert load_analysis(json.dumps(analysis)) is None
+
+
+def test_load_analysis_normalizes():
+    analysis = {**ANALYSIS, "priority": " medium ", "use_cases": "single use case", "next_steps": ["s", "", None]}
+    assert load_analysis(json.dumps(analysis)) == {
+        "recommendations": ["a", "b"], "use_cases": ["single use case"], "next_steps": ["s"], "priority": "Medium"
+    }
+    assert load_analysis(json.dumps({**ANALYSIS, "priority": "urgent"})) is None
+    assert load_analysis(json.dumps({**ANALYSIS, "recommendations": []})) is None
+
+
+def test_load_analyses_keeps_valid_areas():
+    document = {"Data Readiness": ANALYSIS, "Infrastructure": {"recommendations": ["x"]}}
+    assert load_analyses(json.dumps(document), ["Data Readiness", "Infrastructure"]) == {"Data Readiness": ANALYSIS}
+
+
+def test_response_format_requires_every_area():
+    schema = analysis_response_format(["Data Readiness", "Infrastructure"])["json_schema"]["schema"]
+    assert schema["required"] == ["Data Readiness", "Infrastructure"]
+
+
+def test_streaming_parser_matches_final_document_for_any_chunking():
+    text = 'Sure ```json\n' + json.dumps({**ANALYSIS, "recommendations": ['quote " and \\u00e9 escape', "b"]})
+    for size in (1, 3, 7, len(text)):
+        parser = StreamingJSONParser()
+        for start in range(0, len(text), size):
+            partial = parser.feed(text[start:start + size])
+            assert partial is None or isinstance(partial, dict)
+        assert parser.value() == json.loads(text[text.index("{"):])
+        assert parser.text == text
+
+
+def test_streaming_parser_shows_partial_strings():
+    parser = StreamingJSONParser()
+    assert parser.feed('{"recommendations": ["Build a da') == {"recommendations": ["Build a da"]}
+    assert parser.value(partial_strings=False) == {"recommendations": []}
+    # A half-received key is not shown
+    assert parser.feed('ta team"], "use_') == {"recommendations": ["Build a data team"]}
+
+
+def test_streaming_parser_caches_agree_with_a_fresh_parse():
+    text = json.dumps({"a": [{"b": 'x " \u00e9 y'}, "c"], "d": {"e": ["f", 1, None]}})
+    parser = StreamingJSONParser()
+    for end in range(1, len(text) + 1):
+        assert parser.feed(text[end - 1]) == parse_partial_json(text[:end]), text[:end]
+
+
+def test_streaming_parser_does_not_reparse_while_a_string_streams(monkeypatch):
+    import llm_json
+
+    parsed = []
+    real_loads = json.loads
+    monkeypatch.setattr(llm_json.json, "loads", lambda text: parsed.append(text) or real_loads(text))
+    parser = StreamingJSONParser()
+    parser.feed('{"recommendations": ["')
+    for _ in range(500):
+        assert parser.feed("word ")["recommendations"][0].endswith("word ")
+    # The document is parsed once when the string starts; each chunk decodes only the string itself
+    assert [text for text in parsed if not text.startswith('"')] == ['{"recommendations": [""]}']
+    assert parser.feed('"]}') == {"recommendations": ["word " * 500]}
+
+
+def test_parse_partial_json_handles_partial_escapes():
+    assert parse_partial_json('{"a": "x\\') == {"a": "x"}
+    assert parse_partial_json('{"a": "x\\u00') == {"a": "x"}
+    assert parse_partial_json("[1, 2, ") == [1, 2]
@@ -0,0 +1,160 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+from conftest import completion, completion_chunk
+from llm_scheduler import RequestScheduler, TokenBucket, is_retryable, retry_after_seconds
+
+REQUEST = httpx.Request("POST", "http://test/v1/chat/completions")
+
+
+def status_error(cls, status: int, headers=None):
+    return cls("scripted", response=httpx.Response(status, headers=headers or {}, request=REQUEST), body=None)
+
+
+def scheduler(**kwargs) -> RequestScheduler:
+    options = dict(requests_per_minute=6000, tokens_per_minute=10 ** 6, max_concurrency=2,
+                   max_retries=3, base_delay=0.01, max_delay=0.05, max_queue_wait=5)
+    return RequestScheduler(**{**options, **kwargs})
+
+
+def test_retry_after_headers():
+    assert retry_after_seconds(status_error(openai.RateLimitError, 429, {"retry-after": "3"})) == 3.0
+    assert retry_after_seconds(status_error(openai.RateLimitError, 429, {"retry-after-ms": "250"})) == 0.25
+    date = time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(time.time() + 30))
+    assert 25 < retry_after_seconds(status_error(openai.RateLimitError, 429, {"retry-after": date})) <= 30
+    assert retry_after_seconds(status_error(openai.RateLimitError, 429, {"retry-after": "soon"})) is None
+    assert retry_after_seconds(ValueError("no response")) is None
+
+
+def test_is_retryable():
+    assert is_retryable(status_error(openai.RateLimitError, 429))
+    assert is_retryable(status_error(openai.InternalServerError, 503))
+    assert is_retryable(httpx.RemoteProtocolError("peer closed connection"))
+    assert not is_retryable(status_error(openai.BadRequestError, 400))
+    quota = status_error(openai.RateLimitError, 429)
+    quota.code = "insufficient_quota"
+    assert not is_retryable(quota)
+
+
+def test_backoff_honors_retry_after_and_caps_delay():
+    s = scheduler(base_delay=1.0, max_delay=10.0)
+    assert 2.0 <= s._backoff(0, 2.0) <= 3.0
+    assert 10.0 <= s._backoff(0, 120.0) <= 11.0
+    for attempt in range(10):
+        assert 0 <= s._backoff(attempt, None) <= min(10.0, 2 ** attempt)
+
+
+def test_call_retries_retryable_errors_only():
+    s = scheduler()
+    failures = [status_error(openai.RateLimitError, 429, {"retry-after-ms": "10"})]
+
+    def flaky():
+        if failures:
+            raise failures.pop()
+        return "done"
+
+    assert s.call(flaky) == "done"
+
+    def bad_request():
+        raise status_error(openai.BadRequestError, 400)
+
+    with pytest.raises(openai.BadRequestError):
+        s.call(bad_request)
+
+
+def test_call_gives_up_after_max_retries():
+    s = scheduler(max_retries=2)
+    calls = []
+
+    def always_failing():
+        calls.append(1)
+        raise status_error(openai.InternalServerError, 500)
+
+    with pytest.raises(openai.InternalServerError):
+        s.call(always_failing)
+    assert len(calls) == 3
+
+
+def test_concurrency_cap_covers_stream_consumption():
+    s = scheduler(max_concurrency=1)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def consume(response):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return response, None
+
+    threads = [threading.Thread(target=s.call, args=(lambda: "stream",), kwargs={"consume": consume}) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak[0] == 1
+
+
+def test_token_bucket_waits_and_refunds():
+    bucket = TokenBucket(per_minute=60)  # one unit per second
+    assert bucket.acquire(60, timeout=0)
+    assert not bucket.acquire(1, timeout=0.01)
+    bucket.refund(5)
+    assert bucket.acquire(5, timeout=0)
+
+
+def test_timed_out_acquire_refunds_what_it_took():
+    s = scheduler(requests_per_minute=2, tokens_per_minute=60, max_concurrency=1, max_queue_wait=0.01)
+    assert s.tokens.acquire(60, timeout=0)
+    with pytest.raises(TimeoutError):
+        s.call(lambda: "never", estimated_tokens=10)
+    s.tokens.refund(60)
+
+    assert s._slots.acquire(timeout=0)  # every slot is busy
+    with pytest.raises(TimeoutError):
+        s.call(lambda: "never", estimated_tokens=10)
+    assert s.requests.acquire(2, timeout=0)
+    assert s.tokens.acquire(60, timeout=0)
+
+
+def test_reported_usage_refunds_the_unused_estimate():
+    s = scheduler(tokens_per_minute=1000)
+    response = SimpleNamespace(usage=SimpleNamespace(total_tokens=100))
+    assert s.call(lambda: response, estimated_tokens=900) is response
+    assert s.tokens.acquire(900, timeout=0)
+    s.tokens.refund(1000)
+
+    # A stream has no usage attribute; consume reports the usage of its last chunk
+    def consume(stream):
+        return "text", SimpleNamespace(total_tokens=100)
+
+    assert s.call(lambda: iter(()), estimated_tokens=900, consume=consume) == "text"
+    assert s.tokens.acquire(900, timeout=0)
+
+
+def test_stream_broken_mid_way_is_retried(fake_openai):
+    chunks = [completion_chunk('{"a": '), completion_chunk('1}'), completion_chunk(finish_reason="stop")]
+    fake_openai.replies = [("stream", chunks, 1), ("stream", chunks, None)]
+    client = openai.OpenAI(base_url=fake_openai.base_url, api_key="test", max_retries=0)
+
+    def read(stream):
+        return "".join(chunk.choices[0].delta.content or "" for chunk in stream if chunk.choices), None
+
+    text = scheduler().call(client.chat.completions.create, model="fake", messages=[], stream=True, consume=read)
+    assert text == '{"a": 1}'
+    assert fake_openai.requests == 2
+
+
+def test_rate_limited_request_is_retried(fake_openai):
+    fake_openai.replies = [("status", 429, {"retry-after-ms": "10"}), ("json", completion("ok"))]
+    client = openai.OpenAI(base_url=fake_openai.base_url, api_key="test", max_retries=0)
+    response = scheduler().call(client.chat.completions.create, model="fake", messages=[], estimated_tokens=100)
+    assert response.choices[0].message.content == "ok"
+    assert fake_openai.requests == 2
@@ -0,0 +1,75 @@
+import pytest
+
+from question_bank import basic_recommendations
+from report import ReportCache, render_html, render_markdown, render_report, report_content
+
+ONBOARDING = {"Company Name": "Acme <Labs>", "Sector": "Retail", "Email": "a@acme.test", "Phone": "1"}
+SCORES = [{"Area": "Data Readiness", "Avg Score": 2.0}, {"Area": "Infrastructure", "Avg Score": 4.0}]
+ANALYSIS = {"recommendations": ["Use <b>tags</b>"], "use_cases": ["Churn"], "next_steps": ["Start", "Ship"],
+            "priority": "High"}
+
+
+def content(timestamp: str = "2026-01-01 10:00", comments: str = "") -> dict:
+    return report_content(ONBOARDING, SCORES, comments, {"Infrastructure": ANALYSIS}, timestamp)
+
+
+def test_report_content_sorts_areas_and_falls_back_to_basic_recommendations():
+    data = content()
+    assert [row["Area"] for row in data["scores"]] == ["Infrastructure", "Data Readiness"]
+    assert data["overall"] == 3.0
+    assert data["areas"][0]["priority"] == "High" and data["areas"][0]["next_steps"] == ["Start", "Ship"]
+    assert data["areas"][1] == {"area": "Data Readiness", "score": 2.0,
+                                "basic_recommendations": basic_recommendations("Data Readiness", 2.0)}
+    assert report_content({}, [], "", {}, "now")["company"] == "(unspecified)"
+
+
+def test_render_markdown():
+    text = render_markdown(content())
+    assert "**Company:** Acme <Labs>" in text
+    assert "**Overall:** 3.00/5.00" in text
+    assert "1. Start\n2. Ship" in text
+    assert "_No comments provided._" in text
+
+
+def test_render_html_escapes_and_inlines_the_chart():
+    page = render_html(content(comments="Fine & <dandy>"))
+    assert "Acme &lt;Labs&gt;" in page and "Acme <Labs>" not in page
+    assert "<li>Use &lt;b&gt;tags&lt;/b&gt;</li>" in page
+    assert "Fine &amp; &lt;dandy&gt;" in page
+    # Without kaleido the radar chart is inline SVG; nothing is loaded from elsewhere
+    assert "<svg" in page and "http://" not in page.replace("http://www.w3.org/2000/svg", "")
+
+
+def test_render_report_formats():
+    assert render_report(content(), "Markdown").startswith("# IB Analytics".encode())
+    assert render_report(content(), "HTML").startswith(b"<!DOCTYPE html>")
+    with pytest.raises(ValueError, match="Unknown report format"):
+        render_report(content(), "DOCX")
+
+
+def test_pdf_without_weasyprint_is_a_value_error():
+    try:
+        import weasyprint  # noqa: F401
+    except ImportError:
+        with pytest.raises(ValueError, match="weasyprint"):
+            render_report(content(), "PDF")
+    else:
+        assert render_report(content(), "PDF").startswith(b"%PDF")
+
+
+def test_report_cache_ignores_timestamp_and_evicts_least_recently_used(monkeypatch):
+    rendered = []
+    monkeypatch.setattr("report.render_report", lambda data, fmt: rendered.append(fmt) or fmt.encode())
+    cache = ReportCache(max_entries=2)
+    assert cache.get(content(), "HTML") is None
+    assert cache.render(content(), "HTML") == b"HTML"
+    assert cache.render(content(timestamp="2026-02-02 09:00"), "HTML") == b"HTML"
+    assert cache.get(content(timestamp="later"), "HTML") == b"HTML"
+    assert rendered == ["HTML"]
+
+    cache.render(content(), "Markdown")
+    cache.render(content(), "HTML")  # now the most recently used
+    cache.render(content(comments="changed"), "HTML")
+    assert cache.get(content(), "Markdown") is None
+    assert cache.get(content(), "HTML") == b"HTML"
+    assert rendered == ["HTML", "Markdown", "HTML"]
@@ -0,0 +1,23 @@
+from conftest import add_people
+
+
+def test_removing_a_respondent_keeps_the_others_edits(app_test):
+    at = app_test()
+    at.run()
+    add_people(at, "Ann", "Bob", "Cy")
+    ann, bob, cy = at.session_state["people_registry"]
+    for survey, rating in ((ann, 2), (cy, 5)):
+        at.selectbox(key="people_selected").set_value(survey["id"]).run()
+        at.radio(key=f"people_{survey['id']}_0").set_value(rating).run()
+
+    at.selectbox(key="people_selected").set_value(ann["id"]).run()
+    at.button(key=f"remove_people_{ann['id']}").click().run()
+    assert not at.exception
+    assert at.session_state["people_registry"].ids() == [bob["id"], cy["id"]]
+    # The removed respondent's widget state and draft are pruned...
+    assert ann["id"] not in at.session_state["people_drafts"]
+    assert not [key for key in at.session_state.filtered_state if ann["id"] in key]
+    # ...and the unsaved rating of another respondent is untouched
+    at.selectbox(key="people_selected").set_value(cy["id"]).run()
+    assert at.radio(key=f"people_{cy['id']}_0").value == 5
+    assert at.session_state["people_drafts"][cy["id"]][0] == 5
@@ -0,0 +1,41 @@
+from conftest import add_people
+from respondents import RespondentRegistry
+
+
+def test_registry_stores_each_respondent_once():
+    registry = RespondentRegistry.from_list([{"name": "Ann", "scores": [3], "saved": True}, {"name": "Bob", "scores": []}])
+    assert len(registry) == 2
+    ann, bob = registry
+    assert ann["id"] != bob["id"]
+
+    registry.add({**ann, "scores": [5]})  # same ID: replaces instead of adding a second copy
+    assert len(registry) == 2
+    assert registry.get(ann["id"])["scores"] == [5]
+    assert registry.saved() == [registry.get(ann["id"])]
+
+
+def test_remove_keeps_other_respondents_and_order():
+    registry = RespondentRegistry()
+    ids = [registry.add({"name": name}) for name in "abc"]
+    assert registry.remove(ids[1])["name"] == "b"
+    assert registry.remove(ids[1]) is None
+    assert registry.ids() == [ids[0], ids[2]]
+    assert [survey["name"] for survey in registry.to_list()] == ["a", "c"]
+    registry.clear()
+    assert not registry and ids[0] not in registry
+
+
+def test_save_all_skips_respondents_never_rated(app_test):
+    at = app_test()
+    at.run()
+    add_people(at, "Ann", "Bob")
+    ann, bob = at.session_state["people_registry"]
+    at.selectbox(key="people_selected").set_value(ann["id"]).run()
+    at.radio(key=f"people_{ann['id']}_0").set_value(5).run()
+    at.button(key="save_all_people").click().run()
+
+    assert not at.exception
+    registry = at.session_state["people_registry"]
+    assert registry.get(ann["id"])["saved"] and registry.get(ann["id"])["scores"][0] == 5
+    assert not registry.get(bob["id"]).get("saved")
+    assert at.session_state["respondent_aggregator"].stats("People - AI Users").count == 6
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from response_matrix import ResponseMatrix
+
+QUESTIONS = ("q1", "q2", "q3")
+
+
+def test_swap_remove_keeps_rows_addressable():
+    matrix = ResponseMatrix(QUESTIONS, capacity=2)
+    for i, respondent in enumerate("abcd"):
+        matrix.upsert(respondent, [i + 1] * 3, name=respondent.upper())
+    assert len(matrix) == 4  # grew past the initial capacity
+
+    matrix.remove("b")  # "d" moves into b's slot
+    assert len(matrix) == 3 and "b" not in matrix
+    assert list(matrix.respondent_ids) == ["a", "d", "c"]
+    assert matrix.scores.tolist() == [[1, 1, 1], [4, 4, 4], [3, 3, 3]]
+    assert list(matrix.names) == ["A", "D", "C"]
+
+    matrix.upsert("d", [5, 5, 5])  # overwrite the moved row in place
+    assert matrix.scores[1].tolist() == [5, 5, 5]
+    matrix.remove("c")  # the last row
+    matrix.remove("missing")
+    assert list(matrix.respondent_ids) == ["a", "d"]
+
+
+def test_upsert_checks_rating_count():
+    with pytest.raises(ValueError):
+        ResponseMatrix(QUESTIONS).upsert("a", [1, 2])
+
+
+def test_statistics():
+    matrix = ResponseMatrix.from_surveys(QUESTIONS, [
+        {"id": "a", "scores": [1, 3, 5]}, {"id": "b", "scores": [5, 3, 5]}, {"id": "c", "scores": []}
+    ])
+    assert len(matrix) == 2
+    np.testing.assert_allclose(matrix.question_means(), [3, 3, 5])
+    np.testing.assert_allclose(matrix.question_stds(), [2, 0, 0])
+    agreement = matrix.agreement()
+    assert agreement[1] == agreement[2] == 1.0
+    assert agreement[0] == 0.0  # variance 8 is beyond the uniform null of 2
+    summary = matrix.question_summary(["A", "B", "C"])
+    assert list(summary["Question"]) == ["A", "B", "C"]
+    assert list(summary["N"]) == [2, 2, 2]
+
+
+def test_empty_matrix_statistics():
+    matrix = ResponseMatrix(QUESTIONS)
+    assert matrix.question_means().tolist() == [0, 0, 0]
+    assert matrix.agreement().tolist() == [0, 0, 0]
+    assert matrix.question_percentiles().shape == (3, 3)
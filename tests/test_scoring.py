@@ -0,0 +1,63 @@
+import pytest
+
+from scoring import AREAS, ScoreAggregator
+
+
+def test_add_remove_replace_match_a_rebuild():
+    aggregator = ScoreAggregator()
+    aggregator.add("Data Readiness", [1, 2, 3])
+    aggregator.add("People - AI Users", [4, 4])
+    aggregator.add("People - AI Users", [2, 5])
+    aggregator.remove("People - AI Users", [4, 4])
+    aggregator.replace("Data Readiness", [5, 5])
+
+    expected = ScoreAggregator()
+    expected.add("Data Readiness", [5, 5])
+    expected.add("People - AI Users", [2, 5])
+    assert aggregator.snapshot() == expected.snapshot()
+    assert aggregator.stats("People - AI Users").mean == 3.5
+    assert aggregator.stats("People - AI Users").std == pytest.approx(1.5)
+
+
+def test_overall_averages_assessed_areas_only():
+    aggregator = ScoreAggregator()
+    assert aggregator.overall() == 0.0
+    assert aggregator.snapshot() == []
+    aggregator.add("Data Readiness", [2, 2])
+    aggregator.add("Leadership & Strategy", [4])
+    assert aggregator.overall() == 3.0
+    assert [row["Area"] for row in aggregator.snapshot()] == ["Data Readiness", "Leadership & Strategy"]
+
+
+def test_clear():
+    aggregator = ScoreAggregator()
+    aggregator.add("Infrastructure", [3])
+    aggregator.clear("Infrastructure")
+    assert aggregator.stats("Infrastructure").count == 0
+
+
+def test_from_assessment():
+    people = [{"type": "AI Use (End Users)", "scores": [5, 5]}, {"type": "AI Build (Builders)", "scores": [1]},
+              {"type": "AI Use (End Users)", "scores": []}]
+    aggregator = ScoreAggregator.from_assessment(
+        [{"score": 3}], [{"score": 4}, {"score": 2}], people, [{"scores": [2, 4]}]
+    )
+    assert {row["Area"]: (row["Avg Score"], row["Count"]) for row in aggregator.snapshot()} == {
+        "Data Readiness": (3.0, 1), "Infrastructure": (3.0, 2), "People - AI Users": (5.0, 2),
+        "People - AI Builders": (1.0, 1), "Leadership & Strategy": (3.0, 2)
+    }
+
+
+def test_combined_sums_without_touching_inputs():
+    sections, respondents = ScoreAggregator(), ScoreAggregator()
+    sections.add("Data Readiness", [2, 4])
+    respondents.add("Data Readiness", [3])
+    respondents.add("Leadership & Strategy", [5])
+    combined = ScoreAggregator.combined(sections, respondents)
+    assert combined.stats("Data Readiness").count == 3
+    assert combined.stats("Data Readiness").mean == 3.0
+    assert combined.stats("Leadership & Strategy").mean == 5.0
+    assert sections.stats("Data Readiness").count == 2
+    assert [row["Area"] for row in combined.snapshot()] == [
+        area for area in AREAS if area in ("Data Readiness", "Leadership & Strategy")
+    ]
@@ -0,0 +1,108 @@
+import gc
+import json
+
+import pytest
+
+from conftest import add_people
+from respondents import RespondentRegistry
+from scoring import ScoreAggregator
+from shared_store import SharedAssessment, SharedAssessmentStore, VersionConflict
+
+
+def new_assessment() -> SharedAssessment:
+    return SharedAssessment(RespondentRegistry(), RespondentRegistry(), ScoreAggregator(), {})
+
+
+def test_store_shares_under_random_codes_and_closes():
+    store = SharedAssessmentStore()
+    first, second = store.share(new_assessment()), store.share(new_assessment())
+    assert first.code != second.code and len(first.code) >= 16
+    assert store.get(first.code) is first
+    store.close(first)
+    assert first.closed and store.get(first.code) is None
+    code = second.code
+    del second
+    gc.collect()
+    assert store.get(code) is None  # nobody holds it any more
+
+
+def test_check_version_and_change_counter():
+    survey = {"name": "Ann", "version": 2}
+    SharedAssessment.check_version(survey, 2)
+    with pytest.raises(VersionConflict, match="Ann"):
+        SharedAssessment.check_version(survey, 1)
+
+    assessment = new_assessment()
+    assert not assessment.unsaved
+    with assessment.lock:
+        assessment.changed()
+    assert assessment.unsaved
+    assessment.saved_version = assessment.version
+    assert not assessment.unsaved
+
+
+def share(app_test):
+    """An owner session with one respondent that shared its assessment, and a session that joined it"""
+    owner = app_test(SNAPSHOT_DEBOUNCE_SECONDS=3600)
+    owner.run()
+    owner.radio(key="data_readiness_0").set_value(5).run()
+    owner.button(key="save_data_readiness").click().run()
+    add_people(owner, "Ann")
+    owner.button(key="share_assessment").click().run()
+    guest = app_test(SNAPSHOT_DEBOUNCE_SECONDS=3600)
+    guest.run()
+    guest.text_input(key="join_code").input(owner.session_state["shared_assessment"].code).run()
+    guest.button(key="join_assessment").click().run()
+    return owner, guest
+
+
+def saved_snapshot(tmp_path, owner):
+    with open(tmp_path / "snapshots" / f"{owner.session_state['snapshot_name']}.json") as f:
+        return json.load(f)
+
+
+def test_guest_changes_are_saved_while_the_owner_is_idle(app_test, tmp_path):
+    owner, guest = share(app_test)
+    rid = guest.session_state["people_registry"].ids()[0]
+    guest.selectbox(key="people_selected").set_value(rid).run()
+    guest.radio(key=f"people_{rid}_0").set_value(1).run()
+    guest.button(key=f"save_people_{rid}").click().run()
+    add_people(guest, "Bob")
+    # The guest's own section answers are neither shared nor saved
+    guest.radio(key="data_readiness_0").set_value(1).run()
+    guest.button(key="save_data_readiness").click().run()
+
+    assert not owner.exception and not guest.exception
+    data = saved_snapshot(tmp_path, owner)  # the owner has not rerun since sharing
+    assert [survey["name"] for survey in data["people"]] == ["Ann", "Bob"]
+    assert data["people"][0]["scores"][0] == 1 and data["ai_users_count"] == 6
+    assert data["data_readiness"][0]["score"] == 5
+    assert not guest.session_state["shared_assessment"].unsaved
+
+
+def test_notes_from_a_stale_session_do_not_overwrite_newer_notes(app_test, tmp_path):
+    owner, guest = share(app_test)
+    rid = owner.session_state["people_registry"].ids()[0]
+    for session in (owner, guest):
+        session.selectbox(key="people_selected").set_value(rid).run()
+    guest.text_area(key=f"people_notes_{rid}").input("from the guest").run()
+    owner.run()  # still shows the notes it loaded before the guest's edit
+    owner.radio(key=f"people_{rid}_1").set_value(4).run()
+
+    survey = owner.session_state["people_registry"].get(rid)
+    assert survey["notes"] == "from the guest"
+    assert saved_snapshot(tmp_path, owner)["people"][0]["notes"] == "from the guest"
+    # The notes edit counts as a change: the owner's ratings, read before it, conflict
+    owner.button(key=f"save_people_{rid}").click().run()
+    assert not survey.get("saved")
+    assert "saved in another session" in owner.toast[0].value
+
+
+def test_stop_sharing_detaches_guests_onto_a_private_copy(app_test, tmp_path):
+    owner, guest = share(app_test)
+    owner.button(key="leave_shared").click().run()
+    guest.run()
+    assert "shared_assessment" not in guest.session_state
+    assert guest.session_state["people_registry"].ids() == owner.session_state["people_registry"].ids()
+    assert guest.session_state["people_registry"] is not owner.session_state["people_registry"]
+    assert guest.session_state["snapshot_name"] != owner.session_state["snapshot_name"]
@@ -0,0 +1,35 @@
+import json
+import os
+
+import pytest
+
+from snapshot_store import SNAPSHOT_SCHEMA_VERSION, SnapshotStore, content_digest, migrate_snapshot
+
+
+def test_snapshot_save_skips_unchanged_and_debounces(tmp_path):
+    store = SnapshotStore(str(tmp_path), debounce_seconds=60)
+    data = {"onboarding": {"Company Name": "Acme"}, "timestamp": "t1"}
+    assert store.save("a", data) is not None
+    assert store.save("a", {**data, "timestamp": "t2"}, force=True) is None  # same content
+    changed = {**data, "onboarding": {"Company Name": "Acme Ltd"}}
+    assert store.save("a", changed) is None  # debounced
+    assert store.save("a", changed, force=True) is not None
+    assert store.load("a")["onboarding"] == {"Company Name": "Acme Ltd"}
+    assert store.load("a")["schema_version"] == SNAPSHOT_SCHEMA_VERSION
+    assert [name for name in os.listdir(tmp_path) if name.endswith(".tmp")] == []
+
+
+def test_snapshot_list_and_migration(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    with open(tmp_path / "old.json", "w") as f:
+        json.dump({"onboarding": {}}, f)  # version 1: no schema_version or widgets
+    store.save("new", {"onboarding": {}})
+    assert set(store.list()) == {"old", "new"}
+    assert store.load("old")["widgets"] == {}
+    with pytest.raises(ValueError):
+        migrate_snapshot({"schema_version": SNAPSHOT_SCHEMA_VERSION + 1})
+
+
+def test_content_digest_ignores_bookkeeping():
+    assert content_digest({"a": 1, "timestamp": "x", "event_seq": 3}) == content_digest({"a": 1, "timestamp": "y"})
+    assert content_digest({"a": 1}) != content_digest({"a": 2})
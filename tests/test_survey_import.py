@@ -0,0 +1,43 @@
+import pytest
+
+from survey_import import LEADERSHIP_GROUP, read_responses, to_surveys, validate_responses
+
+CSV = b"""name,role,type,q1,q2,q3,q4,q5,q6,notes
+Ann,Analyst,AI Use,1,2,3,4,5,5,  uses copilots
+Bob,Engineer,builder,5,5,5,5,5,5,
+Cy,CTO,Leadership,3,3,3,3,3,3,
+,Analyst,AI Use,1,1,1,1,1,1,
+Dee,Analyst,manager,1,1,1,1,1,1,
+Eve,Analyst,AI Use,0,2.5,x,1,1,
+"""
+
+
+def test_validate_splits_valid_rows_and_reports_errors():
+    valid, errors = validate_responses(read_responses(CSV, "responses.csv"))
+    assert list(valid["name"]) == ["Ann", "Bob", "Cy"]
+    assert list(valid["group"]) == ["AI Use (End Users)", "AI Build (Builders)", LEADERSHIP_GROUP]
+    assert valid.iloc[0]["notes"] == "uses copilots"
+    report = dict(zip(errors["Row"], errors["Error"]))
+    assert sorted(report) == [5, 6, 7]
+    assert report[5] == "name is empty"
+    assert report[6] == "type must be AI Use, AI Build or Leadership"
+    assert report[7] == "; ".join(f"q{i} must be a whole number from 1 to 5" for i in (1, 2, 3, 6))
+
+
+def test_missing_columns_are_rejected():
+    with pytest.raises(ValueError, match="q6"):
+        validate_responses(read_responses(b"name,role,type,q1\nAnn,Analyst,AI Use,1\n", "responses.csv"))
+
+
+def test_unsupported_file_type():
+    with pytest.raises(ValueError, match="Unsupported file type"):
+        read_responses(b"", "responses.txt")
+
+
+def test_to_surveys_groups_saved_surveys():
+    valid, _ = validate_responses(read_responses(CSV, "responses.csv"))
+    surveys = to_surveys(valid)
+    assert surveys["AI Use (End Users)"][0]["scores"] == [1, 2, 3, 4, 5, 5]
+    assert surveys["AI Use (End Users)"][0]["type"] == "AI Use (End Users)"
+    assert "type" not in surveys[LEADERSHIP_GROUP][0]
+    assert all(survey["saved"] and survey["id"] for group in surveys.values() for survey in group)